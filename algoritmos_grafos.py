@@ -2,6 +2,7 @@
 Implementación de algoritmos de grafos para Investigación Operativa
 - Kruskal (Árbol Mínimo)
 - Prim (Árbol Mínimo)
+- Borůvka (Árbol Mínimo, vectorizado)
 - Dijkstra (Rutas más cortas desde origen)
 - Floyd-Warshall (Rutas más cortas entre todos los pares)
 - Ford-Fulkerson (Flujo máximo)
@@ -9,8 +10,785 @@ Implementación de algoritmos de grafos para Investigación Operativa
 import networkx as nx
 import matplotlib.pyplot as plt
 import numpy as np
-from collections import defaultdict, deque
+from array import array
+from collections import OrderedDict, defaultdict, deque, namedtuple
+from collections.abc import Sequence, Set
+import bisect
+import hashlib
 import heapq
+import itertools
+import json
+import os
+import re
+import tempfile
+from multiprocessing import Pool, shared_memory
+from scipy.spatial import Delaunay, QhullError
+
+# Cantidad de nodos a partir de la cual floyd_warshall(motor='auto') usa el
+# motor NumPy. Por debajo se mantiene el motor Python con su salida académica.
+UMBRAL_FLOYD_NUMPY = 30
+
+# A partir de esta cantidad de nodos 'auto' usa el motor por bloques
+# (solo si hay más de un núcleo disponible)
+UMBRAL_FLOYD_BLOQUES = 2000
+TAM_BLOQUE_FLOYD = 256
+
+# Con motor='auto', los grafos con densidad de arcos m / (n·(n-1)) menor a
+# este valor usan Johnson (n ejecuciones de Dijkstra) en lugar de Floyd-Warshall
+UMBRAL_DENSIDAD_JOHNSON = 0.01
+
+# Con pesos enteros no negativos de hasta este valor, Dijkstra usa los cubos de
+# Dial en lugar de heapq. Con pesos mayores el radix heap (implementado en
+# Python) resulta más lento que heapq, que está en C, así que se mantiene heapq.
+MAX_PESO_DIAL = 1000
+
+# Tope de nodos asentados, sumando todas las búsquedas de desvío, de una
+# consulta de k rutas (Yen). Al alcanzarlo se devuelven las rutas ya halladas.
+PRESUPUESTO_K_RUTAS = 2000000
+
+# Con más nodos que esto, el resumen de Floyd-Warshall no imprime la matriz de
+# distancias final ni el listado de caminos (n² líneas), y los motores que no
+# registran iteraciones ('bloques', 'johnson') no arman la traza inicial
+MAX_NODOS_RESUMEN_FLOYD = 50
+
+# Cantidad de árboles de caminos más cortos que conserva CACHE_RUTAS
+TAM_CACHE_RUTAS = 32
+
+# Aristas por corrida ordenada en disco de kruskal_externo (24 bytes cada una;
+# mientras se ordena, la corrida ocupa unas tres veces eso en memoria)
+ARISTAS_POR_CORRIDA = 1000000
+
+# Eventos de paso que emiten los generadores pasos_kruskal, pasos_prim y
+# pasos_dijkstra. Cada evento lleva solo lo que cambió en ese paso; el estado
+# completo (MST parcial, visitados, distancias) lo acumula quien los consume.
+PasoKruskal = namedtuple('PasoKruskal', 'num arista aceptada raiz_u raiz_v peso_acumulado n_aristas_mst')
+PasoPrim = namedtuple('PasoPrim', 'num tipo nodo arista nuevas_aristas peso_total')
+PasoDijkstra = namedtuple('PasoDijkstra', 'num nodo_actual dist_actual actualizaciones')
+ActualizacionDijkstra = namedtuple('ActualizacionDijkstra', 'vecino dist_anterior dist_nueva peso_arista')
+
+# Evento por ronda de boruvka_vectorizado: índices (en u, v, w) de las aristas
+# agregadas en la ronda y componentes que quedan después de contraerlas
+RondaBoruvka = namedtuple('RondaBoruvka', 'num aristas componentes')
+
+# Vistas de memoria compartida del motor Floyd-Warshall por bloques.
+# Cada proceso trabajador las completa una vez al iniciar.
+_fw_compartido = {}
+
+
+def _fw_adjuntar_memoria(nombre_d, nombre_p, n):
+    """Inicializador del pool: adjunta D y P desde la memoria compartida"""
+    shm_d = shared_memory.SharedMemory(name=nombre_d)
+    shm_p = shared_memory.SharedMemory(name=nombre_p)
+    _fw_compartido['shm'] = (shm_d, shm_p)  # Mantener vivas las referencias
+    _fw_compartido['D'] = np.ndarray((n, n), dtype=np.float64, buffer=shm_d.buf)
+    _fw_compartido['P'] = np.ndarray((n, n), dtype=np.int32, buffer=shm_p.buf)
+
+
+def _fw_procesar_bloque(i0, i1, j0, j1, k0, k1):
+    """Tarea del pool: relaja el bloque (filas i0:i1, columnas j0:j1) con los k de k0:k1"""
+    _fw_relajar_bloque(_fw_compartido['D'], _fw_compartido['P'], (i0, i1), (j0, j1), (k0, k1))
+
+
+def _fw_relajar_bloque(D, P, filas, columnas, ks):
+    """Aplica los pasos k de un bloque de Floyd-Warshall sobre una sub-matriz de D y P"""
+    filas, columnas = slice(*filas), slice(*columnas)
+    bloque_d = D[filas, columnas]
+    bloque_p = P[filas, columnas]
+    for k in range(*ks):
+        via_k = np.add.outer(D[filas, k], D[k, columnas])
+        mejora = via_k < bloque_d
+        np.copyto(bloque_d, via_k, where=mejora)
+        np.copyto(bloque_p, P[k, columnas], where=mejora)
+
+
+def _fw_minplus(D, P, al_paso=None):
+    """
+    Floyd-Warshall min-plus sobre D y P completas, en el lugar
+
+    Cada paso k es una sola operación vectorizada: D = min(D, D[:, k] + D[k, :]).
+    al_paso: si no es None, se llama en cada paso con (filas, columnas,
+             distancias anteriores, nuevas, predecesores nuevos) de las celdas
+             que mejoraron, como TrazaFloydWarshall.registrar
+    """
+    for k in range(D.shape[0]):
+        via_k = np.add.outer(D[:, k], D[k, :])
+        mejora = via_k < D
+        if al_paso is None:
+            np.copyto(D, via_k, where=mejora)
+            np.copyto(P, P[k], where=mejora)
+            continue
+
+        # Con traza ya se tienen los índices de las celdas: se actualizan solo esas
+        filas, columnas = np.nonzero(mejora)
+        anteriores = D[filas, columnas]
+        nuevas = via_k[filas, columnas]
+        predecesores = P[k, columnas]
+        D[filas, columnas] = nuevas
+        P[filas, columnas] = predecesores
+        al_paso(filas, columnas, anteriores, nuevas, predecesores)
+
+
+# Grafo CSR de cada proceso trabajador de Dijkstra (Johnson, multiorigen).
+# Se envía una sola vez por proceso, en el inicializador del pool.
+_csr_compartido = {}
+
+
+def _csr_inicializar(indptr, indices, pesos, pesos_reales, peso_maximo=None):
+    """
+    Inicializador del pool: guarda el grafo CSR como listas de Python
+
+    peso_maximo: si no es None, los pesos son enteros no negativos y se usan
+                 los cubos de Dial (_dijkstra_dial_csr)
+    """
+    _csr_compartido['grafo'] = (indptr, indices, pesos, pesos_reales, peso_maximo)
+
+
+def _csr_dijkstra_fuentes(fuentes):
+    """Tarea del pool: Dijkstra desde cada fuente; retorna matrices (distancias, predecesores)"""
+    indptr, indices, pesos, pesos_reales, peso_maximo = _csr_compartido['grafo']
+    distancias = np.empty((len(fuentes), len(indptr) - 1))
+    predecesores = np.empty((len(fuentes), len(indptr) - 1), dtype=np.int32)
+    for fila, fuente in enumerate(fuentes):
+        if peso_maximo is None:
+            distancias[fila], predecesores[fila] = _dijkstra_csr(indptr, indices, pesos, fuente, pesos_reales)
+        else:
+            distancias[fila], predecesores[fila] = _dijkstra_dial_csr(indptr, indices, pesos, fuente, peso_maximo)
+    return distancias, predecesores
+
+
+def _dijkstra_csr(indptr, indices, pesos, origen, pesos_reales=None):
+    """
+    Dijkstra sobre un grafo CSR dado como listas de Python
+
+    Si se indican pesos_reales, el orden de exploración usa 'pesos' pero las
+    distancias retornadas suman 'pesos_reales' a lo largo del árbol (Johnson).
+
+    Retorna: lista de distancias y lista de predecesores por índice (-1 = ninguno)
+    """
+    n = len(indptr) - 1
+    distancias = [float('inf')] * n
+    predecesores = [-1] * n
+    distancias[origen] = 0.0
+    reales = distancias if pesos_reales is None else [float('inf')] * n
+    reales[origen] = 0.0
+
+    heap = [(0.0, origen)]
+    while heap:
+        dist_actual, u = heapq.heappop(heap)
+        if dist_actual > distancias[u]:
+            continue
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            nueva_dist = dist_actual + pesos[e]
+            if nueva_dist < distancias[v]:
+                distancias[v] = nueva_dist
+                predecesores[v] = u
+                if pesos_reales is not None:
+                    reales[v] = reales[u] + pesos_reales[e]
+                heapq.heappush(heap, (nueva_dist, v))
+
+    return reales, predecesores
+
+
+def _dijkstra_dial_csr(indptr, indices, pesos, origen, peso_maximo):
+    """
+    Dijkstra con los cubos de Dial, para pesos enteros no negativos
+
+    Un arreglo circular de C + 1 cubos (C = peso_maximo) reemplaza al heap:
+    el cubo d % (C + 1) guarda los nodos con distancia tentativa d y se
+    recorren en orden creciente de d.
+
+    pesos: lista de enteros (GrafoCSR.pesos_enteros)
+
+    Retorna: lista de distancias y lista de predecesores por índice (-1 = ninguno)
+    """
+    n = len(indptr) - 1
+    distancias = [float('inf')] * n
+    predecesores = [-1] * n
+    distancias[origen] = 0
+
+    tam = peso_maximo + 1
+    cubos = [[] for _ in range(tam)]
+    cubos[0].append(origen)
+    pendientes = 1
+    d = 0
+    while pendientes:
+        cubo = cubos[d % tam]
+        while cubo:  # Los arcos de peso 0 agregan nodos al cubo actual
+            u = cubo.pop()
+            pendientes -= 1
+            if distancias[u] != d:
+                continue  # Entrada vieja: el nodo ya mejoró
+            for e in range(indptr[u], indptr[u + 1]):
+                v = indices[e]
+                nueva_dist = d + pesos[e]
+                if nueva_dist < distancias[v]:
+                    distancias[v] = nueva_dist
+                    predecesores[v] = u
+                    cubos[nueva_dist % tam].append(v)
+                    pendientes += 1
+        d += 1
+
+    return [float(d) for d in distancias], predecesores
+
+
+def _dijkstra_radix_csr(indptr, indices, pesos, origen, peso_maximo):
+    """
+    Dijkstra con radix heap, para pesos enteros no negativos
+
+    No se elige automáticamente: en CPython resulta más lento que heapq
+    (ver benchmark_grafos.py dijkstra_entero); queda como alternativa medida.
+
+    Radix heap: el cubo i > 0 guarda los nodos cuya distancia tentativa
+    difiere de la última distancia extraída con el bit i-1 como más alto, y
+    el cubo 0 los de distancia igual; al vaciarse el cubo 0 se redistribuye
+    el primer cubo no vacío a partir de su mínimo
+    """
+    n = len(indptr) - 1
+    distancias = [float('inf')] * n
+    predecesores = [-1] * n
+    asentados = [False] * n
+    distancias[origen] = 0
+
+    cubos = [[] for _ in range((peso_maximo * max(n - 1, 1)).bit_length() + 1)]
+    cubos[0].append(origen)
+    ultima = 0
+    pendientes = 1
+    while pendientes:
+        if not cubos[0]:
+            i = 1
+            while not cubos[i]:
+                i += 1
+            redistribuir, cubos[i] = cubos[i], []
+            vivos = [v for v in redistribuir if not asentados[v]]
+            pendientes -= len(redistribuir) - len(vivos)
+            if not vivos:
+                continue
+            ultima = min(distancias[v] for v in vivos)
+            for v in vivos:
+                cubos[(distancias[v] ^ ultima).bit_length()].append(v)
+
+        u = cubos[0].pop()
+        pendientes -= 1
+        if asentados[u]:
+            continue  # Copia vieja de un nodo que mejoró y ya se extrajo
+        asentados[u] = True
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            nueva_dist = ultima + pesos[e]
+            if nueva_dist < distancias[v]:
+                distancias[v] = nueva_dist
+                predecesores[v] = u
+                cubos[(nueva_dist ^ ultima).bit_length()].append(v)
+                pendientes += 1
+
+    return [float(d) for d in distancias], predecesores
+
+
+def _dijkstra_punto_a_punto_csr(indptr, indices, pesos, origen, destino):
+    """
+    Dijkstra desde origen que se detiene al asentar el destino
+
+    Retorna: distancia, lista de predecesores por índice y cantidad de nodos asentados
+    """
+    n = len(indptr) - 1
+    distancias = [float('inf')] * n
+    predecesores = [-1] * n
+    distancias[origen] = 0.0
+    asentados = 0
+
+    heap = [(0.0, origen)]
+    while heap:
+        dist_actual, u = heapq.heappop(heap)
+        if dist_actual > distancias[u]:
+            continue
+        asentados += 1
+        if u == destino:
+            break
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            nueva_dist = dist_actual + pesos[e]
+            if nueva_dist < distancias[v]:
+                distancias[v] = nueva_dist
+                predecesores[v] = u
+                heapq.heappush(heap, (nueva_dist, v))
+
+    return distancias[destino], predecesores, asentados
+
+
+def _dijkstra_bidireccional_csr(adelante, atras, origen, destino):
+    """
+    Dijkstra bidireccional: una búsqueda desde el origen sobre 'adelante' y
+    otra desde el destino sobre 'atras' (el CSR invertido), avanzando
+    siempre la de menor clave. Termina cuando la suma de los topes de ambas
+    colas no puede mejorar el mejor camino encontrado por un arco de cruce.
+
+    adelante, atras: tuplas (indptr, indices, pesos) como listas de Python
+
+    Retorna: distancia, camino por índices ([] si no hay) y cantidad de nodos asentados
+    """
+    n = len(adelante[0]) - 1
+    inf = float('inf')
+    distancias = ([inf] * n, [inf] * n)
+    predecesores = ([-1] * n, [-1] * n)
+    distancias[0][origen] = 0.0
+    distancias[1][destino] = 0.0
+    heaps = ([(0.0, origen)], [(0.0, destino)])
+    mejor = 0.0 if origen == destino else inf
+    encuentro = origen if origen == destino else -1
+    asentados = 0
+
+    while True:
+        tope_ida = heaps[0][0][0] if heaps[0] else inf
+        tope_vuelta = heaps[1][0][0] if heaps[1] else inf
+        if tope_ida + tope_vuelta >= mejor:
+            break
+        lado = 0 if tope_ida <= tope_vuelta else 1
+
+        dist_actual, u = heapq.heappop(heaps[lado])
+        propias, opuestas = distancias[lado], distancias[1 - lado]
+        if dist_actual > propias[u]:
+            continue
+        asentados += 1
+
+        indptr, indices, pesos = adelante if lado == 0 else atras
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            nueva_dist = dist_actual + pesos[e]
+            if nueva_dist < propias[v]:
+                propias[v] = nueva_dist
+                predecesores[lado][v] = u
+                heapq.heappush(heaps[lado], (nueva_dist, v))
+            if propias[v] + opuestas[v] < mejor:
+                mejor = propias[v] + opuestas[v]
+                encuentro = v
+
+    if encuentro < 0:
+        return inf, [], asentados
+
+    # Tramo origen → encuentro (predecesores de ida) y encuentro → destino (de vuelta)
+    camino = [encuentro]
+    while camino[-1] != origen:
+        camino.append(predecesores[0][camino[-1]])
+    camino.reverse()
+    while camino[-1] != destino:
+        camino.append(predecesores[1][camino[-1]])
+    return mejor, camino, asentados
+
+
+def _k_rutas_yen_csr(adelante, atras, origen, destino, k, presupuesto):
+    """
+    Algoritmo de Yen (con la mejora de Lawler) para las k rutas simples más
+    cortas entre origen y destino
+
+    Primero se calcula el árbol de caminos más cortos hacia el destino sobre
+    el grafo invertido: su distancia h(v) es una cota inferior exacta para
+    toda búsqueda de desvío, que se resuelve con A* guiado por h. Si la rama
+    del árbol desde el nodo de desvío no toca nodos ni arcos bloqueados, esa
+    rama ya es el desvío óptimo y no hace falta buscar.
+
+    adelante, atras: tuplas (indptr, indices, pesos) como listas de Python
+    presupuesto: tope de nodos asentados entre todas las búsquedas A*
+
+    Retorna: lista de (distancia, camino por índices) en orden creciente y
+             True si la búsqueda terminó sin agotar el presupuesto
+    """
+    inf = float('inf')
+    indptr, indices, pesos = adelante
+    h, siguiente = _dijkstra_csr(atras[0], atras[1], atras[2], destino)
+    if h[origen] == inf:
+        return [], True
+
+    def rama_del_arbol(u):
+        """Camino u → destino siguiendo el árbol invertido"""
+        camino = [u]
+        while camino[-1] != destino:
+            camino.append(siguiente[camino[-1]])
+        return camino
+
+    def acumulados(camino):
+        """Distancias acumuladas desde el inicio del camino hasta cada nodo"""
+        acum = [0.0]
+        for u, v in zip(camino, camino[1:]):
+            for e in range(indptr[u], indptr[u + 1]):
+                if indices[e] == v:
+                    acum.append(acum[-1] + pesos[e])
+                    break
+        return acum
+
+    gastado = 0
+
+    def desvio(s, bloqueados, arcos_bloqueados, limite):
+        """
+        A* desde s hasta el destino evitando los nodos y los primeros arcos
+        bloqueados, descartando los caminos de costo mayor a limite
+        """
+        nonlocal gastado
+        g = {s: 0.0}
+        pred = {s: -1}
+        cerrados = set()
+        heap = [(h[s], 0.0, s)]
+        while heap:
+            _, gu, u = heapq.heappop(heap)
+            if u in cerrados:
+                continue
+            cerrados.add(u)
+            gastado += 1
+            if u == destino:
+                camino = [u]
+                while pred[camino[-1]] >= 0:
+                    camino.append(pred[camino[-1]])
+                camino.reverse()
+                return camino
+            if gastado >= presupuesto:
+                return None
+            for e in range(indptr[u], indptr[u + 1]):
+                v = indices[e]
+                if v in bloqueados or v in cerrados or h[v] == inf or (u == s and v in arcos_bloqueados):
+                    continue
+                nueva = gu + pesos[e]
+                if nueva < g.get(v, inf) and nueva + h[v] <= limite:
+                    g[v] = nueva
+                    pred[v] = u
+                    heapq.heappush(heap, (nueva + h[v], nueva, v))
+        return None
+
+    primero = rama_del_arbol(origen)
+    # Cada ruta aceptada: (camino, distancias acumuladas, índice de desvío respecto de su padre)
+    rutas = [(primero, acumulados(primero), 0)]
+    candidatos = []
+    vistos = {tuple(primero)}
+
+    while len(rutas) < k:
+        # Solo hacen falta los k - len(rutas) mejores candidatos: el resto se
+        # descarta y el peor de ellos acota las búsquedas de desvío
+        faltan = k - len(rutas)
+        cota = inf
+        if len(candidatos) >= faltan:
+            candidatos = heapq.nsmallest(faltan, candidatos)
+            cota = candidatos[-1][0]
+
+        camino, acum, desde = rutas[-1]
+        # Lawler: los desvíos anteriores al índice de desvío ya los generó el padre
+        for i in range(desde, len(camino) - 1):
+            s = camino[i]
+            if acum[i] + h[s] > cota:
+                continue
+            raiz = camino[:i + 1]
+            bloqueados = set(camino[:i])
+            arcos_bloqueados = {otro[i + 1] for otro, _, _ in rutas
+                                if len(otro) > i + 1 and otro[:i + 1] == raiz}
+
+            rama = rama_del_arbol(s)
+            if siguiente[s] in arcos_bloqueados or not bloqueados.isdisjoint(rama):
+                rama = desvio(s, bloqueados, arcos_bloqueados, cota - acum[i])
+                if rama is None:
+                    if gastado >= presupuesto:
+                        return [(a[-1], c) for c, a, _ in rutas], False
+                    continue
+
+            nuevo = raiz[:-1] + rama
+            clave = tuple(nuevo)
+            if clave not in vistos:
+                vistos.add(clave)
+                acum_nuevo = acum[:i] + [acum[i] + d for d in acumulados(rama)]
+                heapq.heappush(candidatos, (acum_nuevo[-1], len(nuevo), nuevo, acum_nuevo, i))
+
+        if not candidatos:
+            break
+        _, _, nuevo, acum_nuevo, i = heapq.heappop(candidatos)
+        rutas.append((nuevo, acum_nuevo, i))
+
+    return [(a[-1], c) for c, a, _ in rutas], True
+
+
+def _pares_delaunay(puntos):
+    """
+    Pares de puntos candidatos a aristas del MST euclidiano
+
+    Son las aristas de la triangulación de Delaunay (O(n) pares en el plano),
+    que contienen al MST euclidiano, más una arista de cada punto repetido
+    hacia el vértice más cercano. Si los puntos son degenerados para Qhull
+    (todos alineados, coplanares en 3-D, etc.) se proyectan sobre el
+    subespacio afín que los contiene, donde las distancias no cambian; si
+    ese subespacio es una recta, el MST es la cadena en orden a lo largo de ella.
+
+    Retorna: u, v (índices de punto, int64), sin pares repetidos
+    """
+    n, d = puntos.shape
+    if n < 2:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    if d == 1:
+        orden = np.argsort(puntos[:, 0], kind='stable')
+        return orden[:-1], orden[1:]
+
+    try:
+        triangulacion = Delaunay(puntos)
+    except QhullError:
+        centrados = puntos - puntos.mean(axis=0)
+        _, valores, direcciones = np.linalg.svd(centrados, full_matrices=False)
+        rango = int((valores > valores[0] * 1e-10).sum()) if valores[0] > 0 else 0
+        if rango >= d:
+            raise
+        if rango <= 1:
+            orden = np.argsort(centrados @ direcciones[0], kind='stable')
+            return orden[:-1], orden[1:]
+        return _pares_delaunay(centrados @ direcciones[:rango].T)
+
+    simplices = triangulacion.simplices
+    pares = [simplices[:, [a, b]] for a, b in itertools.combinations(range(d + 1), 2)]
+    if len(triangulacion.coplanar):
+        pares.append(triangulacion.coplanar[:, [0, 2]])
+    pares = np.sort(np.concatenate(pares).astype(np.int64), axis=1)
+    claves = np.unique(pares[:, 0] * n + pares[:, 1])
+    return claves // n, claves % n
+
+
+def _componentes_debiles_csr(csr):
+    """
+    Componentes débilmente conexas de un GrafoCSR: BFS ignorando el sentido
+    de los arcos (en grafos no dirigidos, las componentes conexas). O(V + E).
+
+    Retorna: etiqueta de componente por nodo (lista) y cantidad de componentes
+    """
+    indptr, indices, _ = csr.listas()
+    indptr_inv, indices_inv, _ = csr.invertido().listas()
+    etiqueta = [-1] * csr.n
+    n_componentes = 0
+    for raiz in range(csr.n):
+        if etiqueta[raiz] != -1:
+            continue
+        etiqueta[raiz] = n_componentes
+        cola = deque([raiz])
+        while cola:
+            v = cola.popleft()
+            for w in itertools.chain(indices[indptr[v]:indptr[v + 1]],
+                                     indices_inv[indptr_inv[v]:indptr_inv[v + 1]]):
+                if etiqueta[w] == -1:
+                    etiqueta[w] = n_componentes
+                    cola.append(w)
+        n_componentes += 1
+    return etiqueta, n_componentes
+
+
+def _componentes_fuertes_csr(csr):
+    """
+    Componentes fuertemente conexas de un GrafoCSR con Tarjan iterativo
+    (pila explícita, sin recursión). O(V + E).
+
+    Retorna: etiqueta de componente por nodo (lista) y cantidad de componentes
+    """
+    indptr, indices, _ = csr.listas()
+    n = csr.n
+    indice = [-1] * n
+    bajo = [0] * n
+    en_pila = bytearray(n)
+    pila = []
+    etiqueta = [-1] * n
+    contador = n_componentes = 0
+
+    for raiz in range(n):
+        if indice[raiz] != -1:
+            continue
+        indice[raiz] = bajo[raiz] = contador
+        contador += 1
+        pila.append(raiz)
+        en_pila[raiz] = 1
+        # Cada llamada pendiente guarda el nodo y el próximo arco a recorrer
+        llamadas = [[raiz, indptr[raiz]]]
+        while llamadas:
+            llamada = llamadas[-1]
+            v, k = llamada
+            if k < indptr[v + 1]:
+                llamada[1] = k + 1
+                w = indices[k]
+                if indice[w] == -1:
+                    indice[w] = bajo[w] = contador
+                    contador += 1
+                    pila.append(w)
+                    en_pila[w] = 1
+                    llamadas.append([w, indptr[w]])
+                elif en_pila[w] and indice[w] < bajo[v]:
+                    bajo[v] = indice[w]
+                continue
+
+            llamadas.pop()
+            if llamadas and bajo[v] < bajo[llamadas[-1][0]]:
+                bajo[llamadas[-1][0]] = bajo[v]
+            if bajo[v] == indice[v]:
+                # v es la raíz de una componente: sacarla completa de la pila
+                while True:
+                    w = pila.pop()
+                    en_pila[w] = 0
+                    etiqueta[w] = n_componentes
+                    if w == v:
+                        break
+                n_componentes += 1
+    return etiqueta, n_componentes
+
+
+def _miembros_componentes(etiqueta, n_componentes):
+    """Índices de nodo de cada componente (arreglos ordenados), agrupados con un solo argsort"""
+    etiqueta = np.asarray(etiqueta, dtype=np.int64)
+    orden = np.argsort(etiqueta, kind='stable')
+    cortes = np.cumsum(np.bincount(etiqueta, minlength=n_componentes))[:-1]
+    return np.split(orden, cortes)
+
+
+def _tarea_mst_componente(subgrafo):
+    """Tarea del pool: Prim con heap indexado sobre una componente conexa"""
+    return AlgoritmosGrafos._prim_heap_indexado(subgrafo, next(iter(subgrafo)))
+
+
+def _tarea_apsp_componente(tarea):
+    """
+    Tarea del pool: Floyd-Warshall min-plus (NumPy) sobre una componente
+
+    tarea: (número de componente, cantidad de nodos k, filas, columnas, pesos)
+           con los arcos de la componente en índices locales
+
+    Retorna (número de componente, D, P) con la convención de floyd_warshall
+    (P[i][j] = i si no hay camino, -1 en la diagonal), en índices locales.
+    """
+    c, k, filas, columnas, pesos = tarea
+    D = np.full((k, k), np.inf)
+    distintos = filas != columnas
+    D[filas[distintos], columnas[distintos]] = pesos[distintos]
+    np.fill_diagonal(D, 0.0)
+    P = np.repeat(np.arange(k, dtype=np.int32)[:, None], k, axis=1)
+    np.fill_diagonal(P, -1)
+    _fw_minplus(D, P)
+    return c, D, P
+
+
+def _orden_aristas(w):
+    """
+    Orden estable de las aristas por peso (argsort)
+
+    Con pesos enteros de rango menor a 2¹⁶ se ordena como uint16, que NumPy
+    resuelve con radix sort.
+    """
+    claves = w
+    if w.size and np.issubdtype(w.dtype, np.integer) and int(w.max()) - int(w.min()) < 2 ** 16:
+        claves = (w - w.min()).astype(np.uint16)
+    return np.argsort(claves, kind='stable')
+
+
+# Marca de "sin arista" en los mínimos por componente de Borůvka
+_SIN_ARISTA = np.iinfo(np.int64).max
+
+
+def _boruvka_minimos(c, d, inicio, n_componentes):
+    """
+    Arista más liviana de cada componente dentro de un bloque (tarea del pool)
+
+    c, d: componentes de los extremos de las aristas del bloque, que están
+          ordenadas por peso; la posición de la arista es su rango
+    inicio: posición de la primera arista del bloque en el arreglo completo
+
+    Retorna un arreglo con la posición mínima por componente (_SIN_ARISTA si
+    ninguna arista del bloque la toca).
+    """
+    mejor = np.full(n_componentes, _SIN_ARISTA, dtype=np.int64)
+    posiciones = np.arange(inicio, inicio + len(c), dtype=np.int64)
+    np.minimum.at(mejor, c, posiciones)
+    np.minimum.at(mejor, d, posiciones)
+    return mejor
+
+
+# Primeros tres campos (nodo1 nodo2 peso) de cada línea de aristas que no sea un
+# comentario; lo usan kruskal_externo y SolverGrafos.parsear_aristas_arreglos
+PATRON_ARISTA = re.compile(r'^[ \t]*([^\s#]\S*)[ \t]+(\S+)[ \t]+(\S+)', re.MULTILINE)
+
+# Registro de una arista en las corridas de kruskal_externo. El número de
+# línea desempata pesos iguales, así el orden es el mismo que el de un
+# ordenamiento estable del archivo completo.
+_DTYPE_CORRIDA = np.dtype([('peso', '<f8'), ('num', '<i8'), ('u', '<i4'), ('v', '<i4')])
+
+
+def _leer_bloques_aristas(archivo, nodo_a_idx, aristas_por_bloque):
+    """
+    Lee un archivo de aristas (nodo1 nodo2 peso) por bloques de líneas
+
+    nodo_a_idx: diccionario etiqueta (str) → índice que se completa al leer;
+                es lo único que crece con el archivo (O(V))
+
+    Cada bloque se separa con PATRON_ARISTA y sus pesos y etiquetas se
+    convierten en bloque; solo las etiquetas distintas del bloque pasan por
+    el diccionario. Los comentarios (#) y las líneas vacías se ignoran.
+
+    Genera (bloque, descartadas): un arreglo _DTYPE_CORRIDA por bloque y la
+    cantidad de líneas del bloque con peso inválido.
+    """
+    num = 0
+    while True:
+        lineas = list(itertools.islice(archivo, aristas_por_bloque))
+        if not lineas:
+            return
+        filas = PATRON_ARISTA.findall(''.join(lineas))
+        pesos = [fila[2] for fila in filas]
+        descartadas = 0
+        try:
+            w = np.array(pesos, dtype=np.float64)
+        except ValueError:
+            validas = []
+            for fila, peso in zip(filas, pesos):
+                try:
+                    float(peso)
+                    validas.append(fila)
+                except ValueError:
+                    pass
+            descartadas = len(filas) - len(validas)
+            filas = validas
+            w = np.array([fila[2] for fila in filas], dtype=np.float64)
+
+        etiquetas = np.array([fila[0] for fila in filas] + [fila[1] for fila in filas], dtype=str)
+        distintas, inversa = np.unique(etiquetas, return_inverse=True)
+        indices = np.array([nodo_a_idx.setdefault(e, len(nodo_a_idx)) for e in distintas.tolist()],
+                           dtype=np.int32)[inversa]
+
+        bloque = np.empty(len(w), dtype=_DTYPE_CORRIDA)
+        bloque['peso'], bloque['u'], bloque['v'] = w, indices[:len(w)], indices[len(w):]
+        bloque['num'] = np.arange(num, num + len(w))
+        num += len(w)
+        yield bloque, descartadas
+
+
+def _mezclar_corridas(corridas, aristas_por_bloque):
+    """
+    Mezcla k-vías de corridas ordenadas por (peso, num), por bloques
+
+    En cada vuelta se toma un bloque de cada corrida y se emite todo lo que
+    no supera al menor de los últimos elementos de los bloques que no llegan
+    al final de su corrida: nada de lo que queda por leer puede ser menor.
+    Genera arreglos _DTYPE_CORRIDA en orden global.
+    """
+    posiciones = [0] * len(corridas)
+    while True:
+        bloques, tope = [], None
+        for corrida, pos in zip(corridas, posiciones):
+            bloque = corrida[pos:pos + aristas_por_bloque]
+            bloques.append(bloque)
+            if pos + len(bloque) < len(corrida):
+                ultimo = (bloque['peso'][-1], bloque['num'][-1])
+                tope = ultimo if tope is None else min(tope, ultimo)
+        if not any(len(bloque) for bloque in bloques):
+            return
+
+        partes = []
+        for j, bloque in enumerate(bloques):
+            if tope is not None:
+                # Cantidad de elementos (peso, num) <= tope; el bloque está ordenado
+                cuenta = np.searchsorted(bloque['peso'], tope[0], side='left')
+                iguales = np.searchsorted(bloque['peso'], tope[0], side='right')
+                cuenta += np.searchsorted(bloque['num'][cuenta:iguales], tope[1], side='right')
+                bloque = bloque[:cuenta]
+            posiciones[j] += len(bloque)
+            partes.append(bloque)
+
+        mezcla = np.concatenate(partes)
+        yield mezcla[np.lexsort((mezcla['num'], mezcla['peso']))]
+
 
 class UnionFind:
     """Estructura de datos Union-Find para Kruskal"""
@@ -34,8 +812,1461 @@ class UnionFind:
             self.rank[px] += 1
         return True
 
+
+class UnionFindArreglo:
+    """
+    Union-Find sobre arreglos compactos array('i'): find iterativo con
+    división de caminos (path halving) y unión por tamaño
+
+    Ocupa 8 bytes por nodo (padre y tamaño) en lugar de listas de objetos
+    int, y find no usa recursión ni depende del límite de recursión.
+    """
+
+    def __init__(self, n):
+        self.padre = array('i', range(n))
+        self.tamano = array('i', [1]) * n
+
+    def find(self, x):
+        padre = self.padre
+        while True:
+            p = padre[x]
+            if p == x:
+                return x
+            abuelo = padre[p]
+            if abuelo == p:
+                return p
+            # Cada nodo del recorrido pasa a apuntar a su abuelo
+            padre[x] = abuelo
+            x = abuelo
+
+    def unir_raices(self, x, y):
+        """Une dos raíces distintas (ya obtenidas con find); retorna la nueva raíz"""
+        tamano = self.tamano
+        if tamano[x] < tamano[y]:
+            x, y = y, x
+        self.padre[y] = x
+        tamano[x] += tamano[y]
+        return x
+
+    def union(self, x, y):
+        px, py = self.find(x), self.find(y)
+        if px == py:
+            return False
+        self.unir_raices(px, py)
+        return True
+
+
+class HeapDarioIndexado:
+    """
+    Cola de prioridad d-aria indexada sobre los enteros 0 .. n-1, con
+    disminución de clave
+
+    Cada elemento aparece a lo sumo una vez (posicion[item] guarda su lugar
+    en el arreglo del heap), así que el heap nunca supera los n elementos,
+    a diferencia de heapq con entradas obsoletas. Con d = 4 el árbol es más
+    bajo que el binario y las disminuciones de clave suben menos niveles.
+    """
+
+    def __init__(self, n, d=4):
+        self.d = d
+        self.items = []
+        self.claves = []
+        self.posicion = [-1] * n
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return self.posicion[item] >= 0
+
+    def insertar_o_disminuir(self, item, clave):
+        """
+        Inserta el item o baja su clave si la nueva es menor
+
+        Retorna: True si el heap cambió
+        """
+        i = self.posicion[item]
+        if i < 0:
+            i = len(self.items)
+            self.items.append(item)
+            self.claves.append(clave)
+        elif clave < self.claves[i]:
+            self.claves[i] = clave
+        else:
+            return False
+        self._subir(i, item, clave)
+        return True
+
+    def extraer_min(self):
+        """Quita y retorna (item, clave) de menor clave"""
+        items, claves = self.items, self.claves
+        item, clave = items[0], claves[0]
+        self.posicion[item] = -1
+        ultimo, clave_ultima = items.pop(), claves.pop()
+        if items:
+            self._bajar(0, ultimo, clave_ultima)
+        return item, clave
+
+    def _subir(self, i, item, clave):
+        items, claves, posicion, d = self.items, self.claves, self.posicion, self.d
+        while i > 0:
+            padre = (i - 1) // d
+            if claves[padre] <= clave:
+                break
+            items[i] = items[padre]
+            claves[i] = claves[padre]
+            posicion[items[i]] = i
+            i = padre
+        items[i] = item
+        claves[i] = clave
+        posicion[item] = i
+
+    def _bajar(self, i, item, clave):
+        items, claves, posicion, d = self.items, self.claves, self.posicion, self.d
+        n = len(items)
+        while True:
+            primero = d * i + 1
+            if primero >= n:
+                break
+            menor = primero
+            for hijo in range(primero + 1, min(primero + d, n)):
+                if claves[hijo] < claves[menor]:
+                    menor = hijo
+            if claves[menor] >= clave:
+                break
+            items[i] = items[menor]
+            claves[i] = claves[menor]
+            posicion[items[i]] = i
+            i = menor
+        items[i] = item
+        claves[i] = clave
+        posicion[item] = i
+
+
+class TrazaFloydWarshall:
+    """
+    Traza compacta de las iteraciones de Floyd-Warshall
+
+    Guarda las matrices iniciales una sola vez y, por cada paso k, solo las
+    celdas que cambiaron: (i, j, distancia anterior, distancia nueva,
+    predecesor nuevo), todas vía el nodo intermedio k. Las matrices de
+    cualquier paso se reconstruyen bajo demanda, por lo que la memoria es
+    O(n² + cambios) en lugar de O(n³).
+
+    Se usa igual que la lista de iteraciones: len(traza), traza[k] y
+    "for iteracion in traza" producen diccionarios con 'k',
+    'nodo_intermedio', 'matriz_d', 'matriz_s' y 'cambios'.
+    """
+    def __init__(self, nodos, D_inicial, P_inicial):
+        self.nodos = list(nodos)
+        self.D_inicial = np.array(D_inicial, dtype=np.float64)
+        self.P_inicial = np.array(P_inicial, dtype=np.int32)
+        self.pasos = []
+
+    def registrar(self, filas, columnas, anteriores, nuevas, predecesores):
+        """Agrega el paso siguiente con las celdas modificadas (índices de nodo)"""
+        self.pasos.append((np.asarray(filas, dtype=np.int32),
+                           np.asarray(columnas, dtype=np.int32),
+                           np.asarray(anteriores, dtype=np.float64),
+                           np.asarray(nuevas, dtype=np.float64),
+                           np.asarray(predecesores, dtype=np.int32)))
+
+    def matrices(self, k):
+        """Reconstruye D y P (índices, -1 = ninguno) después del paso k (0 = inicial)"""
+        if not 0 <= k < len(self):
+            raise IndexError(f"Iteración fuera de rango: {k}")
+        D = self.D_inicial.copy()
+        P = self.P_inicial.copy()
+        for paso in self.pasos[:k]:
+            self._aplicar(D, P, paso)
+        return D, P
+
+    def cambios_por_paso(self):
+        """Cantidad de celdas modificadas en cada paso k = 1..n, sin reconstruir matrices"""
+        return [len(paso[0]) for paso in self.pasos]
+
+    def __len__(self):
+        return len(self.pasos) + 1
+
+    def __getitem__(self, k):
+        if k < 0:
+            k += len(self)
+        D, P = self.matrices(k)
+        return self._iteracion(k, D, P)
+
+    def __iter__(self):
+        # Recorrido incremental: aplica un paso a la vez sobre una única copia
+        D = self.D_inicial.copy()
+        P = self.P_inicial.copy()
+        yield self._iteracion(0, D, P)
+        for k, paso in enumerate(self.pasos, 1):
+            self._aplicar(D, P, paso)
+            yield self._iteracion(k, D, P)
+
+    @staticmethod
+    def _aplicar(D, P, paso):
+        filas, columnas, _, nuevas, predecesores = paso
+        D[filas, columnas] = nuevas
+        P[filas, columnas] = predecesores
+
+    def _iteracion(self, k, D, P):
+        """Arma el diccionario de la iteración k con el formato de la lista original"""
+        if k == 0:
+            return {'k': 0, 'nodo_intermedio': 'Inicial', 'matriz_d': D.tolist(),
+                    'matriz_s': AlgoritmosGrafos._etiquetar_predecesores(P, self.nodos),
+                    'cambios': []}
+
+        filas, columnas, anteriores, nuevas, _ = self.pasos[k - 1]
+        via = self.nodos[k - 1]
+        cambios = [{
+            'origen': self.nodos[i],
+            'destino': self.nodos[j],
+            'dist_anterior': anterior,
+            'dist_nueva': nueva,
+            'via': via
+        } for i, j, anterior, nueva in zip(filas.tolist(), columnas.tolist(),
+                                            anteriores.tolist(), nuevas.tolist())]
+
+        return {'k': k, 'nodo_intermedio': via, 'matriz_d': D.tolist(),
+                'matriz_s': AlgoritmosGrafos._etiquetar_predecesores(P, self.nodos),
+                'cambios': cambios}
+
+
+class VistaMSTParcial(Sequence):
+    """
+    MST parcial de un paso como vista de solo lectura sobre una traza
+
+    Contiene las primeras 'cantidad' aristas aceptadas; el elemento j se
+    calcula con obtener(j) al pedirlo. Se compara igual que una lista y
+    list(vista) da la copia cuando hace falta guardarla.
+    """
+    def __init__(self, cantidad, obtener):
+        self.cantidad = cantidad
+        self.obtener = obtener
+
+    def __len__(self):
+        return self.cantidad
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return [self.obtener(x) for x in range(*j.indices(self.cantidad))]
+        if j < 0:
+            j += self.cantidad
+        if not 0 <= j < self.cantidad:
+            raise IndexError(f"Arista fuera de rango: {j}")
+        return self.obtener(j)
+
+    def __eq__(self, otro):
+        if isinstance(otro, (list, tuple, VistaMSTParcial)):
+            return len(self) == len(otro) and all(a == b for a, b in zip(self, otro))
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class VistaVisitados(Set):
+    """
+    Nodos visitados de un paso de Prim como vista de solo lectura
+
+    'orden' da, para cada nodo, cuántas aceptadas llevaba la traza cuando se
+    visitó (0 para el nodo inicial); el nodo está en la vista si ese valor no
+    supera 'cantidad'. Se compara igual que un set.
+    """
+    def __init__(self, cantidad, orden, nodos):
+        self.cantidad = cantidad
+        self.orden = orden
+        self.nodos = nodos
+
+    def __contains__(self, nodo):
+        return self.orden.get(nodo, self.cantidad + 1) <= self.cantidad
+
+    def __len__(self):
+        return self.cantidad + 1
+
+    def __iter__(self):
+        return itertools.islice(self.nodos, self.cantidad + 1)
+
+    def __repr__(self):
+        return repr(set(self))
+
+
+class TrazaKruskal:
+    """
+    Traza compacta de las iteraciones de Kruskal
+
+    La arista del paso i es la i-ésima de la lista ordenada, que se guarda
+    una sola vez. Por paso solo se guardan las raíces de sus extremos; de las
+    aceptadas, el número de paso y el peso acumulado. El MST parcial de un
+    paso sale de la cantidad de aceptadas hasta ese paso (una búsqueda en esa
+    lista de pasos), así que la memoria es O(E) en lugar de O(E·V).
+
+    Se usa igual que la lista de iteraciones: len(traza), traza[i] y
+    "for iteracion in traza" producen diccionarios con 'num', 'arista',
+    'aceptada', 'raiz_u', 'raiz_v', 'mst_actual' y 'peso_acumulado'.
+    'mst_actual' es una VistaMSTParcial sobre la traza, no una copia: guardar
+    todos los pasos (list(traza)) sigue ocupando O(E). Para conservar el MST
+    de un paso aparte de la traza, usar list(iteracion['mst_actual']).
+    """
+    def __init__(self, aristas_ordenadas):
+        self.aristas = aristas_ordenadas
+        self.raiz_u = array('i')
+        self.raiz_v = array('i')
+        self.pasos_aceptados = array('i')
+        self.pesos_acumulados = [0]
+
+    def registrar(self, paso):
+        """Agrega un evento PasoKruskal (se puede pasar como al_paso)"""
+        self.raiz_u.append(paso.raiz_u)
+        self.raiz_v.append(paso.raiz_v)
+        if paso.aceptada:
+            self.pasos_aceptados.append(len(self.raiz_u) - 1)
+            self.pesos_acumulados.append(paso.peso_acumulado)
+
+    def aceptadas_hasta(self, i):
+        """Cantidad de aristas aceptadas en los pasos 0..i"""
+        return bisect.bisect_right(self.pasos_aceptados, i)
+
+    def mst_hasta(self, i):
+        """MST parcial después del paso i (índice desde 0)"""
+        return [self.aristas[j] for j in self.pasos_aceptados[:self.aceptadas_hasta(i)]]
+
+    def __len__(self):
+        return len(self.raiz_u)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(f"Iteración fuera de rango: {i}")
+        return self._iteracion(i, self.aceptadas_hasta(i))
+
+    def __iter__(self):
+        # Recorrido incremental: solo avanza la cantidad de aceptadas
+        n_aceptadas = 0
+        for i in range(len(self)):
+            if n_aceptadas < len(self.pasos_aceptados) and self.pasos_aceptados[n_aceptadas] == i:
+                n_aceptadas += 1
+            yield self._iteracion(i, n_aceptadas)
+
+    def _arista_aceptada(self, j):
+        return self.aristas[self.pasos_aceptados[j]]
+
+    def _iteracion(self, i, n_aceptadas):
+        """Arma el diccionario del paso i con el formato de la lista original"""
+        return {
+            'num': i + 1,
+            'arista': self.aristas[i],
+            'aceptada': n_aceptadas > 0 and self.pasos_aceptados[n_aceptadas - 1] == i,
+            'raiz_u': self.raiz_u[i],
+            'raiz_v': self.raiz_v[i],
+            'mst_actual': VistaMSTParcial(n_aceptadas, self._arista_aceptada),
+            'peso_acumulado': self.pesos_acumulados[n_aceptadas]
+        }
+
+
+class TrazaPrim:
+    """
+    Traza compacta de las iteraciones de Prim
+
+    Guarda los eventos PasoPrim tal como llegan: cada uno trae solo lo que
+    cambió (arista extraída, candidatas nuevas, peso acumulado). Los nodos
+    visitados y el MST parcial de un paso se reconstruyen con las aceptadas
+    hasta ese paso (una búsqueda en la lista de pasos aceptados), en lugar
+    de copiar el conjunto y la lista en cada paso.
+
+    Se usa igual que la lista de iteraciones: len(traza), traza[i] y
+    "for iteracion in traza" producen los diccionarios 'inicial', 'aceptada'
+    y 'rechazada' con 'visitados' y 'mst' del paso. Ambos son vistas sobre
+    la traza (VistaVisitados y VistaMSTParcial), no copias por paso; usar
+    set(...) o list(...) para conservarlos aparte.
+    """
+    def __init__(self):
+        self.pasos = []
+        self.pasos_aceptados = array('i')
+        # Nodos en orden de visita y cuántas aceptadas había al visitar cada uno
+        self.nodos_visitados = []
+        self.orden_visita = {}
+
+    def registrar(self, paso):
+        """Agrega un evento PasoPrim (se puede pasar como al_paso)"""
+        if paso.tipo == 'aceptada':
+            self.pasos_aceptados.append(len(self.pasos))
+        if paso.tipo != 'rechazada':
+            self.orden_visita[paso.nodo] = len(self.pasos_aceptados)
+            self.nodos_visitados.append(paso.nodo)
+        self.pasos.append(paso)
+
+    def aceptadas_hasta(self, i):
+        """Cantidad de aristas aceptadas en los pasos 0..i"""
+        return bisect.bisect_right(self.pasos_aceptados, i)
+
+    def mst_hasta(self, i):
+        """MST parcial después del paso i"""
+        return [self.pasos[j].arista for j in self.pasos_aceptados[:self.aceptadas_hasta(i)]]
+
+    def visitados_hasta(self, i):
+        """Nodos visitados después del paso i"""
+        visitados = {self.pasos[0].nodo}
+        visitados.update(self.pasos[j].nodo for j in self.pasos_aceptados[:self.aceptadas_hasta(i)])
+        return visitados
+
+    def __len__(self):
+        return len(self.pasos)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(f"Iteración fuera de rango: {i}")
+        return self._iteracion(self.pasos[i], self.aceptadas_hasta(i))
+
+    def __iter__(self):
+        # Recorrido incremental: solo avanza la cantidad de aceptadas
+        n_aceptadas = 0
+        for paso in self.pasos:
+            if paso.tipo == 'aceptada':
+                n_aceptadas += 1
+            yield self._iteracion(paso, n_aceptadas)
+
+    def _arista_aceptada(self, j):
+        return self.pasos[self.pasos_aceptados[j]].arista
+
+    def _iteracion(self, paso, n_aceptadas):
+        """Arma el diccionario del paso con el formato de la lista original"""
+        visitados = VistaVisitados(n_aceptadas, self.orden_visita, self.nodos_visitados)
+        mst = VistaMSTParcial(n_aceptadas, self._arista_aceptada)
+        if paso.tipo == 'inicial':
+            return {
+                'num': 0,
+                'tipo': 'inicial',
+                'nodo_inicio': paso.nodo,
+                'visitados': visitados,
+                'mst': [],
+                'peso_total': 0,
+                'candidatos': [(p, u, v) for u, v, p in paso.nuevas_aristas]
+            }
+        iteracion = {
+            'num': paso.num,
+            'tipo': paso.tipo,
+            'arista': paso.arista,
+            'visitados': visitados,
+            'mst': mst,
+            'peso_total': paso.peso_total
+        }
+        if paso.tipo == 'rechazada':
+            iteracion['razon'] = 'nodo ya visitado'
+        else:
+            iteracion['nuevas_aristas'] = paso.nuevas_aristas
+        return iteracion
+
+
+class GrafoCSR:
+    """
+    Grafo dirigido compacto en formato CSR (filas comprimidas)
+
+    Los nodos se internan como enteros 0..n-1 en el orden de 'nodos'. Los
+    arcos que salen del nodo i son indices[indptr[i]:indptr[i+1]], con sus
+    pesos en las mismas posiciones de 'pesos'.
+    """
+    def __init__(self, nodos, indptr, indices, pesos):
+        self.nodos = list(nodos)
+        self.nodo_a_idx = {nodo: i for i, nodo in enumerate(self.nodos)}
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.pesos = np.asarray(pesos, dtype=np.float64)
+        self._listas = None
+        self._invertido = None
+        self._enteros = None
+
+    @classmethod
+    def desde_dict(cls, grafo, nodos=None):
+        """
+        Construye el CSR desde un diccionario {nodo: {vecino: peso}}
+
+        nodos: orden de internado (por defecto, el de las claves del grafo
+               seguido de los vecinos que no aparecen como clave)
+        """
+        if nodos is None:
+            nodos = list(grafo)
+            conocidos = set(nodos)
+            for vecinos in grafo.values():
+                for vecino in vecinos:
+                    if vecino not in conocidos:
+                        conocidos.add(vecino)
+                        nodos.append(vecino)
+        nodo_a_idx = {nodo: i for i, nodo in enumerate(nodos)}
+
+        indptr = [0]
+        indices = []
+        pesos = []
+        for nodo in nodos:
+            for vecino, peso in grafo.get(nodo, {}).items():
+                j = nodo_a_idx.get(vecino)
+                if j is not None:
+                    indices.append(j)
+                    pesos.append(peso)
+            indptr.append(len(indices))
+
+        return cls(nodos, indptr, indices, pesos)
+
+    @property
+    def n(self):
+        return len(self.nodos)
+
+    @property
+    def m(self):
+        return len(self.indices)
+
+    def origenes(self):
+        """Nodo de origen de cada arco (arreglo paralelo a indices)"""
+        return np.repeat(np.arange(self.n, dtype=np.int32), np.diff(self.indptr))
+
+    def listas(self):
+        """(indptr, indices, pesos) como listas de Python, para bucles rápidos"""
+        if self._listas is None:
+            self._listas = (self.indptr.tolist(), self.indices.tolist(), self.pesos.tolist())
+        return self._listas
+
+    @property
+    def peso_maximo_entero(self):
+        """Mayor peso si todos los pesos son enteros no negativos; None en otro caso"""
+        if self._enteros is None:
+            pesos = self.pesos
+            enteros = bool(np.all(pesos >= 0) and np.all(pesos == np.floor(pesos)) and np.all(pesos < 2 ** 53))
+            self._enteros = (int(pesos.max()) if len(pesos) else 0) if enteros else False
+        return None if self._enteros is False else self._enteros
+
+    @property
+    def peso_maximo_dial(self):
+        """Peso máximo si conviene Dijkstra con cubos de Dial (pesos enteros hasta MAX_PESO_DIAL); None si no"""
+        peso_maximo = self.peso_maximo_entero
+        return peso_maximo if peso_maximo is not None and peso_maximo <= MAX_PESO_DIAL else None
+
+    def pesos_enteros(self):
+        """Pesos como lista de enteros de Python (solo si peso_maximo_entero no es None)"""
+        return self.pesos.astype(np.int64).tolist()
+
+    def invertido(self):
+        """Grafo con todos los arcos invertidos (se construye una sola vez y se cachea)"""
+        if self._invertido is None:
+            orden = np.argsort(self.indices, kind='stable')
+            indptr = np.zeros(self.n + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self.indices, minlength=self.n), out=indptr[1:])
+            self._invertido = GrafoCSR(self.nodos, indptr, self.origenes()[orden], self.pesos[orden])
+            self._invertido._invertido = self
+        return self._invertido
+
+
+class APSPPorComponentes:
+    """
+    Caminos más cortos entre todos los pares, resueltos por componente
+
+    Entre nodos de componentes débilmente conexas distintas no hay camino,
+    así que esos bloques (todos ∞) no se guardan: solo hay una matriz D
+    (float64) y una P (int32, índices locales) por componente, es decir
+    Σ kᵢ² celdas en lugar de n².
+
+    Las consultas tienen la misma interfaz que AlmacenAPSP: distancia(),
+    fila() y camino(), con las etiquetas de los nodos.
+    """
+    def __init__(self, nodos, miembros, bloques):
+        self.nodos = list(nodos)
+        self.nodo_a_idx = {nodo: i for i, nodo in enumerate(self.nodos)}
+        self.miembros = miembros
+        self.bloques = bloques
+        # Componente y posición dentro de ella de cada nodo (índice global)
+        self.componente = np.empty(len(self.nodos), dtype=np.int32)
+        self.posicion = np.empty(len(self.nodos), dtype=np.int32)
+        for c, indices in enumerate(miembros):
+            self.componente[indices] = c
+            self.posicion[indices] = np.arange(len(indices))
+
+    def __len__(self):
+        return len(self.nodos)
+
+    @property
+    def n_componentes(self):
+        return len(self.miembros)
+
+    def _ubicar(self, nodo):
+        i = self.nodo_a_idx[nodo]
+        return i, int(self.componente[i]), int(self.posicion[i])
+
+    def distancia(self, origen, destino):
+        """Distancia más corta de origen a destino (∞ si están en componentes distintas)"""
+        _, c, i = self._ubicar(origen)
+        _, c_destino, j = self._ubicar(destino)
+        if c != c_destino:
+            return float('inf')
+        return float(self.bloques[c][0][i, j])
+
+    def fila(self, origen):
+        """
+        (distancias, predecesores) desde origen a todos los nodos, en índices
+        globales y con la convención de floyd_warshall
+        """
+        global_origen, c, i = self._ubicar(origen)
+        D, P = self.bloques[c]
+        indices = self.miembros[c]
+        distancias = np.full(len(self.nodos), np.inf)
+        distancias[indices] = D[i]
+        predecesores = np.full(len(self.nodos), global_origen, dtype=np.int32)
+        predecesores[indices] = np.where(P[i] < 0, -1, indices[P[i]])
+        return distancias, predecesores
+
+    def camino(self, origen, destino):
+        """Camino más corto de origen a destino como lista de nodos ([] si no hay camino)"""
+        _, c, i = self._ubicar(origen)
+        _, c_destino, j = self._ubicar(destino)
+        if c != c_destino:
+            return []
+        if i == j:
+            return [origen]
+        D, P = self.bloques[c]
+        if np.isinf(D[i, j]):
+            return []
+
+        camino = [j]
+        while j != i:
+            j = int(P[i, j])
+            if j < 0 or len(camino) > len(D):
+                return []
+            camino.append(j)
+        camino.reverse()
+        indices = self.miembros[c]
+        return [self.nodos[indices[k]] for k in camino]
+
+
+class AlmacenAPSP:
+    """
+    Resultado de caminos más cortos entre todos los pares guardado en disco
+
+    El directorio contiene tres archivos:
+    - distancias.npy: matriz n×n float32 o float64 (∞ = sin camino)
+    - predecesores.npy: matriz n×n int32 con la convención de floyd_warshall
+      (P[i][j] = predecesor de j en el camino i→j, -1 en la diagonal)
+    - nodos.json: etiquetas de los nodos en el orden de las filas
+
+    Las matrices se abren con numpy.memmap, así que abrir un resultado
+    guardado es instantáneo y cada consulta solo trae de disco las filas
+    que lee.
+    """
+    ARCHIVO_DISTANCIAS = 'distancias.npy'
+    ARCHIVO_PREDECESORES = 'predecesores.npy'
+    ARCHIVO_NODOS = 'nodos.json'
+
+    def __init__(self, directorio, nodos, distancias, predecesores):
+        self.directorio = directorio
+        self.nodos = list(nodos)
+        self.nodo_a_idx = {nodo: i for i, nodo in enumerate(self.nodos)}
+        self.distancias = distancias
+        self.predecesores = predecesores
+
+    @classmethod
+    def crear(cls, directorio, nodos, dtype=np.float64):
+        """Crea en disco un almacén vacío (distancias en ∞) listo para escribir por filas"""
+        os.makedirs(directorio, exist_ok=True)
+        n = len(nodos)
+        with open(os.path.join(directorio, cls.ARCHIVO_NODOS), 'w', encoding='utf-8') as f:
+            json.dump(list(nodos), f, ensure_ascii=False)
+        distancias = np.lib.format.open_memmap(os.path.join(directorio, cls.ARCHIVO_DISTANCIAS),
+                                               mode='w+', dtype=dtype, shape=(n, n))
+        distancias[:] = np.inf
+        predecesores = np.lib.format.open_memmap(os.path.join(directorio, cls.ARCHIVO_PREDECESORES),
+                                                 mode='w+', dtype=np.int32, shape=(n, n))
+        return cls(directorio, nodos, distancias, predecesores)
+
+    @classmethod
+    def guardar(cls, directorio, D, P, nodos, dtype=np.float64, filas_por_bloque=1024):
+        """
+        Guarda en disco un resultado de floyd_warshall
+
+        D: matriz de distancias (lista de listas o ndarray)
+        P: matriz de predecesores con etiquetas de nodos o con índices
+        """
+        almacen = cls.crear(directorio, nodos, dtype)
+        for inicio in range(0, len(almacen.nodos), filas_por_bloque):
+            fin = inicio + filas_por_bloque
+            almacen.distancias[inicio:fin] = np.asarray(D[inicio:fin], dtype=np.float64)
+            almacen.predecesores[inicio:fin] = almacen._indices_filas(P[inicio:fin])
+        almacen.sincronizar()
+        return almacen
+
+    @classmethod
+    def abrir(cls, directorio, modo='r'):
+        """Abre un almacén guardado sin leer las matrices completas"""
+        with open(os.path.join(directorio, cls.ARCHIVO_NODOS), encoding='utf-8') as f:
+            nodos = json.load(f)
+        distancias = np.load(os.path.join(directorio, cls.ARCHIVO_DISTANCIAS), mmap_mode=modo)
+        predecesores = np.load(os.path.join(directorio, cls.ARCHIVO_PREDECESORES), mmap_mode=modo)
+        if distancias.shape != (len(nodos), len(nodos)) or predecesores.shape != distancias.shape:
+            raise ValueError(f"El almacén de {directorio} está incompleto o dañado")
+        return cls(directorio, nodos, distancias, predecesores)
+
+    def sincronizar(self):
+        """Escribe a disco las páginas modificadas"""
+        for matriz in (self.distancias, self.predecesores):
+            if isinstance(matriz, np.memmap):
+                matriz.flush()
+
+    def __len__(self):
+        return len(self.nodos)
+
+    def distancia(self, origen, destino):
+        """Distancia más corta de origen a destino (∞ si no hay camino)"""
+        return float(self.distancias[self.nodo_a_idx[origen], self.nodo_a_idx[destino]])
+
+    def fila(self, origen):
+        """(distancias, predecesores) desde origen, como arreglos en memoria"""
+        i = self.nodo_a_idx[origen]
+        return np.array(self.distancias[i]), np.array(self.predecesores[i])
+
+    def camino(self, origen, destino):
+        """Camino más corto de origen a destino como lista de nodos ([] si no hay camino)"""
+        i = self.nodo_a_idx[origen]
+        j = self.nodo_a_idx[destino]
+        if i == j:
+            return [origen]
+        if np.isinf(self.distancias[i, j]):
+            return []
+
+        predecesores = np.array(self.predecesores[i])  # Solo se lee la fila del origen
+        camino = [j]
+        while j != i:
+            j = int(predecesores[j])
+            if j < 0 or len(camino) > len(self.nodos):
+                return []
+            camino.append(j)
+        camino.reverse()
+        return [self.nodos[k] for k in camino]
+
+    def _indices_filas(self, P):
+        """Convierte filas de predecesores (etiquetas o índices) a índices int32"""
+        if isinstance(P, np.ndarray) and P.dtype != object:
+            return P
+        return [[-1 if p is None else self.nodo_a_idx[p] for p in fila] for fila in P]
+
+
+class IndiceRutasALT:
+    """
+    Índice de rutas ALT (A*, landmarks y desigualdad triangular)
+
+    El preprocesamiento elige k nodos de referencia (landmarks) y guarda las
+    distancias desde y hacia cada uno. Para cualquier nodo v y destino t,
+    por desigualdad triangular:
+        d(v, t) ≥ d(L, t) - d(L, v)   y   d(v, t) ≥ d(v, L) - d(t, L)
+    La mejor de esas cotas guía una búsqueda A* que asienta muchos menos
+    nodos que Dijkstra. Conviene cuando se hacen muchas consultas sobre la
+    misma red: el índice se guarda en disco y se reutiliza.
+    """
+    def __init__(self, csr, landmarks, desde_landmarks, hacia_landmarks):
+        self.csr = csr
+        self.landmarks = np.asarray(landmarks, dtype=np.int64)
+        self.desde_landmarks = np.asarray(desde_landmarks, dtype=np.float64)  # k×n: d(L, v)
+        self.hacia_landmarks = np.asarray(hacia_landmarks, dtype=np.float64)  # k×n: d(v, L)
+        # Una tupla de k distancias por nodo, para calcular cotas sin pasar por NumPy
+        self._desde_nodo = [tuple(fila) for fila in self.desde_landmarks.T.tolist()]
+        self._hacia_nodo = [tuple(fila) for fila in self.hacia_landmarks.T.tolist()]
+
+    @classmethod
+    def construir(cls, grafo, k=8, semilla=0):
+        """
+        Preprocesa el grafo eligiendo k landmarks por el más lejano primero
+
+        grafo: diccionario {nodo: {vecino: peso}} (pesos no negativos) o GrafoCSR
+        k: cantidad de landmarks (más landmarks, cotas más ajustadas y más memoria)
+        """
+        csr = grafo if isinstance(grafo, GrafoCSR) else GrafoCSR.desde_dict(grafo)
+        adelante, atras = csr.listas(), csr.invertido().listas()
+        k = min(k, csr.n)
+
+        # Cada landmark nuevo es el nodo más lejano de los ya elegidos (los
+        # nodos inalcanzables quedan a distancia ∞ y se eligen primero)
+        landmarks, desde, hacia = [], [], []
+        lejania = np.full(csr.n, np.inf)
+        candidato = int(np.random.default_rng(semilla).integers(csr.n)) if csr.n else 0
+        for _ in range(k):
+            landmarks.append(candidato)
+            desde.append(_dijkstra_csr(*adelante, candidato)[0])
+            hacia.append(_dijkstra_csr(*atras, candidato)[0])
+            np.minimum(lejania, desde[-1], out=lejania)
+            lejania[landmarks] = -1.0
+            candidato = int(np.argmax(lejania))
+
+        return cls(csr, landmarks, np.array(desde).reshape(k, csr.n), np.array(hacia).reshape(k, csr.n))
+
+    def _cota(self, v, desde_t, hacia_t):
+        """Cota inferior de d(v, t) a partir de los landmarks (∞ si t no es alcanzable desde v)"""
+        inf = float('inf')
+        cota = 0.0
+        for d_l_t, d_l_v, d_v_l, d_t_l in zip(desde_t, self._desde_nodo[v], self._hacia_nodo[v], hacia_t):
+            if d_l_v != inf:
+                if d_l_t == inf:
+                    return inf  # L llega a v pero no a t: v tampoco llega a t
+                if d_l_t - d_l_v > cota:
+                    cota = d_l_t - d_l_v
+            if d_t_l != inf:
+                if d_v_l == inf:
+                    return inf  # t llega a L pero v no: v tampoco llega a t
+                if d_v_l - d_t_l > cota:
+                    cota = d_v_l - d_t_l
+        return cota
+
+    def ruta(self, origen, destino):
+        """
+        Camino más corto de origen a destino con A* guiado por los landmarks
+
+        Retorna: distancia (∞ si no hay camino), camino como lista de nodos
+                 (vacía si no hay camino) y cantidad de nodos asentados
+        """
+        s, t = self.csr.nodo_a_idx[origen], self.csr.nodo_a_idx[destino]
+        indptr, indices, pesos = self.csr.listas()
+        desde_t, hacia_t = self._desde_nodo[t], self._hacia_nodo[t]
+        inf = float('inf')
+
+        distancias = {s: 0.0}
+        predecesores = {s: -1}
+        cotas = {s: self._cota(s, desde_t, hacia_t)}
+        asentados = set()
+        heap = [(cotas[s], s)]
+        while heap:
+            _, u = heapq.heappop(heap)
+            if u in asentados:
+                continue
+            asentados.add(u)
+            if u == t:
+                break
+            dist_u = distancias[u]
+            for e in range(indptr[u], indptr[u + 1]):
+                v = indices[e]
+                nueva_dist = dist_u + pesos[e]
+                if nueva_dist < distancias.get(v, inf):
+                    if v not in cotas:
+                        cotas[v] = self._cota(v, desde_t, hacia_t)
+                    if cotas[v] == inf:
+                        continue
+                    distancias[v] = nueva_dist
+                    predecesores[v] = u
+                    heapq.heappush(heap, (nueva_dist + cotas[v], v))
+
+        if t not in asentados:
+            return inf, [], len(asentados)
+
+        camino = [t]
+        while camino[-1] != s:
+            camino.append(predecesores[camino[-1]])
+        camino.reverse()
+        return distancias[t], [self.csr.nodos[k] for k in camino], len(asentados)
+
+    def guardar(self, ruta):
+        """Guarda el índice (grafo CSR, landmarks y distancias) en un archivo .npz"""
+        np.savez(ruta, nodos=np.array(json.dumps(self.csr.nodos, ensure_ascii=False)),
+                 indptr=self.csr.indptr, indices=self.csr.indices, pesos=self.csr.pesos,
+                 landmarks=self.landmarks, desde_landmarks=self.desde_landmarks,
+                 hacia_landmarks=self.hacia_landmarks)
+
+    @classmethod
+    def cargar(cls, ruta):
+        """Carga un índice guardado con guardar(), sin repetir el preprocesamiento"""
+        with np.load(ruta, allow_pickle=False) as datos:
+            csr = GrafoCSR(json.loads(str(datos['nodos'])), datos['indptr'], datos['indices'], datos['pesos'])
+            return cls(csr, datos['landmarks'], datos['desde_landmarks'], datos['hacia_landmarks'])
+
+
+class JerarquiaContraccion:
+    """
+    Jerarquía de contracción para consultas de rutas sobre una red fija
+
+    Preprocesamiento: los nodos se contraen de a uno en orden de importancia
+    (diferencia de aristas con actualización perezosa). Al contraer v, cada
+    par u → v → x sin un camino testigo igual o más corto que evite v recibe
+    un atajo u → x que recuerda a v como nodo intermedio.
+
+    Consulta: dos búsquedas de Dijkstra que solo suben en la jerarquía (una
+    desde el origen y otra hacia el destino) se encuentran en el nodo de
+    mayor rango del camino; los atajos se desempaquetan para devolver el
+    camino con las etiquetas originales.
+    """
+    def __init__(self, nodos, rango, arriba, abajo):
+        self.nodos = list(nodos)
+        self.nodo_a_idx = {nodo: i for i, nodo in enumerate(self.nodos)}
+        self.rango = np.asarray(rango, dtype=np.int64)
+        # Cada grafo es (indptr, indices, pesos, medios); medio = -1 en arcos originales
+        self.arriba = tuple(np.asarray(a) for a in arriba)  # v → x con rango(x) > rango(v)
+        self.abajo = tuple(np.asarray(a) for a in abajo)    # v → u por cada arco u → v con rango(u) > rango(v)
+        self._arriba = tuple(a.tolist() for a in self.arriba)
+        self._abajo = tuple(a.tolist() for a in self.abajo)
+        self._medios = None
+
+    @classmethod
+    def construir(cls, aristas, dirigido=False, max_asentados_testigo=60):
+        """
+        Construye la jerarquía desde una lista de aristas (u, v, peso)
+
+        aristas: la lista que retorna SolverGrafos.parsear_aristas (pesos no negativos)
+        dirigido: si es False cada arista vale en ambos sentidos
+        max_asentados_testigo: límite de nodos de cada búsqueda de testigos
+                               (más bajo, preprocesa más rápido pero agrega
+                               más atajos; las distancias siguen siendo exactas)
+        """
+        nodos = list(dict.fromkeys(nodo for u, v, _ in aristas for nodo in (u, v)))
+        nodo_a_idx = {nodo: i for i, nodo in enumerate(nodos)}
+        n = len(nodos)
+        inf = float('inf')
+
+        # Grafo de trabajo: salientes[u][x] = entrantes[x][u] = (peso, medio)
+        salientes = [{} for _ in range(n)]
+        entrantes = [{} for _ in range(n)]
+
+        def agregar(u, x, peso, medio):
+            if u != x and peso < salientes[u].get(x, (inf,))[0]:
+                salientes[u][x] = entrantes[x][u] = (peso, medio)
+
+        for u, v, peso in aristas:
+            agregar(nodo_a_idx[u], nodo_a_idx[v], float(peso), -1)
+            if not dirigido:
+                agregar(nodo_a_idx[v], nodo_a_idx[u], float(peso), -1)
+
+        def testigos(origen, excluido, limite):
+            """Distancias desde origen sin pasar por 'excluido', hasta 'limite' o el máximo de asentados"""
+            distancias = {origen: 0.0}
+            heap = [(0.0, origen)]
+            asentados = 0
+            while heap and asentados < max_asentados_testigo:
+                d, u = heapq.heappop(heap)
+                if d > distancias[u]:
+                    continue
+                if d > limite:
+                    break
+                asentados += 1
+                for x, (peso, _) in salientes[u].items():
+                    if x != excluido and d + peso < distancias.get(x, inf):
+                        distancias[x] = d + peso
+                        heapq.heappush(heap, (d + peso, x))
+            return distancias
+
+        def atajos(v):
+            """Atajos (u, x, peso) necesarios al contraer v"""
+            resultado = []
+            for u, (peso_uv, _) in entrantes[v].items():
+                pesos_salida = [peso for x, (peso, _) in salientes[v].items() if x != u]
+                if not pesos_salida:
+                    continue
+                distancias = testigos(u, v, peso_uv + max(pesos_salida))
+                for x, (peso_vx, _) in salientes[v].items():
+                    if x != u and distancias.get(x, inf) > peso_uv + peso_vx:
+                        resultado.append((u, x, peso_uv + peso_vx))
+            return resultado
+
+        vecinos_contraidos = [0] * n
+
+        def prioridad(v, nuevos):
+            return len(nuevos) - len(entrantes[v]) - len(salientes[v]) + vecinos_contraidos[v]
+
+        heap = [(prioridad(v, atajos(v)), v) for v in range(n)]
+        heapq.heapify(heap)
+        rango = [0] * n
+        arriba = [None] * n
+        abajo = [None] * n
+        orden = 0
+        while heap:
+            _, v = heapq.heappop(heap)
+            # Actualización perezosa: si la prioridad empeoró, vuelve a la cola
+            nuevos = atajos(v)
+            actual = prioridad(v, nuevos)
+            if heap and actual > heap[0][0]:
+                heapq.heappush(heap, (actual, v))
+                continue
+
+            rango[v] = orden
+            orden += 1
+            arriba[v] = [(x, peso, medio) for x, (peso, medio) in salientes[v].items()]
+            abajo[v] = [(u, peso, medio) for u, (peso, medio) in entrantes[v].items()]
+            for x in salientes[v]:
+                del entrantes[x][v]
+                vecinos_contraidos[x] += 1
+            for u in entrantes[v]:
+                del salientes[u][v]
+                vecinos_contraidos[u] += 1
+            salientes[v], entrantes[v] = {}, {}
+            for u, x, peso in nuevos:
+                agregar(u, x, peso, v)
+
+        return cls(nodos, rango, cls._compactar(arriba), cls._compactar(abajo))
+
+    @staticmethod
+    def _compactar(listas):
+        """Listas de arcos (destino, peso, medio) por nodo → arreglos CSR"""
+        indptr = np.zeros(len(listas) + 1, dtype=np.int64)
+        np.cumsum([len(arcos) for arcos in listas], out=indptr[1:])
+        arcos = [arco for lista in listas for arco in lista]
+        indices = np.array([x for x, _, _ in arcos], dtype=np.int32)
+        pesos = np.array([peso for _, peso, _ in arcos], dtype=np.float64)
+        medios = np.array([medio for _, _, medio in arcos], dtype=np.int32)
+        return indptr, indices, pesos, medios
+
+    @property
+    def n_atajos(self):
+        """Cantidad de atajos agregados por la contracción"""
+        return int((self.arriba[3] >= 0).sum() + (self.abajo[3] >= 0).sum())
+
+    def _busqueda_ascendente(self, grafo, origen):
+        """Dijkstra completo sobre un grafo ascendente; retorna distancias y predecesores (dicts)"""
+        indptr, indices, pesos, _ = grafo
+        distancias = {origen: 0.0}
+        predecesores = {origen: -1}
+        heap = [(0.0, origen)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > distancias[u]:
+                continue
+            for e in range(indptr[u], indptr[u + 1]):
+                x = indices[e]
+                if d + pesos[e] < distancias.get(x, float('inf')):
+                    distancias[x] = d + pesos[e]
+                    predecesores[x] = u
+                    heapq.heappush(heap, (d + pesos[e], x))
+        return distancias, predecesores
+
+    def _consulta(self, s, t):
+        """Búsqueda bidireccional ascendente; retorna distancia, encuentro y predecesores de cada lado"""
+        inf = float('inf')
+        grafos = (self._arriba, self._abajo)
+        distancias = ({s: 0.0}, {t: 0.0})
+        predecesores = ({s: -1}, {t: -1})
+        heaps = ([(0.0, s)], [(0.0, t)])
+        mejor = inf
+        encuentro = -1
+
+        while heaps[0] or heaps[1]:
+            # Se avanza el lado de menor clave; un lado se detiene si ya no puede mejorar
+            lado = 0 if heaps[0] and (not heaps[1] or heaps[0][0][0] <= heaps[1][0][0]) else 1
+            d, u = heapq.heappop(heaps[lado])
+            if d >= mejor:
+                heaps[lado].clear()
+                continue
+            propias, opuestas = distancias[lado], distancias[1 - lado]
+            if d > propias[u]:
+                continue
+            if u in opuestas and d + opuestas[u] < mejor:
+                mejor = d + opuestas[u]
+                encuentro = u
+            indptr, indices, pesos, _ = grafos[lado]
+            for e in range(indptr[u], indptr[u + 1]):
+                x = indices[e]
+                if d + pesos[e] < propias.get(x, inf):
+                    propias[x] = d + pesos[e]
+                    predecesores[lado][x] = u
+                    heapq.heappush(heaps[lado], (d + pesos[e], x))
+
+        return mejor, encuentro, predecesores
+
+    def distancia(self, origen, destino):
+        """Distancia más corta de origen a destino (∞ si no hay camino)"""
+        return self._consulta(self.nodo_a_idx[origen], self.nodo_a_idx[destino])[0]
+
+    def ruta(self, origen, destino):
+        """
+        Camino más corto de origen a destino
+
+        Retorna: distancia (∞ si no hay camino) y camino como lista de nodos
+                 originales (vacía si no hay camino)
+        """
+        s, t = self.nodo_a_idx[origen], self.nodo_a_idx[destino]
+        distancia, encuentro, (pred_ida, pred_vuelta) = self._consulta(s, t)
+        if encuentro < 0:
+            return distancia, []
+
+        # Camino en la jerarquía: s ↑ encuentro ↓ t
+        jerarquico = [encuentro]
+        while jerarquico[-1] != s:
+            jerarquico.append(pred_ida[jerarquico[-1]])
+        jerarquico.reverse()
+        while jerarquico[-1] != t:
+            jerarquico.append(pred_vuelta[jerarquico[-1]])
+
+        camino = [s]
+        for a, b in zip(jerarquico, jerarquico[1:]):
+            self._desempaquetar(a, b, camino)
+        return distancia, [self.nodos[k] for k in camino]
+
+    def _desempaquetar(self, a, b, camino):
+        """Agrega a 'camino' los nodos originales del arco a → b (sin a)"""
+        if self._medios is None:
+            self._medios = {}
+            for (indptr, indices, _, medios), hacia_arriba in ((self._arriba, True), (self._abajo, False)):
+                for v in range(len(indptr) - 1):
+                    for e in range(indptr[v], indptr[v + 1]):
+                        arco = (v, indices[e]) if hacia_arriba else (indices[e], v)
+                        self._medios[arco] = medios[e]
+
+        pila = [(a, b)]
+        while pila:
+            a, b = pila.pop()
+            medio = self._medios[(a, b)]
+            if medio < 0:
+                camino.append(b)
+            else:
+                pila.append((medio, b))
+                pila.append((a, medio))
+
+    def tabla_distancias(self, origenes, destinos):
+        """
+        Matriz de distancias de muchos orígenes a muchos destinos
+
+        Una búsqueda descendente desde cada destino deja (destino, distancia)
+        en un cubo por nodo alcanzado; luego cada búsqueda ascendente desde un
+        origen combina los cubos de los nodos que asienta.
+
+        Retorna: ndarray len(origenes) × len(destinos) (∞ si no hay camino)
+        """
+        cubos = defaultdict(list)
+        for j, destino in enumerate(destinos):
+            distancias, _ = self._busqueda_ascendente(self._abajo, self.nodo_a_idx[destino])
+            for u, d in distancias.items():
+                cubos[u].append((j, d))
+
+        tabla = np.full((len(origenes), len(destinos)), np.inf)
+        for i, origen in enumerate(origenes):
+            fila = tabla[i].tolist()
+            distancias, _ = self._busqueda_ascendente(self._arriba, self.nodo_a_idx[origen])
+            for u, d in distancias.items():
+                for j, d_destino in cubos.get(u, ()):
+                    if d + d_destino < fila[j]:
+                        fila[j] = d + d_destino
+            tabla[i] = fila
+        return tabla
+
+    def guardar(self, ruta):
+        """Guarda la jerarquía en un archivo .npz"""
+        np.savez(ruta, nodos=np.array(json.dumps(self.nodos, ensure_ascii=False)), rango=self.rango,
+                 **{f'arriba_{nombre}': arreglo for nombre, arreglo in zip(('indptr', 'indices', 'pesos', 'medios'), self.arriba)},
+                 **{f'abajo_{nombre}': arreglo for nombre, arreglo in zip(('indptr', 'indices', 'pesos', 'medios'), self.abajo)})
+
+    @classmethod
+    def cargar(cls, ruta):
+        """Carga una jerarquía guardada con guardar(), sin volver a contraer"""
+        nombres = ('indptr', 'indices', 'pesos', 'medios')
+        with np.load(ruta, allow_pickle=False) as datos:
+            return cls(json.loads(str(datos['nodos'])), datos['rango'],
+                       [datos[f'arriba_{nombre}'] for nombre in nombres],
+                       [datos[f'abajo_{nombre}'] for nombre in nombres])
+
+
+EntradaCacheRutas = namedtuple('EntradaCacheRutas', 'distancias predecesores pasos')
+
+
+class CacheRutas:
+    """
+    Caché LRU de árboles de caminos más cortos (resultados de Dijkstra)
+
+    La clave combina una huella canónica del grafo (el conjunto de arcos
+    ordenado, sin importar el orden de las líneas de entrada) y el nodo
+    origen. La huella ya distingue dirigido de no dirigido (un grafo no
+    dirigido trae cada arco en los dos sentidos), así que dos consultas sobre
+    los mismos arcos comparten la entrada aunque vengan de lugares distintos.
+    Cuando se supera la capacidad se descarta la entrada usada hace más tiempo.
+
+    Las entradas se comparten entre consultas: quien las recibe no debe
+    modificar los diccionarios de distancias y predecesores.
+    """
+
+    def __init__(self, capacidad=TAM_CACHE_RUTAS):
+        self.capacidad = capacidad
+        self._entradas = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    @staticmethod
+    def huella(grafo):
+        """Hash BLAKE2 del grafo {nodo: {vecino: peso}}, independiente del orden de inserción"""
+        canonico = sorted((repr(u), sorted((repr(v), float(peso)) for v, peso in vecinos.items()))
+                          for u, vecinos in grafo.items())
+        return hashlib.blake2b(repr(canonico).encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def clave(grafo, origen):
+        """Clave de la caché para el grafo y el origen"""
+        return CacheRutas.huella(grafo), repr(origen)
+
+    def obtener(self, clave, con_pasos=False):
+        """
+        Retorna la EntradaCacheRutas de la clave (o None) y cuenta el acierto o fallo
+
+        con_pasos: si es True, una entrada guardada sin pasos cuenta como
+                   fallo y se retorna None, porque quien consulta igual tiene
+                   que volver a ejecutar Dijkstra paso a paso
+        """
+        entrada = self._entradas.get(clave)
+        if entrada is None or (con_pasos and entrada.pasos is None):
+            self.fallos += 1
+            return None
+        self._entradas.move_to_end(clave)
+        self.aciertos += 1
+        return entrada
+
+    def guardar(self, clave, distancias, predecesores, pasos=None):
+        """
+        Guarda un resultado de Dijkstra; pasos es opcional (tupla de
+        PasoDijkstra para poder repetir la salida paso a paso)
+        """
+        entrada = EntradaCacheRutas(distancias, predecesores, pasos)
+        self._entradas[clave] = entrada
+        self._entradas.move_to_end(clave)
+        while len(self._entradas) > self.capacidad:
+            self._entradas.popitem(last=False)
+        return entrada
+
+    def dijkstra(self, grafo, origen):
+        """
+        Distancias y predecesores desde el origen, calculados con
+        AlgoritmosGrafos.dijkstra solo si no estaban en la caché
+
+        Retorna: distancias, predecesores y True si fue un acierto
+        """
+        clave = self.clave(grafo, origen)
+        entrada = self.obtener(clave)
+        if entrada is not None:
+            return entrada.distancias, entrada.predecesores, True
+        distancias, predecesores, _ = AlgoritmosGrafos.dijkstra(grafo, origen)
+        self.guardar(clave, distancias, predecesores)
+        return distancias, predecesores, False
+
+    def limpiar(self):
+        """Vacía la caché y reinicia los contadores"""
+        self._entradas.clear()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def resumen(self):
+        """Texto corto con los contadores, para la barra de estado"""
+        return f"caché de rutas: {self.aciertos} aciertos, {self.fallos} fallos, {len(self)}/{self.capacidad} árboles"
+
+
+# Caché compartida por SolverGrafos.resolver_dijkstra y la interfaz gráfica
+CACHE_RUTAS = CacheRutas()
+
+
+class SSSPDinamico:
+    """
+    Árbol de caminos más cortos desde un origen fijo que se mantiene vivo
+    mientras cambian los arcos, sin volver a correr Dijkstra completo
+
+    - Inserción o disminución de peso de (u, v): si mejora la distancia de
+      v, se propaga con Dijkstra desde v solo por los nodos que mejoran
+    - Aumento de peso o eliminación de un arco del árbol: se invalida el
+      subárbol que cuelga de v y se reconstruye con un Dijkstra acotado a
+      ese subárbol, que arranca desde los mejores arcos que entran de afuera
+    - Cualquier otro cambio solo actualiza el peso guardado
+
+    Los pesos deben ser no negativos, como en Dijkstra.
+    """
+
+    def __init__(self, grafo, origen, distancias=None, predecesores=None):
+        """
+        grafo: diccionario {nodo: {vecino: peso}} (se copia)
+        distancias, predecesores: resultado previo de AlgoritmosGrafos.dijkstra
+                                  desde el mismo origen; si no se indican se calculan
+        """
+        self.origen = origen
+        self.grafo = {u: dict(vecinos) for u, vecinos in grafo.items()}
+        self._entrantes = defaultdict(dict)
+        for u, vecinos in grafo.items():
+            for v, peso in vecinos.items():
+                SSSPDinamico._validar_peso(u, v, peso)
+                self.grafo.setdefault(v, {})
+                self._entrantes[v][u] = peso
+
+        if distancias is None:
+            csr = GrafoCSR.desde_dict(self.grafo)
+            dist, pred = _dijkstra_csr(*csr.listas(), csr.nodo_a_idx[origen])
+            distancias = dict(zip(csr.nodos, dist))
+            predecesores = {nodo: None if p < 0 else csr.nodos[p] for nodo, p in zip(csr.nodos, pred)}
+        self.distancias = dict(distancias)
+        self.predecesores = dict(predecesores)
+
+        self._hijos = defaultdict(set)
+        for v, u in self.predecesores.items():
+            if u is not None:
+                self._hijos[u].add(v)
+
+    @staticmethod
+    def _validar_peso(u, v, peso):
+        if peso is not None and peso < 0:
+            raise ValueError(f"El arco {u}→{v} tiene peso negativo ({peso}): Dijkstra no lo admite")
+
+    def actualizar_arco(self, u, v, peso):
+        """
+        Cambia el peso del arco u → v; peso None elimina el arco y un arco
+        inexistente se inserta. Los nodos nuevos se agregan al grafo.
+
+        Retorna: diccionario {nodo: (distancia_anterior, distancia_nueva)}
+                 con los nodos cuya distancia al origen cambió
+        """
+        SSSPDinamico._validar_peso(u, v, peso)
+        for nodo in (u, v):
+            if nodo not in self.grafo:
+                self.grafo[nodo] = {}
+                self.distancias[nodo] = float('inf')
+                self.predecesores[nodo] = None
+
+        peso_anterior = self.grafo[u].get(v)
+        if peso is None:
+            self.grafo[u].pop(v, None)
+            self._entrantes[v].pop(u, None)
+        else:
+            self.grafo[u][v] = peso
+            self._entrantes[v][u] = peso
+
+        if u == v or peso == peso_anterior:
+            return {}
+        if peso is not None and self.distancias[u] + peso < self.distancias[v]:
+            return self._propagar_mejora(u, v, peso)
+        if self.predecesores[v] == u and (peso is None or peso_anterior is None or peso > peso_anterior):
+            return self._reconstruir_subarbol(v)
+        return {}
+
+    def aplicar(self, cambios):
+        """
+        Aplica varios cambios seguidos
+
+        cambios: lista de tuplas (u, v, peso_nuevo) o (u, v, peso_anterior,
+                 peso_nuevo) como las de AlgoritmosGrafos.diferencias_arcos
+
+        Retorna: diccionario {nodo: (distancia_anterior, distancia_nueva)}
+                 acumulado sobre todos los cambios
+        """
+        acumulado = {}
+        for cambio in cambios:
+            u, v, peso = cambio[0], cambio[1], cambio[-1]
+            for nodo, (anterior, nueva) in self.actualizar_arco(u, v, peso).items():
+                acumulado[nodo] = (acumulado.get(nodo, (anterior, None))[0], nueva)
+        return {nodo: par for nodo, par in acumulado.items() if par[0] != par[1]}
+
+    def camino(self, destino):
+        """Camino desde el origen hasta el destino en el árbol actual ([] si no es alcanzable)"""
+        return AlgoritmosGrafos._reconstruir_camino(self.predecesores, self.origen, destino)
+
+    def _cambiar_predecesor(self, v, u):
+        anterior = self.predecesores[v]
+        if anterior is not None:
+            self._hijos[anterior].discard(v)
+        self.predecesores[v] = u
+        if u is not None:
+            self._hijos[u].add(v)
+
+    def _propagar_mejora(self, u, v, peso):
+        """Dijkstra desde v tras mejorar su distancia por el arco u → v"""
+        distancias = self.distancias
+        cambios = {v: (distancias[v], distancias[u] + peso)}
+        distancias[v] = distancias[u] + peso
+        self._cambiar_predecesor(v, u)
+
+        heap = [(distancias[v], v)]
+        while heap:
+            dist_actual, x = heapq.heappop(heap)
+            if dist_actual > distancias[x]:
+                continue
+            for y, peso_xy in self.grafo[x].items():
+                nueva_dist = dist_actual + peso_xy
+                if nueva_dist < distancias[y]:
+                    cambios.setdefault(y, (distancias[y], None))
+                    distancias[y] = nueva_dist
+                    self._cambiar_predecesor(y, x)
+                    heapq.heappush(heap, (nueva_dist, y))
+
+        return {nodo: (anterior, distancias[nodo]) for nodo, (anterior, _) in cambios.items()}
+
+    def _reconstruir_subarbol(self, raiz):
+        """Recalcula las distancias del subárbol de raiz, que perdió su arco de entrada"""
+        distancias = self.distancias
+        subarbol = [raiz]
+        for x in subarbol:
+            subarbol.extend(self._hijos[x])
+        afectados = set(subarbol)
+        anteriores = {x: distancias[x] for x in subarbol}
+
+        # Mejor arco que entra a cada nodo afectado desde fuera del subárbol
+        heap = []
+        for x in subarbol:
+            distancias[x] = float('inf')
+            self._cambiar_predecesor(x, None)
+        for x in subarbol:
+            for p, peso in self._entrantes[x].items():
+                if p not in afectados and distancias[p] + peso < distancias[x]:
+                    distancias[x] = distancias[p] + peso
+                    self._cambiar_predecesor(x, p)
+            if distancias[x] < float('inf'):
+                heap.append((distancias[x], x))
+        heapq.heapify(heap)
+
+        # Dijkstra dentro del subárbol
+        while heap:
+            dist_actual, x = heapq.heappop(heap)
+            if dist_actual > distancias[x]:
+                continue
+            for y, peso in self.grafo[x].items():
+                if y in afectados and dist_actual + peso < distancias[y]:
+                    distancias[y] = dist_actual + peso
+                    self._cambiar_predecesor(y, x)
+                    heapq.heappush(heap, (distancias[y], y))
+
+        return {x: (anteriores[x], distancias[x]) for x in subarbol if distancias[x] != anteriores[x]}
+
+
 class AlgoritmosGrafos:
     
+    @staticmethod
+    def resultado(pasos, al_paso=None):
+        """
+        Consume un generador de pasos (pasos_kruskal, pasos_prim, pasos_dijkstra)
+        y retorna el resultado final que el generador devuelve al terminar
+
+        al_paso: función opcional que recibe cada evento a medida que se genera
+        """
+        try:
+            while True:
+                evento = next(pasos)
+                if al_paso is not None:
+                    al_paso(evento)
+        except StopIteration as fin:
+            return fin.value
+
+    @staticmethod
+    def pasos_kruskal(aristas, n_nodos):
+        """
+        Kruskal como generador de eventos PasoKruskal, uno por arista evaluada
+
+        Los eventos se producen a medida que avanza el algoritmo, sin copias
+        del MST parcial. El recorrido termina apenas el árbol tiene n_nodos - 1
+        aristas. Al terminar retorna (mst, peso_total); para obtenerlo usar
+        AlgoritmosGrafos.resultado(...).
+        """
+        aristas_ordenadas = sorted(aristas, key=lambda x: x[2])
+        
+        uf = UnionFindArreglo(n_nodos)
+        find = uf.find
+        mst = []
+        peso_total = 0
+        
+        for num, (u, v, peso) in enumerate(aristas_ordenadas, 1):
+            raiz_u = find(u)
+            raiz_v = find(v)
+            aceptada = raiz_u != raiz_v
+            if aceptada:
+                uf.unir_raices(raiz_u, raiz_v)
+                mst.append((u, v, peso))
+                peso_total += peso
+            yield PasoKruskal(num, (u, v, peso), aceptada, raiz_u, raiz_v, peso_total, len(mst))
+            if aceptada and len(mst) == n_nodos - 1:
+                break
+        
+        return mst, peso_total
+    
     @staticmethod
     def kruskal(aristas, n_nodos):
         """
@@ -44,117 +2275,420 @@ class AlgoritmosGrafos:
         aristas: lista de tuplas (u, v, peso)
         n_nodos: número de nodos
         
-        Retorna: lista de aristas del MST, peso total, lista de iteraciones
+        Retorna: lista de aristas del MST, peso total, iteraciones
+        (TrazaKruskal; para recorrer los pasos sin guardarlos, usar pasos_kruskal)
         """
         print("\n=== ALGORITMO DE KRUSKAL ===\n")
         
         # Ordenar aristas por peso
         aristas_ordenadas = sorted(aristas, key=lambda x: x[2])
         
-        uf = UnionFind(n_nodos)
-        mst = []
-        peso_total = 0
-        iteraciones = []
-        
         print("Aristas ordenadas por peso:")
         for u, v, peso in aristas_ordenadas:
             print(f"  {u} - {v}: {peso}")
         
         print("\nProceso de selección:")
-        iteracion_num = 1
-        for u, v, peso in aristas_ordenadas:
-            raiz_u = uf.find(u)
-            raiz_v = uf.find(v)
-            
-            if uf.union(u, v):
-                mst.append((u, v, peso))
-                peso_total += peso
+        iteraciones = TrazaKruskal(aristas_ordenadas)
+        
+        def registrar(paso):
+            u, v, peso = paso.arista
+            if paso.aceptada:
                 print(f"  ✓ Agregada: {u} - {v} (peso: {peso})")
-                
-                iteraciones.append({
-                    'num': iteracion_num,
-                    'arista': (u, v, peso),
-                    'aceptada': True,
-                    'raiz_u': raiz_u,
-                    'raiz_v': raiz_v,
-                    'mst_actual': list(mst),
-                    'peso_acumulado': peso_total
-                })
             else:
                 print(f"  ✗ Rechazada: {u} - {v} (formaría ciclo)")
-                
-                iteraciones.append({
-                    'num': iteracion_num,
-                    'arista': (u, v, peso),
-                    'aceptada': False,
-                    'raiz_u': raiz_u,
-                    'raiz_v': raiz_v,
-                    'mst_actual': list(mst),
-                    'peso_acumulado': peso_total
-                })
-            
-            iteracion_num += 1
+            iteraciones.registrar(paso)
+        
+        mst, peso_total = AlgoritmosGrafos.resultado(
+            AlgoritmosGrafos.pasos_kruskal(aristas_ordenadas, n_nodos), registrar)
         
         print(f"\nPeso total del MST: {peso_total}")
         return mst, peso_total, iteraciones
     
     @staticmethod
-    def prim(grafo, inicio=0):
+    def kruskal_vectorizado(u, v, w, n_nodos, aristas_por_bloque=65536):
         """
-        Algoritmo de Prim para encontrar el árbol de expansión mínima
-        
-        grafo: diccionario {nodo: {vecino: peso}}
-        inicio: nodo inicial
-        
-        Retorna: lista de aristas del MST, peso total, lista de iteraciones
+        Kruskal sobre arreglos paralelos de NumPy, sin traza ni impresión
+
+        u, v: índices de los extremos de cada arista (0 .. n_nodos-1)
+        w: pesos de las aristas
+        aristas_por_bloque: cuántas aristas ordenadas se pasan a Python por
+                            vez (con el corte en n-1 aristas, el resto no se
+                            convierte nunca)
+
+        El orden se calcula con argsort estable; con pesos enteros de rango
+        menor a 2¹⁶ se ordena como uint16, que NumPy resuelve con radix sort.
+
+        Retorna: índices (en u, v, w) de las aristas del MST en orden de
+                 selección y el peso total
+        """
+        u, v, w = np.asarray(u), np.asarray(v), np.asarray(w)
+        orden = _orden_aristas(w)
+        orden = orden[u[orden] != v[orden]]  # Los lazos nunca entran al árbol
+
+        uf = UnionFindArreglo(n_nodos)
+        find, unir_raices = uf.find, uf.unir_raices
+        elegidas = []
+        faltan = n_nodos - 1
+        for inicio in range(0, len(orden), aristas_por_bloque):
+            if len(elegidas) >= faltan:
+                break
+            bloque = orden[inicio:inicio + aristas_por_bloque]
+            for e, a, b in zip(bloque.tolist(), u[bloque].tolist(), v[bloque].tolist()):
+                raiz_a, raiz_b = find(a), find(b)
+                if raiz_a != raiz_b:
+                    unir_raices(raiz_a, raiz_b)
+                    elegidas.append(e)
+                    if len(elegidas) == faltan:
+                        break
+
+        elegidas = np.array(elegidas, dtype=np.int64)
+        return elegidas, w[elegidas].sum().item()
+    
+    @staticmethod
+    def parsear_puntos(texto):
+        """
+        Parsea puntos desde texto (uno por línea)
+        Formatos aceptados:
+        - "3.5 2" (coordenadas; el nombre del punto es su índice: 0, 1, ...)
+        - "A 3.5 2" (nombre y coordenadas)
+        - "# comentario" (ignorado)
+
+        Todos los puntos deben tener la misma cantidad de coordenadas; las
+        líneas que no cumplen el formato (por ejemplo, una arista "A B 3") se
+        ignoran con un aviso.
+
+        Retorna: lista de nombres y arreglo n×d de coordenadas (float64)
+        """
+        nombres = []
+        coordenadas = []
+
+        for linea in texto.strip().split('\n'):
+            linea = linea.strip()
+            if not linea or linea.startswith('#'):
+                continue
+
+            partes = linea.split()
+            try:
+                float(partes[0])
+                nombre = len(nombres)
+            except ValueError:
+                nombre, partes = partes[0], partes[1:]
+            try:
+                punto = [float(x) for x in partes]
+            except ValueError:
+                punto = []
+            if not punto or (coordenadas and len(punto) != len(coordenadas[0])):
+                print(f"⚠️ Línea ignorada (formato incorrecto): {linea}")
+                continue
+            nombres.append(nombre)
+            coordenadas.append(punto)
+
+        return nombres, np.array(coordenadas, dtype=np.float64)
+
+    @staticmethod
+    def aristas_delaunay(puntos):
+        """
+        Aristas candidatas del MST euclidiano de un conjunto de puntos
+
+        puntos: arreglo n×d de coordenadas (d = 2 en el caso habitual)
+
+        En lugar de las n·(n-1)/2 aristas del grafo completo se usan las de
+        la triangulación de Delaunay (scipy.spatial.Delaunay), que son O(n)
+        en el plano y siempre contienen al MST euclidiano.
+
+        Retorna: u, v (índices de punto) y w (distancias euclidianas)
+        """
+        puntos = np.asarray(puntos, dtype=np.float64)
+        if puntos.ndim == 1:
+            puntos = puntos[:, None]
+        u, v = _pares_delaunay(puntos)
+        return u, v, np.linalg.norm(puntos[u] - puntos[v], axis=1)
+
+    @staticmethod
+    def mst_euclidiano(puntos):
+        """
+        MST euclidiano: Kruskal (kruskal_vectorizado) sobre las aristas de Delaunay
+
+        Retorna: u, v (índices de punto), w (distancias) de las aristas del
+                 MST en orden de selección y el peso total
+        """
+        u, v, w = AlgoritmosGrafos.aristas_delaunay(puntos)
+        elegidas, peso_total = AlgoritmosGrafos.kruskal_vectorizado(u, v, w, len(puntos))
+        return u[elegidas], v[elegidas], w[elegidas], peso_total
+
+    @staticmethod
+    def kruskal_externo(ruta_archivo, aristas_por_corrida=ARISTAS_POR_CORRIDA,
+                        aristas_por_bloque=65536, directorio=None):
+        """
+        Kruskal semi-externo para archivos de aristas que no entran en memoria
+
+        ruta_archivo: archivo de texto con una arista por línea (nodo1 nodo2 peso)
+        aristas_por_corrida: aristas que se ordenan y escriben a disco por vez
+        aristas_por_bloque: líneas que se leen y parsean por vez, y aristas
+                            por corrida en cada vuelta de la mezcla
+        directorio: dónde crear las corridas temporales (por omisión, el
+                    directorio temporal del sistema)
+
+        1. El archivo se lee por bloques; al juntar aristas_por_corrida se
+           ordenan por peso y se escriben como una corrida binaria en disco.
+        2. Las corridas se mezclan k-vías (_mezclar_corridas) y se recorren
+           en orden global de peso, como un ordenamiento estable del archivo.
+        3. Filtro: antes de pasar un bloque mezclado por el union-find se
+           descartan, vectorizadamente, las aristas cuyos extremos ya tienen
+           la misma raíz. Solo las restantes se procesan en Python.
+
+        En memoria solo quedan el índice de etiquetas, el UnionFindArreglo
+        (O(V)) y los bloques en curso. Se termina al tener n-1 aristas.
+
+        Retorna: lista de aristas (u, v, peso) del MST (bosque mínimo si el
+                 grafo no es conexo), peso total y un diccionario con
+                 'nodos', 'aristas', 'descartadas', 'corridas' y 'filtradas'
+        """
+        nodo_a_idx = {}
+        estadisticas = {'nodos': 0, 'aristas': 0, 'descartadas': 0, 'corridas': 0, 'filtradas': 0}
+
+        with tempfile.TemporaryDirectory(prefix='kruskal_', dir=directorio) as carpeta:
+            rutas = []
+
+            def escribir_corrida(bloques):
+                corrida = np.concatenate(bloques)
+                corrida = corrida[np.argsort(corrida['peso'], kind='stable')]
+                rutas.append(os.path.join(carpeta, f'corrida_{len(rutas)}.bin'))
+                corrida.tofile(rutas[-1])
+
+            with open(ruta_archivo, encoding='utf-8') as archivo:
+                pendientes, n_pendientes = [], 0
+                for bloque, descartadas in _leer_bloques_aristas(archivo, nodo_a_idx, aristas_por_bloque):
+                    estadisticas['aristas'] += len(bloque)
+                    estadisticas['descartadas'] += descartadas
+                    bloque = bloque[bloque['u'] != bloque['v']]  # Los lazos nunca entran al árbol
+                    pendientes.append(bloque)
+                    n_pendientes += len(bloque)
+                    if n_pendientes >= aristas_por_corrida:
+                        escribir_corrida(pendientes)
+                        pendientes, n_pendientes = [], 0
+                if n_pendientes:
+                    escribir_corrida(pendientes)
+            n_nodos = estadisticas['nodos'] = len(nodo_a_idx)
+            estadisticas['corridas'] = len(rutas)
+
+            # Como en parsear_aristas, las etiquetas numéricas se devuelven como int
+            nodos = [None] * n_nodos
+            for nodo, i in nodo_a_idx.items():
+                nodos[i] = nodo
+            del nodo_a_idx
+            try:
+                nodos = [int(nodo) for nodo in nodos]
+            except ValueError:
+                pass
+
+            uf = UnionFindArreglo(n_nodos)
+            find, unir_raices = uf.find, uf.unir_raices
+            # Vista NumPy de los padres, para buscar raíces de un bloque entero
+            padre = np.frombuffer(uf.padre, dtype=np.int32)
+            mst = []
+            peso_total = 0
+            faltan = n_nodos - 1
+
+            corridas = [np.memmap(ruta, dtype=_DTYPE_CORRIDA, mode='r') for ruta in rutas]
+            try:
+                for bloque in _mezclar_corridas(corridas, aristas_por_bloque):
+                    if len(mst) >= faltan:
+                        break
+                    raiz_u, raiz_v = bloque['u'], bloque['v']
+                    while True:
+                        siguiente_u, siguiente_v = padre[raiz_u], padre[raiz_v]
+                        if np.array_equal(siguiente_u, raiz_u) and np.array_equal(siguiente_v, raiz_v):
+                            break
+                        raiz_u, raiz_v = siguiente_u, siguiente_v
+                    externas = raiz_u != raiz_v
+                    estadisticas['filtradas'] += len(bloque) - int(externas.sum())
+                    bloque = bloque[externas]
+
+                    for a, b, peso in zip(bloque['u'].tolist(), bloque['v'].tolist(), bloque['peso'].tolist()):
+                        ra, rb = find(a), find(b)
+                        if ra != rb:
+                            unir_raices(ra, rb)
+                            mst.append((nodos[a], nodos[b], peso))
+                            peso_total += peso
+                            if len(mst) == faltan:
+                                break
+            finally:
+                # Las vistas de los archivos deben liberarse antes de borrarlos
+                corridas = padre = None
+
+        return mst, peso_total, estadisticas
+    
+    @staticmethod
+    def boruvka_vectorizado(u, v, w, n_nodos, n_procesos=1, al_ronda=None):
+        """
+        Borůvka sobre arreglos paralelos de NumPy, sin traza ni impresión
+
+        u, v, w: extremos (0 .. n_nodos-1) y pesos de las aristas
+        n_procesos: si es mayor que 1, el cálculo de la arista más liviana de
+                    cada componente se reparte por bloques de aristas en un
+                    pool de procesos
+        al_ronda: función opcional que recibe un RondaBoruvka por ronda
+
+        En cada ronda cada componente elige su arista saliente más liviana
+        (reducción por segmentos con np.minimum.at); los empates se rompen por
+        el orden estable de los pesos, así que no se forman ciclos. Las
+        componentes se contraen con saltos de punteros y se descartan las
+        aristas que quedaron internas. Hay a lo sumo log₂(n) rondas. Si el
+        grafo no es conexo se obtiene el bosque mínimo.
+
+        Retorna: índices (en u, v, w) de las aristas del MST, agrupados por
+                 ronda, y el peso total
+        """
+        u, v, w = np.asarray(u), np.asarray(v), np.asarray(w)
+        ids = _orden_aristas(w)
+        ids = ids[u[ids] != v[ids]]  # Los lazos nunca entran al árbol
+        c = u[ids].astype(np.int64)
+        d = v[ids].astype(np.int64)
+
+        n_componentes = n_nodos
+        elegidas = []
+        pool = Pool(n_procesos) if n_procesos > 1 else None
+        try:
+            ronda = 0
+            while len(ids):
+                ronda += 1
+                # Posición (rango) de la arista más liviana de cada componente
+                if pool is not None and len(ids) >= 2 * n_procesos:
+                    corte = -(-len(ids) // n_procesos)
+                    tareas = [(c[i:i + corte], d[i:i + corte], i, n_componentes)
+                              for i in range(0, len(ids), corte)]
+                    mejor = np.minimum.reduce(pool.starmap(_boruvka_minimos, tareas))
+                else:
+                    mejor = _boruvka_minimos(c, d, 0, n_componentes)
+
+                componente = np.flatnonzero(mejor != _SIN_ARISTA)
+                posicion = mejor[componente]
+
+                # Cada componente apunta a la del otro extremo de su arista.
+                # Solo puede haber ciclos de dos (ambas eligieron la misma
+                # arista): la de menor número queda como raíz.
+                todas = np.arange(n_componentes)
+                padre = todas.copy()
+                padre[componente] = np.where(c[posicion] == componente, d[posicion], c[posicion])
+                mutuas = (padre[padre] == todas) & (todas < padre)
+                padre[mutuas] = todas[mutuas]
+
+                nuevas = ids[np.unique(posicion)]
+                elegidas.append(nuevas)
+
+                # Saltos de punteros hasta que todos apunten a su raíz
+                while True:
+                    abuelo = padre[padre]
+                    if np.array_equal(abuelo, padre):
+                        break
+                    padre = abuelo
+
+                # Contraer: renumerar las raíces y descartar aristas internas
+                es_raiz = padre == todas
+                etiqueta = (np.cumsum(es_raiz) - 1)[padre]
+                n_componentes = int(es_raiz.sum())
+                c, d = etiqueta[c], etiqueta[d]
+                externas = c != d
+                c, d, ids = c[externas], d[externas], ids[externas]
+
+                if al_ronda is not None:
+                    al_ronda(RondaBoruvka(ronda, nuevas, n_componentes))
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        elegidas = np.concatenate(elegidas) if elegidas else np.array([], dtype=np.int64)
+        return elegidas, w[elegidas].sum().item()
+    
+    @staticmethod
+    def componentes(grafo, fuertes=False):
+        """
+        Componentes del grafo en tiempo lineal (O(V + E))
+
+        fuertes: si es False, componentes débilmente conexas (BFS sin tener
+                 en cuenta el sentido de los arcos; en un grafo no dirigido
+                 son las componentes conexas); si es True, fuertemente
+                 conexas (Tarjan iterativo)
+
+        Retorna: lista de componentes, cada una como lista de nodos
+        """
+        csr = GrafoCSR.desde_dict(grafo)
+        if fuertes:
+            etiqueta, n_componentes = _componentes_fuertes_csr(csr)
+        else:
+            etiqueta, n_componentes = _componentes_debiles_csr(csr)
+        return [[csr.nodos[i] for i in indices.tolist()]
+                for indices in _miembros_componentes(etiqueta, n_componentes)]
+
+    @staticmethod
+    def bosque_minimo(grafo, n_procesos=None):
+        """
+        Bosque de expansión mínima de un grafo no dirigido, por componente
+
+        Las componentes conexas se etiquetan con un BFS y cada una se resuelve
+        con Prim (heap d-ario indexado); con más de un proceso y más de una
+        componente con aristas, las componentes se reparten en un pool.
+
+        Retorna: lista de aristas (u, v, peso) agrupadas por componente, peso
+                 total y la lista de componentes (listas de nodos)
+        """
+        n_procesos = n_procesos or os.cpu_count() or 1
+        componentes = AlgoritmosGrafos.componentes(grafo)
+        subgrafos = [{nodo: grafo.get(nodo, {}) for nodo in componente}
+                     for componente in componentes if len(componente) > 1]
+
+        pool = None
+        if n_procesos > 1 and len(subgrafos) > 1:
+            pool = Pool(min(n_procesos, len(subgrafos)))
+            resultados = pool.imap(_tarea_mst_componente, subgrafos)
+        else:
+            resultados = map(_tarea_mst_componente, subgrafos)
+
+        try:
+            mst = [arista for parcial in resultados for arista in parcial]
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        return mst, sum(peso for _, _, peso in mst), componentes
+    
+    @staticmethod
+    def pasos_prim(grafo, inicio=0):
+        """
+        Prim como generador de eventos PasoPrim
+
+        El primer evento es de tipo 'inicial' (nodo = inicio, nuevas_aristas =
+        candidatos iniciales); después hay uno por arista extraída de la cola,
+        de tipo 'aceptada' (nodo = nodo agregado) o 'rechazada' (su destino ya
+        estaba visitado). Al terminar retorna (mst, peso_total); para
+        obtenerlo usar AlgoritmosGrafos.resultado(...).
         """
-        print("\n=== ALGORITMO DE PRIM ===\n")
-        print(f"Nodo inicial: {inicio}\n")
-        
         visitados = {inicio}
         mst = []
         peso_total = 0
-        iteraciones = []
         
         # Cola de prioridad: (peso, nodo_origen, nodo_destino)
         heap = []
         for vecino, peso in grafo[inicio].items():
             heapq.heappush(heap, (peso, inicio, vecino))
         
-        # Guardar estado inicial
-        iteraciones.append({
-            'num': 0,
-            'tipo': 'inicial',
-            'nodo_inicio': inicio,
-            'visitados': set(visitados),
-            'mst': [],
-            'peso_total': 0,
-            'candidatos': [(p, u, v) for p, u, v in heap]
-        })
-        
-        print("Proceso de construcción:")
-        iteracion = 1
+        yield PasoPrim(0, 'inicial', inicio, None, [(u, v, p) for p, u, v in heap], 0)
         
+        # Las aristas rechazadas no avanzan el número de iteración
+        iteracion = 1
         while heap and len(visitados) < len(grafo):
             peso, u, v = heapq.heappop(heap)
             
             if v in visitados:
-                print(f"  {iteracion}. {u} - {v} (peso: {peso}) - Ya visitado, se omite")
-                iteraciones.append({
-                    'num': iteracion,
-                    'tipo': 'rechazada',
-                    'arista': (u, v, peso),
-                    'razon': 'nodo ya visitado',
-                    'visitados': set(visitados),
-                    'mst': list(mst),
-                    'peso_total': peso_total
-                })
+                yield PasoPrim(iteracion, 'rechazada', v, (u, v, peso), (), peso_total)
                 continue
             
             visitados.add(v)
             mst.append((u, v, peso))
             peso_total += peso
-            print(f"  {iteracion}. ✓ Agregada: {u} - {v} (peso: {peso})")
             
             # Agregar nuevas aristas
             nuevas_aristas = []
@@ -163,34 +2697,98 @@ class AlgoritmosGrafos:
                     heapq.heappush(heap, (peso_vecino, v, vecino))
                     nuevas_aristas.append((v, vecino, peso_vecino))
             
-            iteraciones.append({
-                'num': iteracion,
-                'tipo': 'aceptada',
-                'arista': (u, v, peso),
-                'visitados': set(visitados),
-                'mst': list(mst),
-                'peso_total': peso_total,
-                'nuevas_aristas': nuevas_aristas
-            })
-            
+            yield PasoPrim(iteracion, 'aceptada', v, (u, v, peso), nuevas_aristas, peso_total)
             iteracion += 1
         
+        return mst, peso_total
+    
+    @staticmethod
+    def prim(grafo, inicio=0, traza=True):
+        """
+        Algoritmo de Prim para encontrar el árbol de expansión mínima
+        
+        grafo: diccionario {nodo: {vecino: peso}}
+        inicio: nodo inicial
+        traza: si es True se usa la cola perezosa con heapq y se imprime y
+               guarda cada iteración (salida académica); si es False se usa
+               el heap d-ario indexado (a lo sumo V entradas) sin registrar pasos
+        
+        Retorna: lista de aristas del MST, peso total, iteraciones (TrazaPrim;
+        lista vacía si traza es False; para recorrer los pasos sin guardarlos,
+        usar pasos_prim)
+        """
+        print("\n=== ALGORITMO DE PRIM ===\n")
+        print(f"Nodo inicial: {inicio}\n")
+        
+        if not traza:
+            mst = AlgoritmosGrafos._prim_heap_indexado(grafo, inicio)
+            peso_total = sum(peso for _, _, peso in mst)
+            print(f"Peso total del MST: {peso_total}")
+            return mst, peso_total, []
+        
+        iteraciones = TrazaPrim()
+        
+        def registrar(paso):
+            iteraciones.registrar(paso)
+            if paso.tipo == 'inicial':
+                print("Proceso de construcción:")
+                return
+            
+            u, v, peso = paso.arista
+            if paso.tipo == 'rechazada':
+                print(f"  {paso.num}. {u} - {v} (peso: {peso}) - Ya visitado, se omite")
+            else:
+                print(f"  {paso.num}. ✓ Agregada: {u} - {v} (peso: {peso})")
+        
+        mst, peso_total = AlgoritmosGrafos.resultado(AlgoritmosGrafos.pasos_prim(grafo, inicio), registrar)
+        
         print(f"\nPeso total del MST: {peso_total}")
         return mst, peso_total, iteraciones
     
     @staticmethod
-    def dijkstra(grafo, origen):
+    def _prim_heap_indexado(grafo, inicio, d=4):
+        """
+        Prim con un HeapDarioIndexado, recorriendo el diccionario del grafo
+
+        Cada nodo fuera del árbol tiene una sola entrada en el heap, con el
+        peso de la arista más liviana que lo une al árbol; al aparecer una
+        mejor se baja su clave en lugar de apilar otra entrada. No se arma
+        un CSR para no duplicar en memoria los arcos del grafo.
+
+        Retorna: lista de aristas (u, v, peso) del MST en orden de incorporación
+        """
+        nodos = list(grafo)
+        nodo_a_idx = {nodo: i for i, nodo in enumerate(nodos)}
+        origen = nodo_a_idx[inicio]
+
+        en_arbol = bytearray(len(nodos))
+        padre = [-1] * len(nodos)
+        heap = HeapDarioIndexado(len(nodos), d)
+        heap.insertar_o_disminuir(origen, 0)
+        insertar_o_disminuir, extraer_min = heap.insertar_o_disminuir, heap.extraer_min
+
+        mst = []
+        while heap:
+            u, peso = extraer_min()
+            en_arbol[u] = 1
+            if u != origen:
+                mst.append((nodos[padre[u]], nodos[u], peso))
+            for vecino, peso_vecino in grafo[nodos[u]].items():
+                v = nodo_a_idx[vecino]
+                if not en_arbol[v] and insertar_o_disminuir(v, peso_vecino):
+                    padre[v] = u
+
+        return mst
+    
+    @staticmethod
+    def pasos_dijkstra(grafo, origen):
         """
-        Algoritmo de Dijkstra para encontrar rutas más cortas desde un origen
-        
-        grafo: diccionario {nodo: {vecino: peso}}
-        origen: nodo origen
-        
-        Retorna: diccionario de distancias, diccionario de predecesores, lista de iteraciones
+        Dijkstra como generador de eventos PasoDijkstra, uno por nodo visitado
+
+        Cada evento trae solo las distancias que se actualizaron en ese paso
+        (ActualizacionDijkstra). Al terminar retorna (distancias,
+        predecesores); para obtenerlo usar AlgoritmosGrafos.resultado(...).
         """
-        print("\n=== ALGORITMO DE DIJKSTRA ===\n")
-        print(f"Nodo origen: {origen}\n")
-        
         distancias = {nodo: float('inf') for nodo in grafo}
         distancias[origen] = 0
         predecesores = {nodo: None for nodo in grafo}
@@ -198,11 +2796,6 @@ class AlgoritmosGrafos:
         
         # Cola de prioridad: (distancia, nodo)
         heap = [(0, origen)]
-        
-        # Lista para almacenar las iteraciones
-        iteraciones = []
-        
-        print("Proceso de exploración:")
         iteracion = 1
         
         while heap:
@@ -212,8 +2805,6 @@ class AlgoritmosGrafos:
                 continue
             
             visitados.add(nodo_actual)
-            print(f"\n{iteracion}. Visitando nodo {nodo_actual} (distancia: {dist_actual})")
-            
             actualizaciones = []
             
             # Explorar vecinos
@@ -222,31 +2813,194 @@ class AlgoritmosGrafos:
                     nueva_dist = dist_actual + peso
                     
                     if nueva_dist < distancias[vecino]:
-                        print(f"   → Actualizando {vecino}: {distancias[vecino]} → {nueva_dist}")
-                        dist_anterior = distancias[vecino]
+                        actualizaciones.append(ActualizacionDijkstra(vecino, distancias[vecino], nueva_dist, peso))
                         distancias[vecino] = nueva_dist
                         predecesores[vecino] = nodo_actual
                         heapq.heappush(heap, (nueva_dist, vecino))
-                        
-                        actualizaciones.append({
-                            'vecino': vecino,
-                            'dist_anterior': dist_anterior,
-                            'dist_nueva': nueva_dist,
-                            'peso_arista': peso
-                        })
+            
+            yield PasoDijkstra(iteracion, nodo_actual, dist_actual, actualizaciones)
+            iteracion += 1
+        
+        return distancias, predecesores
+    
+    @staticmethod
+    def dijkstra(grafo, origen, registrar_pasos=False):
+        """
+        Algoritmo de Dijkstra para encontrar rutas más cortas desde un origen
+        
+        grafo: diccionario {nodo: {vecino: peso}}
+        origen: nodo origen
+        registrar_pasos: si es True se imprime y guarda el estado de cada
+                         iteración (salida académica, O(V²) en memoria); si
+                         es False se usa el núcleo CSR con arreglos planos
+        
+        Retorna: diccionario de distancias, diccionario de predecesores, lista de iteraciones
+                 (vacía si registrar_pasos es False; para recorrer los pasos
+                 sin materializarlos, usar pasos_dijkstra)
+        """
+        if not registrar_pasos:
+            return AlgoritmosGrafos._dijkstra_sin_pasos(grafo, origen)
+        
+        print("\n=== ALGORITMO DE DIJKSTRA ===\n")
+        print(f"Nodo origen: {origen}\n")
+        
+        distancias_actuales = {nodo: float('inf') for nodo in grafo}
+        distancias_actuales[origen] = 0
+        visitados = set()
+        iteraciones = []
+        
+        print("Proceso de exploración:")
+        
+        def registrar(paso):
+            visitados.add(paso.nodo_actual)
+            print(f"\n{paso.num}. Visitando nodo {paso.nodo_actual} (distancia: {paso.dist_actual})")
+            for act in paso.actualizaciones:
+                print(f"   → Actualizando {act.vecino}: {act.dist_anterior} → {act.dist_nueva}")
+                distancias_actuales[act.vecino] = act.dist_nueva
             
             # Guardar estado de esta iteración
             iteraciones.append({
-                'num': iteracion,
-                'nodo_actual': nodo_actual,
-                'dist_actual': dist_actual,
-                'distancias': dict(distancias),
+                'num': paso.num,
+                'nodo_actual': paso.nodo_actual,
+                'dist_actual': paso.dist_actual,
+                'distancias': dict(distancias_actuales),
                 'visitados': set(visitados),
-                'actualizaciones': actualizaciones
+                'actualizaciones': [act._asdict() for act in paso.actualizaciones]
             })
-            
-            iteracion += 1
         
+        distancias, predecesores = AlgoritmosGrafos.resultado(
+            AlgoritmosGrafos.pasos_dijkstra(grafo, origen), registrar)
+        
+        AlgoritmosGrafos._imprimir_resumen_dijkstra(distancias, predecesores, origen)
+        
+        return distancias, predecesores, iteraciones
+    
+    @staticmethod
+    def ruta_mas_corta(grafo, origen, destino, bidireccional=True):
+        """
+        Camino más corto entre un par de nodos (Dijkstra punto a punto)
+
+        grafo: diccionario {nodo: {vecino: peso}} o GrafoCSR (conviene pasar
+               el mismo GrafoCSR en consultas repetidas: el grafo invertido
+               de la búsqueda bidireccional se construye una sola vez)
+        bidireccional: si es True busca a la vez desde el origen y hacia el
+                       destino; si es False corta la búsqueda desde el origen
+                       apenas asienta el destino
+
+        Retorna: distancia (∞ si no hay camino), camino como lista de nodos
+                 (vacía si no hay camino) y cantidad de nodos asentados
+        """
+        csr = grafo if isinstance(grafo, GrafoCSR) else GrafoCSR.desde_dict(grafo)
+        i, j = csr.nodo_a_idx[origen], csr.nodo_a_idx[destino]
+
+        if bidireccional:
+            distancia, camino, asentados = _dijkstra_bidireccional_csr(
+                csr.listas(), csr.invertido().listas(), i, j)
+        else:
+            indptr, indices, pesos = csr.listas()
+            distancia, predecesores, asentados = _dijkstra_punto_a_punto_csr(indptr, indices, pesos, i, j)
+            camino = []
+            if distancia != float('inf'):
+                camino = [j]
+                while camino[-1] != i:
+                    camino.append(predecesores[camino[-1]])
+                camino.reverse()
+
+        return distancia, [csr.nodos[k] for k in camino], asentados
+
+    @staticmethod
+    def k_rutas_mas_cortas(grafo, origen, destino, k=5, presupuesto=PRESUPUESTO_K_RUTAS):
+        """
+        Las k rutas simples (sin nodos repetidos) más cortas entre un par de
+        nodos, con el algoritmo de Yen
+
+        grafo: diccionario {nodo: {vecino: peso}} o GrafoCSR
+        k: cantidad de rutas alternativas buscadas
+        presupuesto: tope de nodos asentados por consulta; si se alcanza se
+                     devuelven las rutas encontradas hasta ese momento
+
+        Retorna: lista de (distancia, camino como lista de nodos) ordenada
+                 por distancia (puede tener menos de k rutas) y True si la
+                 búsqueda terminó dentro del presupuesto
+        """
+        csr = grafo if isinstance(grafo, GrafoCSR) else GrafoCSR.desde_dict(grafo)
+        rutas, completa = _k_rutas_yen_csr(csr.listas(), csr.invertido().listas(),
+                                           csr.nodo_a_idx[origen], csr.nodo_a_idx[destino], k, presupuesto)
+        return [(distancia, [csr.nodos[i] for i in camino]) for distancia, camino in rutas], completa
+
+    @staticmethod
+    def dijkstra_multiorigen(grafo, origenes, n_procesos=None):
+        """
+        Árboles de caminos más cortos desde muchos orígenes sobre el mismo grafo
+
+        El grafo se compacta en CSR una sola vez y se envía una sola vez a
+        cada proceso del pool; los orígenes se reparten en grupos. Con pesos
+        enteros chicos se usan los cubos de Dial en lugar de heapq.
+
+        grafo: diccionario {nodo: {vecino: peso}} o GrafoCSR
+        origenes: lista de nodos origen
+        n_procesos: procesos del pool (por defecto, todos los núcleos)
+
+        Retorna: matriz de distancias len(origenes) × n (∞ = no alcanzable),
+                 matriz de predecesores por índice (-1 = ninguno) y la lista
+                 de nodos en el orden de las columnas
+        """
+        n_procesos = n_procesos or os.cpu_count() or 1
+        csr = grafo if isinstance(grafo, GrafoCSR) else GrafoCSR.desde_dict(grafo)
+        fuentes = [csr.nodo_a_idx[origen] for origen in origenes]
+        print(f"\n=== DIJKSTRA MULTIORIGEN ({len(fuentes)} orígenes, {csr.n} nodos, {n_procesos} procesos) ===\n")
+
+        D = np.empty((len(fuentes), csr.n))
+        P = np.empty((len(fuentes), csr.n), dtype=np.int32)
+        por_grupo = max(1, -(-len(fuentes) // (n_procesos * 4)))
+        grupos = [fuentes[inicio:inicio + por_grupo] for inicio in range(0, len(fuentes), por_grupo)]
+        indptr, indices, pesos = csr.listas()
+        peso_maximo = csr.peso_maximo_dial
+        if peso_maximo is not None:
+            pesos = csr.pesos_enteros()
+        fila = 0
+        for grupo, distancias, predecesores in AlgoritmosGrafos._dijkstra_en_pool(
+                (indptr, indices, pesos, None, peso_maximo), grupos, n_procesos):
+            D[fila:fila + len(grupo)] = distancias
+            P[fila:fila + len(grupo)] = predecesores
+            fila += len(grupo)
+
+        return D, P, csr.nodos
+
+    @staticmethod
+    def _dijkstra_sin_pasos(grafo, origen):
+        """
+        Dijkstra sobre el grafo compactado en CSR, sin registrar iteraciones
+
+        Las etiquetas se internan como enteros, la búsqueda trabaja con
+        arreglos planos de distancias y predecesores y al final los
+        resultados se traducen de vuelta a etiquetas. Si todos los pesos son
+        enteros no negativos hasta MAX_PESO_DIAL, la cola de prioridad son
+        los cubos de Dial en lugar de heapq.
+        """
+        print("\n=== ALGORITMO DE DIJKSTRA ===\n")
+        print(f"Nodo origen: {origen}\n")
+
+        csr = GrafoCSR.desde_dict(grafo)
+        indptr, indices, pesos = csr.listas()
+        peso_maximo = csr.peso_maximo_dial
+        if peso_maximo is None:
+            dist, pred = _dijkstra_csr(indptr, indices, pesos, csr.nodo_a_idx[origen])
+        else:
+            dist, pred = _dijkstra_dial_csr(indptr, indices, csr.pesos_enteros(),
+                                            csr.nodo_a_idx[origen], peso_maximo)
+
+        nodos = csr.nodos
+        distancias = dict(zip(nodos, dist))
+        predecesores = {nodo: None if p < 0 else nodos[p] for nodo, p in zip(nodos, pred)}
+
+        AlgoritmosGrafos._imprimir_resumen_dijkstra(distancias, predecesores, origen)
+
+        return distancias, predecesores, []
+    
+    @staticmethod
+    def _imprimir_resumen_dijkstra(distancias, predecesores, origen):
+        """Imprime las distancias mínimas y los caminos desde el origen"""
         print("\n" + "=" * 50)
         print("DISTANCIAS MÍNIMAS DESDE EL ORIGEN")
         print("=" * 50)
@@ -256,8 +3010,6 @@ class AlgoritmosGrafos:
             else:
                 camino = AlgoritmosGrafos._reconstruir_camino(predecesores, origen, nodo)
                 print(f"  {origen} → {nodo}: {distancias[nodo]} | Camino: {' → '.join(map(str, camino))}")
-        
-        return distancias, predecesores, iteraciones
     
     @staticmethod
     def _reconstruir_camino(predecesores, origen, destino):
@@ -274,14 +3026,40 @@ class AlgoritmosGrafos:
         return camino[::-1]
     
     @staticmethod
-    def floyd_warshall(grafo):
+    def floyd_warshall(grafo, motor='auto', n_procesos=None, tam_bloque=TAM_BLOQUE_FLOYD):
         """
         Algoritmo de Floyd-Warshall (implementación estilo TORA)
-        
+
         grafo: diccionario {nodo: {vecino: peso}}
-        
-        Retorna: matriz de distancias, matriz de predecesores, lista de iteraciones
+        motor: 'python' (triple bucle con salida paso a paso), 'numpy'
+               (cada paso k como una operación min-plus vectorizada),
+               'bloques' (por bloques en varios procesos con memoria
+               compartida), 'johnson' (Bellman-Ford + Dijkstra desde cada
+               nodo, para grafos dispersos) o 'auto' (elige según la
+               cantidad de nodos y la densidad de arcos)
+        n_procesos: procesos de los motores 'bloques' y 'johnson'
+                    (por defecto, todos los núcleos)
+        tam_bloque: lado de cada bloque del motor 'bloques'
+
+        Con ciclos negativos ningún motor lanza error: el ciclo se reconoce
+        porque la matriz de distancias tiene entradas negativas en la
+        diagonal. Los valores de los pares afectados no son distancias
+        válidas y pueden variar entre motores. El motor 'johnson' detecta el
+        ciclo con Bellman-Ford y resuelve con el motor 'numpy'.
+
+        Retorna: matriz de distancias, matriz de predecesores, nodos, nodo_a_idx
+                 y la traza de iteraciones (TrazaFloydWarshall; None con los
+                 motores 'bloques' y 'johnson' por encima de
+                 MAX_NODOS_RESUMEN_FLOYD nodos)
         """
+        motor = AlgoritmosGrafos._seleccionar_motor_floyd(grafo, motor)
+        if motor == 'numpy':
+            return AlgoritmosGrafos._floyd_warshall_numpy(grafo)
+        if motor == 'bloques':
+            return AlgoritmosGrafos._floyd_warshall_bloques(grafo, n_procesos, tam_bloque)
+        if motor == 'johnson':
+            return AlgoritmosGrafos._floyd_warshall_johnson(grafo, n_procesos)
+
         print("\n=== ALGORITMO DE FLOYD-WARSHALL ===\n")
         
         nodos = sorted(grafo.keys())
@@ -292,9 +3070,6 @@ class AlgoritmosGrafos:
         D = [[float('inf')] * n for _ in range(n)]
         P = [[None] * n for _ in range(n)]  # Matriz de PREDECESORES
         
-        # Lista para almacenar las iteraciones
-        iteraciones = []
-        
         # Paso 1: Inicializar D y P
         # D[i][i] = 0 para todo i
         for i in range(n):
@@ -318,20 +3093,14 @@ class AlgoritmosGrafos:
         print("Matriz de distancias inicial:")
         AlgoritmosGrafos._imprimir_matriz(D, nodos)
         
-        # Guardar estado inicial (K=0)
-        iteraciones.append({
-            'k': 0,
-            'nodo_intermedio': 'Inicial',
-            'matriz_d': [row[:] for row in D],
-            'matriz_s': [row[:] for row in P],  # Ahora es matriz de predecesores
-            'cambios': []
-        })
+        # Guardar estado inicial (K=0); cada paso k guarda solo sus cambios
+        iteraciones = TrazaFloydWarshall(nodos, D, AlgoritmosGrafos._indices_predecesores(P, nodo_a_idx))
         
         # Paso 2: Aplicar algoritmo de Floyd-Warshall
         # Para cada nodo intermedio k
         for k in range(n):
             print(f"\nIteración {k+1} (usando nodo intermedio: {nodos[k]}):")
-            cambios = []
+            filas, columnas, anteriores, nuevas = [], [], [], []
             
             # Para cada par de nodos (i, j)
             for i in range(n):
@@ -340,44 +3109,651 @@ class AlgoritmosGrafos:
                     if D[i][k] != float('inf') and D[k][j] != float('inf'):
                         nueva_dist = D[i][k] + D[k][j]
                         if nueva_dist < D[i][j]:
-                            dist_anterior = D[i][j]
+                            filas.append(i)
+                            columnas.append(j)
+                            anteriores.append(D[i][j])
+                            nuevas.append(nueva_dist)
                             D[i][j] = nueva_dist
                             P[i][j] = P[k][j]  # El predecesor de j en i→j es el mismo que k→j
-                            cambios.append({
-                                'origen': nodos[i],
-                                'destino': nodos[j],
-                                'dist_anterior': dist_anterior,
-                                'dist_nueva': D[i][j],
-                                'via': nodos[k]
-                            })
             
             AlgoritmosGrafos._imprimir_matriz(D, nodos)
             
-            # Guardar estado de esta iteración
-            iteraciones.append({
-                'k': k + 1,
-                'nodo_intermedio': nodos[k],
-                'matriz_d': [row[:] for row in D],
-                'matriz_s': [row[:] for row in P],  # Ahora es matriz de predecesores
-                'cambios': cambios
-            })
-        
+            # Guardar solo las celdas modificadas en esta iteración
+            predecesores = [nodo_a_idx[P[i][j]] for i, j in zip(filas, columnas)]
+            iteraciones.registrar(filas, columnas, anteriores, nuevas, predecesores)
+
+        AlgoritmosGrafos._imprimir_resumen_floyd(D, AlgoritmosGrafos._indices_predecesores(P, nodo_a_idx), nodos)
+
+        return D, P, nodos, nodo_a_idx, iteraciones
+
+    @staticmethod
+    def apsp_por_componentes(grafo, n_procesos=None):
+        """
+        Caminos más cortos entre todos los pares, por componente débilmente conexa
+
+        Las componentes se etiquetan con un BFS (O(V + E)) y cada una se
+        resuelve con Floyd-Warshall min-plus de NumPy; con más de un proceso
+        y más de una componente, se reparten en un pool (las más grandes
+        primero). Los bloques entre componentes distintas, que son todos ∞,
+        nunca se construyen.
+
+        Nota: las componentes fuertemente conexas no sirven para esta
+        partición, porque puede haber caminos de una a otra.
+
+        Retorna: un APSPPorComponentes
+        """
+        n_procesos = n_procesos or os.cpu_count() or 1
+        nodos = sorted(grafo.keys())
+        csr = GrafoCSR.desde_dict(grafo, nodos)
+        etiqueta, n_componentes = _componentes_debiles_csr(csr)
+        miembros = _miembros_componentes(etiqueta, n_componentes)
+        print(f"\n=== CAMINOS MÁS CORTOS POR COMPONENTE ({csr.n} nodos, "
+              f"{n_componentes} componentes, {n_procesos} procesos) ===\n")
+
+        posicion = np.empty(csr.n, dtype=np.int64)
+        for indices in miembros:
+            posicion[indices] = np.arange(len(indices))
+
+        # Arcos agrupados por la componente de su origen, en índices locales
+        origenes = csr.origenes()
+        etiqueta = np.asarray(etiqueta, dtype=np.int64)
+        orden = np.argsort(etiqueta[origenes], kind='stable')
+        cortes = np.cumsum(np.bincount(etiqueta[origenes], minlength=n_componentes))[:-1]
+        tareas = []
+        for c, arcos in enumerate(np.split(orden, cortes)):
+            tareas.append((c, len(miembros[c]), posicion[origenes[arcos]],
+                           posicion[csr.indices[arcos]], csr.pesos[arcos]))
+        tareas.sort(key=lambda tarea: -tarea[1])
+
+        pool = None
+        if n_procesos > 1 and sum(tarea[1] > 1 for tarea in tareas) > 1:
+            pool = Pool(n_procesos)
+            resultados = pool.imap_unordered(_tarea_apsp_componente, tareas)
+        else:
+            resultados = map(_tarea_apsp_componente, tareas)
+
+        bloques = [None] * n_componentes
+        try:
+            for c, D, P in resultados:
+                bloques[c] = (D, P)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        celdas = sum(len(indices) ** 2 for indices in miembros)
+        print(f"Celdas guardadas: {celdas} de {csr.n ** 2} de la matriz completa")
+        return APSPPorComponentes(nodos, miembros, bloques)
+
+    @staticmethod
+    def apsp_a_disco(grafo, directorio, dtype=np.float64, n_procesos=None, filas_por_bloque=256):
+        """
+        Calcula los caminos más cortos entre todos los pares directamente a disco
+
+        Usa el algoritmo de Johnson y escribe cada bloque de filas en un
+        AlmacenAPSP apenas se calcula, de modo que nunca se arma la matriz
+        n×n en memoria. Sirve para grafos de decenas de miles de nodos.
+
+        dtype: np.float64 o np.float32 (la mitad de espacio en disco)
+
+        Retorna: el AlmacenAPSP creado
+        """
+        n_procesos = n_procesos or os.cpu_count() or 1
+        nodos = sorted(grafo.keys())
+        csr = GrafoCSR.desde_dict(grafo, nodos)
+        print(f"\n=== CAMINOS MÁS CORTOS A DISCO (Johnson, {csr.n} nodos, {n_procesos} procesos) ===\n")
+
+        almacen = AlmacenAPSP.crear(directorio, nodos, dtype)
+        for inicio, distancias, predecesores in AlgoritmosGrafos._filas_johnson(csr, n_procesos, filas_por_bloque):
+            almacen.distancias[inicio:inicio + len(distancias)] = distancias
+            almacen.predecesores[inicio:inicio + len(predecesores)] = predecesores
+        almacen.sincronizar()
+
+        print(f"Matrices guardadas en: {directorio}")
+        return almacen
+
+    @staticmethod
+    def actualizar_floyd_warshall(D, P, nodos, nodo_a_idx, grafo, cambios):
+        """
+        Actualiza un resultado previo de Floyd-Warshall tras editar algunos arcos
+
+        D, P, nodos, nodo_a_idx: resultado previo de floyd_warshall
+        grafo: diccionario {nodo: {vecino: peso}} YA modificado (mismos nodos)
+        cambios: lista de tuplas (u, v, peso_anterior, peso_nuevo), con None
+                 como peso cuando el arco no existe (ver diferencias_arcos)
+
+        - Inserción o disminución de peso: se relajan todos los pares a
+          través del arco (u, v) en O(n²)
+        - Aumento de peso o eliminación: se recalculan solo las filas cuyo
+          árbol de caminos más cortos usa el arco
+
+        Si la edición crea un ciclo negativo se lanza ValueError; quien llama
+        debe recalcular todo con floyd_warshall. Las disminuciones se
+        verifican contra los caminos previos antes de recalcular filas, así
+        que también se lanza si un aumento de la misma edición rompe el
+        camino que cerraba el ciclo (recalcular todo sigue siendo correcto).
+
+        Retorna: matriz de distancias (ndarray), matriz de predecesores
+                 (etiquetas), lista de nodos cuyas filas se recalcularon
+        """
+        D = np.array(D, dtype=np.float64)
+        P = AlgoritmosGrafos._indices_predecesores(P, nodo_a_idx)
+
+        disminuciones = []
+        afectadas = np.zeros(len(nodos), dtype=bool)
+        for u, v, peso_anterior, peso_nuevo in cambios:
+            i_u, i_v = nodo_a_idx[u], nodo_a_idx[v]
+            if i_u == i_v:
+                continue
+            if peso_anterior is None or (peso_nuevo is not None and peso_nuevo < peso_anterior):
+                disminuciones.append((i_u, i_v, peso_nuevo))
+            elif peso_nuevo is None or peso_nuevo > peso_anterior:
+                # Filas cuyo camino hacia v llega por el arco (u, v)
+                afectadas |= (P[:, i_v] == i_u) & np.isfinite(D[:, i_v])
+
+        # Un ciclo negativo cerrado por una disminución se detecta antes de
+        # recalcular filas, que con pesos negativos usan Bellman-Ford
+        for i_u, i_v, peso in disminuciones:
+            if D[i_v, i_u] + peso < 0:
+                raise ValueError(f"El arco {nodos[i_u]}→{nodos[i_v]} forma un ciclo negativo")
+
+        # Primero los aumentos: las filas afectadas se recalculan sobre el grafo final
+        filas_recalculadas = np.flatnonzero(afectadas)
+        hay_negativos = any(peso < 0 for vecinos in grafo.values() for peso in vecinos.values())
+        for i in filas_recalculadas:
+            D[i], P[i] = AlgoritmosGrafos._caminos_desde_fila(grafo, nodos, nodo_a_idx, i, hay_negativos)
+
+        # Luego las disminuciones: D[i][j] = min(D[i][j], D[i][u] + w + D[v][j])
+        for i_u, i_v, peso in disminuciones:
+            if D[i_v, i_u] + peso < 0:
+                raise ValueError(f"El arco {nodos[i_u]}→{nodos[i_v]} forma un ciclo negativo")
+            via_arco = np.add.outer(D[:, i_u] + peso, D[i_v, :])
+            predecesores_v = P[i_v].copy()
+            predecesores_v[i_v] = i_u  # El predecesor de v en el camino nuevo es u
+            mejora = via_arco < D
+            np.copyto(D, via_arco, where=mejora)
+            np.copyto(P, predecesores_v, where=mejora)
+
+        print(f"\nActualización incremental: {len(cambios)} arcos modificados, "
+              f"{len(filas_recalculadas)} filas recalculadas")
+
+        return (D, AlgoritmosGrafos._etiquetar_predecesores(P, nodos),
+                [nodos[i] for i in filas_recalculadas])
+
+    @staticmethod
+    def diferencias_arcos(grafo_anterior, grafo_nuevo):
+        """
+        Compara dos grafos {nodo: {vecino: peso}} arco por arco
+
+        Retorna: lista de tuplas (u, v, peso_anterior, peso_nuevo) con None
+                 cuando el arco no existe en uno de los dos grafos
+        """
+        cambios = []
+        for u in set(grafo_anterior) | set(grafo_nuevo):
+            anteriores = grafo_anterior.get(u, {})
+            nuevos = grafo_nuevo.get(u, {})
+            for v in set(anteriores) | set(nuevos):
+                peso_anterior, peso_nuevo = anteriores.get(v), nuevos.get(v)
+                if peso_anterior != peso_nuevo:
+                    cambios.append((u, v, peso_anterior, peso_nuevo))
+        return cambios
+
+    @staticmethod
+    def _caminos_desde_fila(grafo, nodos, nodo_a_idx, i, hay_negativos=False):
+        """
+        Recalcula una fila de Floyd-Warshall con un camino más corto de origen único
+
+        Usa Dijkstra, o Bellman-Ford (con cola) si el grafo tiene pesos negativos;
+        si un nodo se relaja n veces hay un ciclo negativo alcanzable y se
+        lanza ValueError.
+        Retorna la fila de distancias y la de predecesores por índice con la
+        convención de floyd_warshall (-1 en la diagonal, i si no es alcanzable).
+        """
+        n = len(nodos)
+        distancias = np.full(n, np.inf)
+        predecesores = np.full(n, i, dtype=np.int32)
+        distancias[i] = 0.0
+        predecesores[i] = -1
+
+        if hay_negativos:
+            cola = deque([i])
+            en_cola = {i}
+            relajaciones = np.zeros(n, dtype=np.int64)
+            while cola:
+                actual = cola.popleft()
+                en_cola.discard(actual)
+                for vecino, peso in grafo[nodos[actual]].items():
+                    j = nodo_a_idx[vecino]
+                    if j != i and distancias[actual] + peso < distancias[j]:
+                        relajaciones[j] += 1
+                        if relajaciones[j] >= n:
+                            raise ValueError(f"Ciclo negativo alcanzable desde {nodos[i]}")
+                        distancias[j] = distancias[actual] + peso
+                        predecesores[j] = actual
+                        if j not in en_cola:
+                            cola.append(j)
+                            en_cola.add(j)
+        else:
+            heap = [(0.0, i)]
+            while heap:
+                dist_actual, actual = heapq.heappop(heap)
+                if dist_actual > distancias[actual]:
+                    continue
+                for vecino, peso in grafo[nodos[actual]].items():
+                    j = nodo_a_idx[vecino]
+                    if dist_actual + peso < distancias[j]:
+                        distancias[j] = dist_actual + peso
+                        predecesores[j] = actual
+                        heapq.heappush(heap, (distancias[j], j))
+
+        return distancias, predecesores
+
+    @staticmethod
+    def _seleccionar_motor_floyd(grafo, motor):
+        """Resuelve el motor 'auto' de Floyd-Warshall y valida el nombre recibido"""
+        if motor == 'auto':
+            n = len(grafo)
+            if n <= UMBRAL_FLOYD_NUMPY:
+                return 'python'
+            m = sum(len(vecinos) for vecinos in grafo.values())
+            if m < UMBRAL_DENSIDAD_JOHNSON * n * (n - 1):
+                return 'johnson'
+            if n >= UMBRAL_FLOYD_BLOQUES and (os.cpu_count() or 1) > 1:
+                return 'bloques'
+            return 'numpy'
+        if motor not in ('python', 'numpy', 'bloques', 'johnson'):
+            raise ValueError(f"Motor de Floyd-Warshall desconocido: {motor}")
+        return motor
+
+    @staticmethod
+    def _floyd_warshall_numpy(grafo):
+        """
+        Floyd-Warshall vectorizado con NumPy
+
+        D es una matriz float64 y los predecesores se guardan como índices
+        int32 (-1 = sin predecesor). Cada paso k se resuelve con una única
+        operación min-plus: D = min(D, D[:, k] + D[k, :]).
+
+        Retorna lo mismo que floyd_warshall: D (ndarray), P (etiquetas de nodos),
+        nodos, nodo_a_idx e iteraciones.
+        """
+        print("\n=== ALGORITMO DE FLOYD-WARSHALL (motor NumPy) ===\n")
+
+        nodos, nodo_a_idx, D, P = AlgoritmosGrafos._matrices_iniciales_floyd(grafo)
+        iteraciones = TrazaFloydWarshall(nodos, D, P)
+        _fw_minplus(D, P, iteraciones.registrar)
+
+        P_etiquetas = AlgoritmosGrafos._etiquetar_predecesores(P, nodos)
+        AlgoritmosGrafos._imprimir_resumen_floyd(D, P, nodos)
+
+        return D, P_etiquetas, nodos, nodo_a_idx, iteraciones
+
+    @staticmethod
+    def _floyd_warshall_bloques(grafo, n_procesos=None, tam_bloque=TAM_BLOQUE_FLOYD):
+        """
+        Floyd-Warshall por bloques (tiled) en varios núcleos
+
+        Las matrices D (float64) y P (int32) viven en memoria compartida y
+        cada fase del bloque k se reparte en un pool de procesos:
+          1. Bloque diagonal (k, k), en el proceso principal
+          2. Bloques de la fila y la columna k, independientes entre sí
+          3. El resto de los bloques, independientes entre sí
+
+        Este motor no registra iteraciones intermedias: la traza solo
+        contiene el estado inicial, y con más de MAX_NODOS_RESUMEN_FLOYD
+        nodos no se arma (se retorna None).
+
+        Retorna lo mismo que floyd_warshall.
+        """
+        n_procesos = n_procesos or os.cpu_count() or 1
+        print(f"\n=== ALGORITMO DE FLOYD-WARSHALL (motor por bloques, "
+              f"{n_procesos} procesos, bloque {tam_bloque}) ===\n")
+
+        nodos, nodo_a_idx, D, P = AlgoritmosGrafos._matrices_iniciales_floyd(grafo)
+        iteraciones = TrazaFloydWarshall(nodos, D, P) if len(nodos) <= MAX_NODOS_RESUMEN_FLOYD else None
+        D, P = AlgoritmosGrafos._floyd_bloques_matrices(D, P, n_procesos, tam_bloque)
+
+        P_etiquetas = AlgoritmosGrafos._etiquetar_predecesores(P, nodos)
+        AlgoritmosGrafos._imprimir_resumen_floyd(D, P, nodos)
+
+        return D, P_etiquetas, nodos, nodo_a_idx, iteraciones
+
+    @staticmethod
+    def _floyd_bloques_matrices(D, P, n_procesos, tam_bloque=TAM_BLOQUE_FLOYD):
+        """
+        Núcleo del motor por bloques sobre matrices ya inicializadas
+
+        Copia D y P a memoria compartida, ejecuta las tres fases por cada
+        bloque k y devuelve copias privadas de las matrices resultantes.
+        Con n_procesos=1 los bloques se procesan en el propio proceso.
+        """
+        n = D.shape[0]
+        bloques = [(inicio, min(inicio + tam_bloque, n)) for inicio in range(0, n, tam_bloque)]
+
+        shm_d = shared_memory.SharedMemory(create=True, size=max(D.nbytes, 1))
+        shm_p = shared_memory.SharedMemory(create=True, size=max(P.nbytes, 1))
+        D_comp = P_comp = pool = None
+        try:
+            D_comp = np.ndarray(D.shape, dtype=np.float64, buffer=shm_d.buf)
+            P_comp = np.ndarray(P.shape, dtype=np.int32, buffer=shm_p.buf)
+            D_comp[:] = D
+            P_comp[:] = P
+
+            if n_procesos > 1:
+                pool = Pool(n_procesos, initializer=_fw_adjuntar_memoria,
+                            initargs=(shm_d.name, shm_p.name, n))
+                ejecutar = lambda tareas: pool.starmap(_fw_procesar_bloque, tareas)
+            else:
+                _fw_compartido['D'], _fw_compartido['P'] = D_comp, P_comp
+                ejecutar = lambda tareas: [_fw_procesar_bloque(*t) for t in tareas]
+
+            for bk in bloques:
+                # Fase 1: bloque diagonal
+                _fw_relajar_bloque(D_comp, P_comp, bk, bk, bk)
+
+                # Fase 2: bloques de la fila k y de la columna k
+                otros = [b for b in bloques if b != bk]
+                ejecutar([(*bk, *b, *bk) for b in otros] + [(*b, *bk, *bk) for b in otros])
+
+                # Fase 3: bloques restantes (dependen solo de la fila y columna k)
+                ejecutar([(*bi, *bj, *bk) for bi in otros for bj in otros])
+
+            return D_comp.copy(), P_comp.copy()
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+            _fw_compartido.clear()
+            # Las vistas deben liberarse antes de cerrar la memoria compartida
+            D_comp = P_comp = None
+            for shm in (shm_d, shm_p):
+                shm.close()
+                shm.unlink()
+
+    @staticmethod
+    def _floyd_warshall_johnson(grafo, n_procesos=None):
+        """
+        Caminos más cortos entre todos los pares con el algoritmo de Johnson
+
+        1. Bellman-Ford desde un nodo virtual calcula potenciales h(v); si el
+           grafo tiene un ciclo negativo se resuelve con el motor NumPy, como
+           los demás motores (diagonal negativa)
+        2. Se re-ponderan los arcos: w'(u, v) = w(u, v) + h(u) - h(v) ≥ 0
+        3. Dijkstra desde cada nodo sobre w', repartiendo los orígenes en un
+           pool de procesos; las distancias se acumulan con los pesos originales
+
+        Conviene en grafos dispersos (O(n·m·log n) frente a O(n³)) y admite
+        pesos negativos sin ciclos negativos. La traza solo contiene el
+        estado inicial, y con más de MAX_NODOS_RESUMEN_FLOYD nodos no se arma
+        (se retorna None): no hay que construir las matrices iniciales densas.
+
+        Retorna lo mismo que floyd_warshall.
+        """
+        n_procesos = n_procesos or os.cpu_count() or 1
+        nodos = sorted(grafo.keys())
+        csr = GrafoCSR.desde_dict(grafo, nodos)
+        try:
+            h = AlgoritmosGrafos._potenciales_johnson(csr)
+        except ValueError:
+            print("\nEl grafo contiene un ciclo negativo: Johnson no aplica, se usa el motor NumPy")
+            return AlgoritmosGrafos._floyd_warshall_numpy(grafo)
+        print(f"\n=== CAMINOS MÁS CORTOS ENTRE TODOS LOS PARES (Johnson, {n_procesos} procesos) ===\n")
+
+        nodo_a_idx = {nodo: i for i, nodo in enumerate(nodos)}
+        iteraciones = None
+        if len(nodos) <= MAX_NODOS_RESUMEN_FLOYD:
+            _, _, D_inicial, P_inicial = AlgoritmosGrafos._matrices_iniciales_floyd(grafo)
+            iteraciones = TrazaFloydWarshall(nodos, D_inicial, P_inicial)
+        n = csr.n
+
+        D = np.empty((n, n))
+        P = np.empty((n, n), dtype=np.int32)
+        filas_por_grupo = -(-n // (n_procesos * 4)) if n else 1
+        for inicio, distancias, predecesores in AlgoritmosGrafos._filas_johnson(csr, n_procesos, filas_por_grupo, h):
+            D[inicio:inicio + len(distancias)] = distancias
+            P[inicio:inicio + len(predecesores)] = predecesores
+
+        P_etiquetas = AlgoritmosGrafos._etiquetar_predecesores(P, nodos)
+        AlgoritmosGrafos._imprimir_resumen_floyd(D, P, nodos)
+
+        return D, P_etiquetas, nodos, nodo_a_idx, iteraciones
+
+    @staticmethod
+    def _filas_johnson(csr, n_procesos, filas_por_grupo, h=None):
+        """
+        Genera las filas de distancias y predecesores de Johnson por grupos de orígenes
+
+        Los grupos se resuelven en un pool de procesos y se entregan en orden
+        como (primera fila, distancias, predecesores), sin armar la matriz
+        completa. Los predecesores siguen la convención de floyd_warshall.
+        h: potenciales ya calculados (por defecto, se calculan con
+           _potenciales_johnson, que lanza ValueError ante un ciclo negativo)
+        """
+        if h is None:
+            h = AlgoritmosGrafos._potenciales_johnson(csr)
+        pesos_reponderados = np.maximum(csr.pesos + h[csr.origenes()] - h[csr.indices], 0.0)
+
+        indptr, indices, pesos = csr.listas()
+        argumentos = (indptr, indices, pesos_reponderados.tolist(), pesos)
+        grupos = [list(range(inicio, min(inicio + filas_por_grupo, csr.n)))
+                  for inicio in range(0, csr.n, filas_por_grupo)]
+
+        for fuentes, distancias, predecesores in AlgoritmosGrafos._dijkstra_en_pool(argumentos, grupos, n_procesos):
+            # Convención TORA: P[i][j] = i si j no es alcanzable, -1 en la diagonal
+            np.copyto(predecesores, np.array(fuentes, dtype=np.int32)[:, None],
+                      where=np.isinf(distancias))
+            yield fuentes[0], distancias, predecesores
+
+    @staticmethod
+    def _dijkstra_en_pool(argumentos, grupos, n_procesos):
+        """
+        Resuelve Dijkstra desde cada grupo de fuentes en un pool de procesos
+
+        argumentos: (indptr, indices, pesos, pesos_reales[, peso_maximo]) como
+                    listas; se envían una sola vez a cada proceso, en su
+                    inicializador (ver _csr_inicializar)
+        grupos: listas de fuentes (índices); cada una es una tarea del pool
+
+        Genera (fuentes, distancias, predecesores) por grupo, en orden.
+        """
+        pool = None
+        if n_procesos > 1 and len(grupos) > 1:
+            pool = Pool(n_procesos, initializer=_csr_inicializar, initargs=argumentos)
+            resultados = pool.imap(_csr_dijkstra_fuentes, grupos)
+        else:
+            _csr_inicializar(*argumentos)
+            resultados = map(_csr_dijkstra_fuentes, grupos)
+
+        try:
+            for fuentes, (distancias, predecesores) in zip(grupos, resultados):
+                yield fuentes, distancias, predecesores
+        finally:
+            if pool is not None:
+                pool.terminate()
+            _csr_compartido.clear()
+
+    @staticmethod
+    def _potenciales_johnson(csr):
+        """
+        Bellman-Ford vectorizado desde un nodo virtual unido a todos con peso 0
+
+        Retorna el arreglo de potenciales h (ceros si no hay pesos negativos).
+        Lanza ValueError si el grafo contiene un ciclo negativo.
+        """
+        h = np.zeros(csr.n)
+        if csr.m == 0 or csr.pesos.min() >= 0:
+            return h
+
+        origenes = csr.origenes()
+        for _ in range(csr.n):
+            nuevo = h.copy()
+            np.minimum.at(nuevo, csr.indices, h[origenes] + csr.pesos)
+            if np.array_equal(nuevo, h):
+                return h
+            h = nuevo
+        raise ValueError("El grafo contiene un ciclo negativo")
+
+    @staticmethod
+    def _matrices_iniciales_floyd(grafo):
+        """
+        Construye las matrices iniciales de Floyd-Warshall como arreglos NumPy
+
+        Retorna: nodos ordenados, nodo_a_idx, D (float64) y P (índices int32,
+        -1 = sin predecesor)
+        """
+        nodos = sorted(grafo.keys())
+        n = len(nodos)
+        nodo_a_idx = {nodo: i for i, nodo in enumerate(nodos)}
+
+        # D[i][i] = 0, infinito si no hay arista directa
+        D = np.full((n, n), np.inf)
+        np.fill_diagonal(D, 0.0)
+        for nodo_i, vecinos in grafo.items():
+            i = nodo_a_idx[nodo_i]
+            for nodo_j, peso in vecinos.items():
+                j = nodo_a_idx.get(nodo_j)
+                if j is not None and j != i:
+                    D[i, j] = peso
+
+        # P[i][j] = i (estándar TORA), sin predecesor en la diagonal
+        P = np.repeat(np.arange(n, dtype=np.int32)[:, None], n, axis=1)
+        np.fill_diagonal(P, -1)
+
+        return nodos, nodo_a_idx, D, P
+
+    @staticmethod
+    def _etiquetar_predecesores(P, nodos):
+        """Convierte una matriz de predecesores por índice (-1 = ninguno) en etiquetas de nodos"""
+        etiquetas = np.empty(len(nodos) + 1, dtype=object)
+        etiquetas[:len(nodos)] = nodos
+        etiquetas[-1] = None  # El índice -1 apunta a esta posición
+        return etiquetas[P].tolist()
+
+    @staticmethod
+    def _indices_predecesores(P, nodo_a_idx):
+        """Convierte una matriz de predecesores con etiquetas en índices int32 (-1 = ninguno)"""
+        return np.array([[-1 if p is None else nodo_a_idx[p] for p in fila] for fila in P],
+                        dtype=np.int32).reshape(len(P), len(P))
+
+    @staticmethod
+    def _imprimir_resumen_floyd(D, P, nodos, filas_por_bloque=16):
+        """
+        Imprime la matriz final y los caminos más cortos de Floyd-Warshall (P por índices)
+
+        Los caminos se extraen e imprimen por bloques de orígenes, así que en
+        memoria solo están los del bloque en curso. Con más de
+        MAX_NODOS_RESUMEN_FLOYD nodos no se imprime nada de esto: los caminos
+        se consultan con extraer_caminos o AlmacenAPSP.
+        """
+        n = len(nodos)
+        if n > MAX_NODOS_RESUMEN_FLOYD:
+            print(f"\nResumen omitido ({n} nodos > {MAX_NODOS_RESUMEN_FLOYD}): la matriz de "
+                  f"distancias y los caminos quedan disponibles en el resultado")
+            return
+
         print("\n" + "=" * 50)
         print("MATRIZ DE DISTANCIAS FINAL")
         print("=" * 50)
         AlgoritmosGrafos._imprimir_matriz(D, nodos)
-        
+
         print("\n" + "=" * 50)
         print("CAMINOS MÁS CORTOS")
         print("=" * 50)
-        for i, origen in enumerate(nodos):
-            for j, destino in enumerate(nodos):
-                if i != j and D[i][j] != float('inf'):
-                    camino = AlgoritmosGrafos._reconstruir_camino_fw_predecesores(P, nodo_a_idx, origen, destino, nodos)
-                    print(f"  {origen} → {destino}: {D[i][j]} | Camino: {' → '.join(map(str, camino))}")
-        
-        return D, P, nodos, nodo_a_idx, iteraciones
-    
+        nombres = [str(nodo) for nodo in nodos]
+        for primera in range(0, n, filas_por_bloque):
+            bloque = range(primera, min(primera + filas_por_bloque, n))
+            desplazamientos, nodos_caminos = AlgoritmosGrafos.extraer_caminos(D, P, filas=bloque)
+            desplazamientos = desplazamientos.tolist()
+            nombres_caminos = [nombres[k] for k in nodos_caminos.tolist()]
+            for r, i in enumerate(bloque):
+                fila = D[i].tolist() if isinstance(D, np.ndarray) else D[i]
+                for j, destino in enumerate(nodos):
+                    inicio, fin = desplazamientos[r * n + j], desplazamientos[r * n + j + 1]
+                    if i != j and fin > inicio:
+                        camino = ' → '.join(nombres_caminos[inicio:fin])
+                        print(f"  {nodos[i]} → {destino}: {fila[j]} | Camino: {camino}")
+
+    @staticmethod
+    def extraer_caminos(D, P, filas=None, filas_por_bloque=256):
+        """
+        Extrae de una sola vez todos los caminos de una matriz de predecesores
+
+        D: matriz de distancias n×n
+        P: matriz de predecesores por índices (convención de floyd_warshall)
+        filas: orígenes a extraer (por defecto, todos)
+
+        Las filas de P se recorren por bloques, avanzando a la vez por todos
+        los pares (origen, destino) del bloque con operaciones vectorizadas
+        sobre índices, de modo que cada fila se lee una sola vez.
+
+        Retorna (desplazamientos, nodos) en formato CSR: el camino del
+        r-ésimo origen de 'filas' al destino j son los índices
+        nodos[desplazamientos[r*n + j]:desplazamientos[r*n + j + 1]],
+        vacío si no hay camino y [i] si origen y destino coinciden.
+        """
+        n = len(D)
+        filas = np.arange(n) if filas is None else np.asarray(filas, dtype=np.int64)
+        longitudes_bloques = []
+        caminos_bloques = []
+
+        for inicio in range(0, len(filas), filas_por_bloque):
+            origenes = filas[inicio:inicio + filas_por_bloque]
+            predecesores = np.asarray(P[origenes] if isinstance(P, np.ndarray) else [P[i] for i in origenes],
+                                      dtype=np.int64)
+            distancias = np.asarray(D[origenes] if isinstance(D, np.ndarray) else [D[i] for i in origenes],
+                                    dtype=np.float64)
+            r = len(origenes)
+
+            # Pares (fila del bloque, destino) alcanzables y distintos del origen
+            alcanzables = np.isfinite(distancias)
+            alcanzables[np.arange(r), origenes] = False
+            fila_par, destino_par = np.nonzero(alcanzables)
+            origen_par = origenes[fila_par]
+
+            # Primera pasada: longitud de cada camino siguiendo los predecesores hasta el origen
+            longitudes = np.ones(len(fila_par), dtype=np.int64)
+            actual = destino_par.copy()
+            pendientes = np.arange(len(fila_par))
+            for _ in range(n):
+                if not len(pendientes):
+                    break
+                actual[pendientes] = predecesores[fila_par[pendientes], actual[pendientes]]
+                longitudes[pendientes] += 1
+                llegaron = actual[pendientes] == origen_par[pendientes]
+                invalidos = actual[pendientes] < 0
+                longitudes[pendientes[invalidos]] = 0
+                pendientes = pendientes[~(llegaron | invalidos)]
+            longitudes[pendientes] = 0  # Ciclos negativos: no hay camino simple
+
+            longitudes_bloque = np.zeros((r, n), dtype=np.int64)
+            longitudes_bloque[fila_par, destino_par] = longitudes
+            longitudes_bloque[np.arange(r), origenes] = 1
+            fin_par = np.cumsum(longitudes_bloque.ravel()).reshape(r, n) - 1
+            camino = np.empty(fin_par[-1, -1] + 1 if r else 0, dtype=np.int32)
+            camino[fin_par[np.arange(r), origenes]] = origenes
+
+            # Segunda pasada: escribir cada camino de atrás hacia adelante
+            validos = longitudes > 0
+            fila_par, destino_par, origen_par = fila_par[validos], destino_par[validos], origen_par[validos]
+            actual = destino_par.copy()
+            posicion = fin_par[fila_par, destino_par]
+            camino[posicion] = actual
+            pendientes = np.arange(len(fila_par))
+            while len(pendientes):
+                actual[pendientes] = predecesores[fila_par[pendientes], actual[pendientes]]
+                posicion[pendientes] -= 1
+                camino[posicion[pendientes]] = actual[pendientes]
+                pendientes = pendientes[actual[pendientes] != origen_par[pendientes]]
+
+            longitudes_bloques.append(longitudes_bloque.ravel())
+            caminos_bloques.append(camino)
+
+        desplazamientos = np.zeros(len(filas) * n + 1, dtype=np.int64)
+        if longitudes_bloques:
+            np.cumsum(np.concatenate(longitudes_bloques), out=desplazamientos[1:])
+        nodos = np.concatenate(caminos_bloques) if caminos_bloques else np.empty(0, dtype=np.int32)
+        return desplazamientos, nodos
+
     @staticmethod
     def _imprimir_matriz(matriz, nodos):
         """Imprime una matriz de forma legible"""
@@ -425,21 +3801,21 @@ class AlgoritmosGrafos:
         if pred[i][j] is None:
             return []
         
-        # Reconstruir desde el destino hacia el origen
+        # Reconstruir desde el destino hacia el origen sobre la fila del origen
+        fila = pred[i]
         camino = [destino]
         actual = destino
         
         while actual != origen:
-            idx_actual = nodo_a_idx[actual]
-            idx_origen = nodo_a_idx[origen]
-            predecesor = pred[idx_origen][idx_actual]
+            predecesor = fila[nodo_a_idx[actual]]
             
             if predecesor is None or predecesor == actual:
                 break
                 
-            camino.insert(0, predecesor)
+            camino.append(predecesor)
             actual = predecesor
         
+        camino.reverse()
         return camino
     
     @staticmethod
@@ -0,0 +1,539 @@
+#!/usr/bin/env python3
+"""
+BENCHMARKS DE ALGORITMOS DE GRAFOS
+==================================
+
+Mide el rendimiento de los motores alternativos de algoritmos_grafos.py
+sobre grafos aleatorios generados con una semilla fija.
+
+Modo de uso:
+    python benchmark_grafos.py floyd_bloques [--nodos 1500] [--procesos 1 2 4 8]
+    python benchmark_grafos.py dijkstra_punto_a_punto [--nodos 40000] [--consultas 50]
+    python benchmark_grafos.py jerarquia_contraccion [--nodos 10000] [--consultas 200]
+    python benchmark_grafos.py dijkstra_entero [--nodos 250000] [--consultas 5]
+    python benchmark_grafos.py k_rutas [--nodos 12500] [--consultas 5]
+    python benchmark_grafos.py union_find [--nodos 100000] [--aristas 1000000]
+    python benchmark_grafos.py kruskal_vectorizado [--nodos 100000] [--aristas 1000000]
+    python benchmark_grafos.py prim_denso [--nodos 1500]
+    python benchmark_grafos.py boruvka [--nodos 1000000] [--aristas 5000000] [--procesos 1 2 4]
+    python benchmark_grafos.py kruskal_externo [--nodos 200000] [--aristas 3000000]
+    python benchmark_grafos.py componentes [--nodos 2000] [--procesos 1 2 4]
+    python benchmark_grafos.py mst_euclidiano [--nodos 100000]
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import os
+import tempfile
+import time
+import tracemalloc
+
+import networkx as nx
+import numpy as np
+
+from algoritmos_grafos import (AlgoritmosGrafos, GrafoCSR, IndiceRutasALT, JerarquiaContraccion,
+                               UnionFind, UnionFindArreglo,
+                               _dijkstra_csr, _dijkstra_dial_csr, _dijkstra_radix_csr)
+
+
+def _cronometrar(funcion, *args, **kwargs):
+    """Ejecuta la función y retorna (resultado, segundos transcurridos)"""
+    inicio = time.perf_counter()
+    resultado = funcion(*args, **kwargs)
+    return resultado, time.perf_counter() - inicio
+
+
+def _matrices_aleatorias(n_nodos, densidad=0.05, semilla=0):
+    """Matrices iniciales D/P de Floyd-Warshall para un grafo dirigido aleatorio"""
+    rng = np.random.default_rng(semilla)
+    D = np.where(rng.random((n_nodos, n_nodos)) < densidad,
+                 rng.integers(1, 100, (n_nodos, n_nodos)).astype(np.float64), np.inf)
+    np.fill_diagonal(D, 0.0)
+    P = np.repeat(np.arange(n_nodos, dtype=np.int32)[:, None], n_nodos, axis=1)
+    np.fill_diagonal(P, -1)
+    return D, P
+
+
+def benchmark_floyd_bloques(n_nodos=1500, procesos=(1, 2, 4, 8), tam_bloque=256):
+    """Escalado del motor Floyd-Warshall por bloques según la cantidad de procesos"""
+    print("=" * 70)
+    print(f"FLOYD-WARSHALL POR BLOQUES: {n_nodos} nodos, bloque {tam_bloque}")
+    print(f"Núcleos disponibles: {os.cpu_count()}")
+    print("=" * 70)
+
+    D, P = _matrices_aleatorias(n_nodos)
+
+    def numpy_secuencial(D, P):
+        D, P = D.copy(), P.copy()
+        for k in range(n_nodos):
+            via_k = np.add.outer(D[:, k], D[k, :])
+            mejora = via_k < D
+            np.copyto(D, via_k, where=mejora)
+            np.copyto(P, P[k, :], where=mejora)
+        return D, P
+
+    (D_ref, _), t_ref = _cronometrar(numpy_secuencial, D, P)
+    print(f"\n   Motor NumPy (referencia): {t_ref:8.2f} s")
+
+    print(f"\n   {'Procesos':>8} {'Tiempo (s)':>12} {'Aceleración':>12} {'vs NumPy':>10}")
+    t_base = None
+    for n_procesos in procesos:
+        (D_res, _), t = _cronometrar(AlgoritmosGrafos._floyd_bloques_matrices,
+                                     D, P, n_procesos, tam_bloque)
+        assert np.array_equal(D_res, D_ref), "Las distancias no coinciden con la referencia"
+        t_base = t_base or t
+        print(f"   {n_procesos:>8} {t:>12.2f} {t_base / t:>11.2f}x {t_ref / t:>9.2f}x")
+
+    # De punta a punta: armado de matrices, traza, etiquetas de predecesores y resumen
+    grafo = {i: {} for i in range(n_nodos)}
+    for i, j in zip(*np.nonzero(np.isfinite(D))):
+        if i != j:
+            grafo[int(i)][int(j)] = float(D[i, j])
+    n_procesos = max(procesos)
+    with contextlib.redirect_stdout(io.StringIO()):
+        (D_res, _, _, _, _), t = _cronometrar(AlgoritmosGrafos.floyd_warshall, grafo, motor='bloques',
+                                              n_procesos=n_procesos, tam_bloque=tam_bloque)
+    assert np.array_equal(D_res, D_ref), "Las distancias no coinciden con la referencia"
+    print(f"\n   floyd_warshall(motor='bloques', {n_procesos} procesos) de punta a punta: {t:8.2f} s")
+
+
+def _grilla_aleatoria(n_nodos, semilla=0, peso_maximo=20):
+    """Grilla cuadrada no dirigida con pesos enteros aleatorios (parecida a una red vial) como GrafoCSR"""
+    rng = np.random.default_rng(semilla)
+    lado = max(2, int(round(n_nodos ** 0.5)))
+    ids = np.arange(lado * lado).reshape(lado, lado)
+    u = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+    v = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+    w = rng.integers(1, peso_maximo, len(u)).astype(np.float64)
+    u, v, w = np.concatenate([u, v]), np.concatenate([v, u]), np.concatenate([w, w])
+    orden = np.argsort(u, kind='stable')
+    indptr = np.zeros(lado * lado + 1, dtype=np.int64)
+    np.cumsum(np.bincount(u, minlength=lado * lado), out=indptr[1:])
+    return GrafoCSR(range(lado * lado), indptr, v[orden], w[orden])
+
+
+def benchmark_dijkstra_punto_a_punto(n_nodos=40000, consultas=50, landmarks=8):
+    """Nodos asentados y tiempo por consulta: Dijkstra completo, con corte en el destino, bidireccional y ALT"""
+    csr = _grilla_aleatoria(n_nodos)
+    print("=" * 70)
+    print(f"DIJKSTRA PUNTO A PUNTO: grilla de {csr.n} nodos, {csr.m} arcos, {consultas} consultas")
+    print("=" * 70)
+
+    rng = np.random.default_rng(1)
+    pares = rng.integers(0, csr.n, (consultas, 2)).tolist()
+    indptr, indices, pesos = csr.listas()
+    csr.invertido().listas()  # El grafo invertido se construye una sola vez, fuera de la medición
+
+    def completo():
+        asentados = 0
+        for origen, _ in pares:
+            distancias, _ = _dijkstra_csr(indptr, indices, pesos, origen)
+            asentados += sum(d != float('inf') for d in distancias)
+        return asentados
+
+    def punto_a_punto(bidireccional):
+        asentados = 0
+        for origen, destino in pares:
+            asentados += AlgoritmosGrafos.ruta_mas_corta(csr, origen, destino, bidireccional)[2]
+        return asentados
+
+    indice, t_indice = _cronometrar(IndiceRutasALT.construir, csr, landmarks)
+    print(f"\n   Preprocesamiento ALT ({landmarks} landmarks): {t_indice:.2f} s")
+
+    def alt():
+        return sum(indice.ruta(origen, destino)[2] for origen, destino in pares)
+
+    print(f"\n   {'Variante':<22} {'Asentados/consulta':>19} {'ms/consulta':>12}")
+    for nombre, funcion in [('Completo', completo),
+                            ('Corte en el destino', lambda: punto_a_punto(False)),
+                            ('Bidireccional', lambda: punto_a_punto(True)),
+                            (f'ALT ({landmarks} landmarks)', alt)]:
+        asentados, t = _cronometrar(funcion)
+        print(f"   {nombre:<22} {asentados / consultas:>19.0f} {1000 * t / consultas:>12.2f}")
+
+
+def benchmark_jerarquia_contraccion(n_nodos=10000, consultas=200, tabla=100):
+    """Preprocesamiento, consultas punto a punto y tabla de distancias con la jerarquía de contracción"""
+    csr = _grilla_aleatoria(n_nodos)
+    print("=" * 70)
+    print(f"JERARQUÍA DE CONTRACCIÓN: grilla de {csr.n} nodos, {csr.m} arcos")
+    print("=" * 70)
+
+    aristas = list(zip(csr.origenes().tolist(), csr.indices.tolist(), csr.pesos.tolist()))
+    jerarquia, t = _cronometrar(JerarquiaContraccion.construir, aristas, True)
+    print(f"\n   Preprocesamiento: {t:.2f} s ({jerarquia.n_atajos} atajos)")
+
+    rng = np.random.default_rng(1)
+    pares = rng.integers(0, csr.n, (consultas, 2)).tolist()
+    csr.invertido().listas()
+
+    print(f"\n   {'Consulta punto a punto':<26} {'ms/consulta':>12}")
+    for nombre, funcion in [('Dijkstra bidireccional', lambda o, d: AlgoritmosGrafos.ruta_mas_corta(csr, o, d)),
+                            ('Jerarquía (distancia)', jerarquia.distancia),
+                            ('Jerarquía (con camino)', jerarquia.ruta)]:
+        _, t = _cronometrar(lambda: [funcion(o, d) for o, d in pares])
+        print(f"   {nombre:<26} {1000 * t / consultas:>12.3f}")
+
+    origenes = rng.choice(csr.n, tabla, replace=False).tolist()
+    destinos = rng.choice(csr.n, tabla, replace=False).tolist()
+    indptr, indices, pesos = csr.listas()
+    ref, t_ref = _cronometrar(lambda: [np.array(_dijkstra_csr(indptr, indices, pesos, o)[0])[destinos]
+                                       for o in origenes])
+    res, t = _cronometrar(jerarquia.tabla_distancias, origenes, destinos)
+    assert np.array_equal(res, np.array(ref)), "La tabla no coincide con Dijkstra"
+    print(f"\n   Tabla {tabla}×{tabla}: Dijkstra por origen {t_ref:.2f} s, jerarquía {t:.2f} s")
+
+
+def benchmark_dijkstra_entero(n_nodos=250000, consultas=5):
+    """Dijkstra con heapq frente a las colas de cubos (Dial y radix heap) con pesos enteros"""
+    print("=" * 70)
+    print(f"DIJKSTRA CON PESOS ENTEROS: grilla de ~{n_nodos} nodos, {consultas} orígenes")
+    print("=" * 70)
+
+    print(f"\n   {'Peso máximo':>12} {'Cola':<12} {'s/origen':>10} {'vs heapq':>10}")
+    for peso_maximo in (20, 1000, 1000000):
+        csr = _grilla_aleatoria(n_nodos, peso_maximo=peso_maximo)
+        indptr, indices, pesos = csr.listas()
+        enteros = csr.pesos_enteros()
+        origenes = np.random.default_rng(1).integers(0, csr.n, consultas).tolist()
+
+        variantes = [('heapq', lambda o: _dijkstra_csr(indptr, indices, pesos, o))]
+        if peso_maximo <= 1000:
+            variantes.append(('Dial', lambda o: _dijkstra_dial_csr(indptr, indices, enteros, o, csr.peso_maximo_entero)))
+        variantes.append(('radix heap', lambda o: _dijkstra_radix_csr(indptr, indices, enteros, o, csr.peso_maximo_entero)))
+
+        t_ref = None
+        referencias = None
+        for nombre, funcion in variantes:
+            resultados, t = _cronometrar(lambda: [funcion(o)[0] for o in origenes])
+            if referencias is None:
+                referencias, t_ref = resultados, t
+            assert all(list(map(float, r)) == ref for r, ref in zip(resultados, referencias)), \
+                "Las distancias no coinciden con heapq"
+            print(f"   {peso_maximo:>12} {nombre:<12} {t / consultas:>10.3f} {t_ref / t:>9.2f}x")
+
+
+def benchmark_k_rutas(n_nodos=12500, consultas=5, k=50, verificadas=10):
+    """Tiempo por consulta de las k rutas más cortas (Yen con árbol invertido y A*)"""
+    csr = _grilla_aleatoria(n_nodos)
+    print("=" * 70)
+    print(f"K RUTAS MÁS CORTAS: grilla de {csr.n} nodos, {csr.m} arcos, k = {k}")
+    print("=" * 70)
+
+    # networkx.shortest_simple_paths tarda minutos con k = 50 en esta grilla:
+    # solo se usa para verificar las primeras rutas, fuera de la medición
+    G = nx.DiGraph()
+    G.add_weighted_edges_from(zip(csr.origenes().tolist(), csr.indices.tolist(), csr.pesos.tolist()))
+    pares = np.random.default_rng(1).integers(0, csr.n, (consultas, 2)).tolist()
+
+    print(f"\n   {'Origen':>8} {'Destino':>8} {'Rutas':>6} {'ms/consulta':>12}")
+    for origen, destino in pares:
+        (rutas, _), t = _cronometrar(AlgoritmosGrafos.k_rutas_mas_cortas, csr, origen, destino, k)
+        ref = [nx.path_weight(G, camino, 'weight') for camino in itertools.islice(
+            nx.shortest_simple_paths(G, origen, destino, 'weight'), verificadas)]
+        assert [distancia for distancia, _ in rutas[:verificadas]] == ref, "Las distancias no coinciden con networkx"
+        print(f"   {origen:>8} {destino:>8} {len(rutas):>6} {1000 * t:>12.1f}")
+
+
+def _aristas_aleatorias(n_nodos, n_aristas, semilla=0):
+    """Lista de aristas (u, v, peso) de un grafo aleatorio, con pesos reales en [0, 1)"""
+    rng = np.random.default_rng(semilla)
+    u = rng.integers(0, n_nodos, n_aristas)
+    v = rng.integers(0, n_nodos, n_aristas)
+    return list(zip(u.tolist(), v.tolist(), rng.random(n_aristas).tolist()))
+
+
+def benchmark_union_find(n_nodos=100000, n_aristas=1000000):
+    """UnionFind (recursivo, listas) frente a UnionFindArreglo recorriendo las aristas de Kruskal"""
+    print("=" * 70)
+    print(f"UNION-FIND: {n_nodos} nodos, {n_aristas} aristas aleatorias")
+    print("=" * 70)
+
+    aristas = sorted(_aristas_aleatorias(n_nodos, n_aristas), key=lambda x: x[2])
+
+    def con_union_find():
+        uf = UnionFind(n_nodos)
+        aceptadas = 0
+        for u, v, _ in aristas:
+            uf.find(u)
+            uf.find(v)
+            aceptadas += uf.union(u, v)
+        return aceptadas
+
+    def con_arreglo():
+        uf = UnionFindArreglo(n_nodos)
+        find = uf.find
+        aceptadas = 0
+        for u, v, _ in aristas:
+            raiz_u, raiz_v = find(u), find(v)
+            if raiz_u != raiz_v:
+                uf.unir_raices(raiz_u, raiz_v)
+                aceptadas += 1
+        return aceptadas
+
+    def memoria(clase):
+        tracemalloc.start()
+        uf = clase(n_nodos)
+        for u, v, _ in aristas[:n_nodos]:
+            uf.union(u, v)
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return pico / 2 ** 20
+
+    print(f"\n   {'Variante':<34} {'Tiempo (s)':>10} {'Aceptadas':>10} {'Memoria (MiB)':>14}")
+    for nombre, funcion, clase in [
+            ('UnionFind', con_union_find, UnionFind),
+            ('UnionFindArreglo', con_arreglo, UnionFindArreglo),
+            ('pasos_kruskal (corte en n-1)', lambda: len(AlgoritmosGrafos.resultado(
+                AlgoritmosGrafos.pasos_kruskal(aristas, n_nodos))[0]), None)]:
+        aceptadas, t = _cronometrar(funcion)
+        mib = f"{memoria(clase):.1f}" if clase else "-"
+        print(f"   {nombre:<34} {t:>10.2f} {aceptadas:>10} {mib:>14}")
+
+
+def benchmark_kruskal_vectorizado(n_nodos=100000, n_aristas=1000000):
+    """Kruskal sobre lista de tuplas frente a kruskal_vectorizado, incluyendo el parseo del texto"""
+    from solver_general import SolverGrafos
+
+    print("=" * 70)
+    print(f"KRUSKAL VECTORIZADO: {n_nodos} nodos, {n_aristas} aristas aleatorias")
+    print("=" * 70)
+
+    rng = np.random.default_rng(0)
+    u = rng.integers(0, n_nodos, n_aristas)
+    v = rng.integers(0, n_nodos, n_aristas)
+    w_enteros = rng.integers(1, 1000, n_aristas)
+    w_reales = w_enteros.astype(np.float64)
+    texto = "\n".join(f"{a} {b} {c}" for a, b, c in zip(u.tolist(), v.tolist(), w_enteros.tolist()))
+
+    def con_tuplas():
+        aristas, _, nodos = SolverGrafos.parsear_aristas(texto)
+        nodo_a_idx = {nodo: i for i, nodo in enumerate(nodos)}
+        aristas_idx = [(nodo_a_idx[a], nodo_a_idx[b], peso) for a, b, peso in aristas]
+        return AlgoritmosGrafos.resultado(AlgoritmosGrafos.pasos_kruskal(aristas_idx, len(nodos)))[1]
+
+    def con_arreglos():
+        a, b, w, nodos = SolverGrafos.parsear_aristas_arreglos(texto)
+        return AlgoritmosGrafos.kruskal_vectorizado(a, b, w, len(nodos))[1]
+
+    print(f"\n   {'Variante':<40} {'Tiempo (s)':>10} {'Peso MST':>14}")
+    for nombre, funcion in [
+            ('Texto → tuplas → pasos_kruskal', con_tuplas),
+            ('Texto → arreglos → kruskal_vectorizado', con_arreglos),
+            ('kruskal_vectorizado (pesos reales)',
+             lambda: AlgoritmosGrafos.kruskal_vectorizado(u, v, w_reales, n_nodos)[1]),
+            ('kruskal_vectorizado (enteros, radix)',
+             lambda: AlgoritmosGrafos.kruskal_vectorizado(u, v, w_enteros, n_nodos)[1])]:
+        peso, t = _cronometrar(funcion)
+        print(f"   {nombre:<40} {t:>10.2f} {peso:>14.0f}")
+
+
+def benchmark_prim_denso(n_nodos=1500, densidad=1.0):
+    """Prim con heapq perezoso frente al heap d-ario indexado: tiempo y memoria pico en grafos densos"""
+    rng = np.random.default_rng(0)
+    pesos = rng.integers(1, 10000, (n_nodos, n_nodos))
+    presentes = np.triu(rng.random((n_nodos, n_nodos)) < densidad, 1)
+    grafo = {i: {} for i in range(n_nodos)}
+    for u, v in zip(*np.nonzero(presentes)):
+        u, v = int(u), int(v)
+        grafo[u][v] = grafo[v][u] = int(pesos[u, v])
+    n_aristas = int(presentes.sum())
+
+    print("=" * 70)
+    print(f"PRIM EN GRAFO DENSO: {n_nodos} nodos, {n_aristas} aristas")
+    print("=" * 70)
+
+    variantes = [('heapq perezoso (pasos_prim)',
+                  lambda: AlgoritmosGrafos.resultado(AlgoritmosGrafos.pasos_prim(grafo, 0))[1])]
+    for d in (2, 4, 8):
+        variantes.append((f'heap indexado d={d}', lambda d=d: sum(
+            peso for _, _, peso in AlgoritmosGrafos._prim_heap_indexado(grafo, 0, d))))
+
+    print(f"\n   {'Variante':<30} {'Tiempo (s)':>10} {'Memoria pico (MiB)':>19} {'Peso MST':>10}")
+    for nombre, funcion in variantes:
+        peso, t = _cronometrar(funcion)
+        tracemalloc.start()
+        funcion()
+        pico = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+        print(f"   {nombre:<30} {t:>10.2f} {pico:>19.1f} {peso:>10}")
+
+
+def benchmark_boruvka(n_nodos=1000000, n_aristas=5000000, procesos=(1, 2, 4)):
+    """kruskal_vectorizado frente a boruvka_vectorizado según la cantidad de procesos"""
+    print("=" * 70)
+    print(f"BORŮVKA VECTORIZADO: {n_nodos} nodos, {n_aristas} aristas aleatorias")
+    print(f"Núcleos disponibles: {os.cpu_count()}")
+    print("=" * 70)
+
+    rng = np.random.default_rng(0)
+    u = rng.integers(0, n_nodos, n_aristas).astype(np.int32)
+    v = rng.integers(0, n_nodos, n_aristas).astype(np.int32)
+    w = rng.random(n_aristas)
+
+    (elegidas, peso_ref), t = _cronometrar(AlgoritmosGrafos.kruskal_vectorizado, u, v, w, n_nodos)
+    print(f"\n   {'Variante':<34} {'Tiempo (s)':>10} {'Rondas':>7} {'Aristas MST':>12}")
+    print(f"   {'kruskal_vectorizado':<34} {t:>10.2f} {'-':>7} {len(elegidas):>12}")
+    for n_procesos in procesos:
+        rondas = []
+        (elegidas, peso), t = _cronometrar(AlgoritmosGrafos.boruvka_vectorizado, u, v, w, n_nodos,
+                                           n_procesos, rondas.append)
+        assert abs(peso - peso_ref) <= 1e-9 * max(1.0, abs(peso_ref)), "El peso no coincide con Kruskal"
+        print(f"   {f'boruvka_vectorizado ({n_procesos} proc.)':<34} {t:>10.2f} {len(rondas):>7} {len(elegidas):>12}")
+
+
+def benchmark_kruskal_externo(n_nodos=200000, n_aristas=3000000):
+    """Kruskal leyendo el archivo completo en memoria frente a kruskal_externo (corridas en disco)"""
+    from solver_general import SolverGrafos
+
+    print("=" * 70)
+    print(f"KRUSKAL SEMI-EXTERNO: {n_nodos} nodos, {n_aristas} aristas aleatorias")
+    print("=" * 70)
+
+    rng = np.random.default_rng(0)
+    u = rng.integers(0, n_nodos, n_aristas)
+    v = rng.integers(0, n_nodos, n_aristas)
+    w = rng.integers(1, 1000, n_aristas)
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, 'aristas.txt')
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            for inicio in range(0, n_aristas, 100000):
+                fin = inicio + 100000
+                archivo.writelines(f"{a} {b} {c}\n" for a, b, c in
+                                   zip(u[inicio:fin].tolist(), v[inicio:fin].tolist(), w[inicio:fin].tolist()))
+        print(f"Archivo: {os.path.getsize(ruta) / 2 ** 20:.1f} MiB")
+
+        def en_memoria():
+            with open(ruta, encoding='utf-8') as archivo:
+                a, b, pesos, nodos = SolverGrafos.parsear_aristas_arreglos(archivo.read())
+            return AlgoritmosGrafos.kruskal_vectorizado(a, b, pesos, len(nodos))[1]
+
+        variantes = [('Texto completo → kruskal_vectorizado', en_memoria)]
+        for por_corrida in (250000, 1000000):
+            variantes.append((f'kruskal_externo (corridas de {por_corrida})',
+                              lambda por_corrida=por_corrida: AlgoritmosGrafos.kruskal_externo(
+                                  ruta, por_corrida, directorio=carpeta)[1]))
+
+        print(f"\n   {'Variante':<40} {'Tiempo (s)':>10} {'Memoria pico (MiB)':>19} {'Peso MST':>12}")
+        for nombre, funcion in variantes:
+            peso, t = _cronometrar(funcion)
+            tracemalloc.start()
+            funcion()
+            pico = tracemalloc.get_traced_memory()[1] / 2 ** 20
+            tracemalloc.stop()
+            print(f"   {nombre:<40} {t:>10.2f} {pico:>19.1f} {peso:>12.0f}")
+
+
+def benchmark_componentes(n_nodos=2000, n_componentes=20, procesos=(1, 2, 4)):
+    """Floyd-Warshall sobre la matriz completa frente a APSP y bosque mínimo por componente"""
+    print("=" * 70)
+    print(f"DESCOMPOSICIÓN EN COMPONENTES: {n_nodos} nodos, {n_componentes} componentes")
+    print(f"Núcleos disponibles: {os.cpu_count()}")
+    print("=" * 70)
+
+    # Cada componente es una grilla aleatoria con sus nodos renumerados
+    por_componente = n_nodos // n_componentes
+    grafo = {}
+    for c in range(n_componentes):
+        csr = _grilla_aleatoria(por_componente, semilla=c)
+        indptr, indices, pesos = csr.listas()
+        desplazamiento = len(grafo)
+        for u in range(csr.n):
+            grafo[u + desplazamiento] = {v + desplazamiento: peso for v, peso in
+                                         zip(indices[indptr[u]:indptr[u + 1]], pesos[indptr[u]:indptr[u + 1]])}
+    n_nodos = len(grafo)
+
+    def silencioso(funcion, *args, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return funcion(*args, **kwargs)
+
+    (D, _, _, _, _), t_completo = _cronometrar(silencioso, AlgoritmosGrafos.floyd_warshall, grafo, motor='numpy')
+    print(f"\n   {'Variante':<36} {'Tiempo (s)':>10} {'Celdas (millones)':>18}")
+    print(f"   {'floyd_warshall (motor numpy)':<36} {t_completo:>10.2f} {n_nodos ** 2 / 1e6:>18.1f}")
+
+    _, t = _cronometrar(AlgoritmosGrafos.componentes, grafo, True)
+    print(f"   {'componentes fuertes (Tarjan)':<36} {t:>10.2f} {'-':>18}")
+    for n_procesos in procesos:
+        apsp, t = _cronometrar(silencioso, AlgoritmosGrafos.apsp_por_componentes, grafo, n_procesos)
+        nodo = apsp.nodos[0]
+        assert np.array_equal(apsp.fila(nodo)[0], D[apsp.nodo_a_idx[nodo]]), "Las distancias no coinciden"
+        celdas = sum(len(indices) ** 2 for indices in apsp.miembros) / 1e6
+        print(f"   {f'apsp_por_componentes ({n_procesos} proc.)':<36} {t:>10.2f} {celdas:>18.1f}")
+    for n_procesos in procesos:
+        (_, peso, _), t = _cronometrar(AlgoritmosGrafos.bosque_minimo, grafo, n_procesos)
+        print(f"   {f'bosque_minimo ({n_procesos} proc.)':<36} {t:>10.2f} {'-':>18}")
+
+
+def benchmark_mst_euclidiano(n_nodos=100000, n_completo=3000):
+    """MST euclidiano: Kruskal sobre el grafo completo frente a Kruskal sobre las aristas de Delaunay"""
+    print("=" * 70)
+    print(f"MST EUCLIDIANO: {n_nodos} puntos aleatorios en el plano")
+    print("=" * 70)
+
+    rng = np.random.default_rng(0)
+    puntos = rng.random((n_nodos, 2))
+
+    # El grafo completo solo es viable para pocos puntos: n·(n-1)/2 aristas
+    pocos = puntos[:n_completo]
+    u, v = np.triu_indices(len(pocos), 1)
+
+    def grafo_completo():
+        w = np.linalg.norm(pocos[u] - pocos[v], axis=1)
+        return AlgoritmosGrafos.kruskal_vectorizado(u, v, w, len(pocos))[1]
+
+    print(f"\n   {'Variante':<36} {'Puntos':>8} {'Candidatas':>11} {'Tiempo (s)':>10} {'Peso MST':>10}")
+    peso_ref, t = _cronometrar(grafo_completo)
+    print(f"   {'Kruskal sobre el grafo completo':<36} {len(pocos):>8} {len(u):>11} {t:>10.2f} {peso_ref:>10.4f}")
+    (_, _, _, peso), t = _cronometrar(AlgoritmosGrafos.mst_euclidiano, pocos)
+    assert abs(peso - peso_ref) <= 1e-9 * peso_ref, "El peso no coincide con el grafo completo"
+    candidatas = len(AlgoritmosGrafos.aristas_delaunay(pocos)[0])
+    print(f"   {'Delaunay + Kruskal':<36} {len(pocos):>8} {candidatas:>11} {t:>10.2f} {peso:>10.4f}")
+
+    (_, _, _, peso), t = _cronometrar(AlgoritmosGrafos.mst_euclidiano, puntos)
+    candidatas = len(AlgoritmosGrafos.aristas_delaunay(puntos)[0])
+    print(f"   {'Delaunay + Kruskal':<36} {n_nodos:>8} {candidatas:>11} {t:>10.2f} {peso:>10.4f}")
+
+
+BENCHMARKS = {
+    'floyd_bloques': benchmark_floyd_bloques,
+    'dijkstra_punto_a_punto': benchmark_dijkstra_punto_a_punto,
+    'jerarquia_contraccion': benchmark_jerarquia_contraccion,
+    'dijkstra_entero': benchmark_dijkstra_entero,
+    'k_rutas': benchmark_k_rutas,
+    'union_find': benchmark_union_find,
+    'kruskal_vectorizado': benchmark_kruskal_vectorizado,
+    'prim_denso': benchmark_prim_denso,
+    'boruvka': benchmark_boruvka,
+    'kruskal_externo': benchmark_kruskal_externo,
+    'componentes': benchmark_componentes,
+    'mst_euclidiano': benchmark_mst_euclidiano,
+}
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Benchmarks de algoritmos de grafos")
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS))
+    parser.add_argument('--nodos', type=int, help="cantidad de nodos del grafo aleatorio")
+    parser.add_argument('--procesos', type=int, nargs='+', help="cantidades de procesos a medir")
+    parser.add_argument('--consultas', type=int, help="cantidad de consultas origen-destino")
+    parser.add_argument('--aristas', type=int, help="cantidad de aristas del grafo aleatorio")
+    args = parser.parse_args()
+
+    kwargs = {}
+    if args.nodos:
+        kwargs['n_nodos'] = args.nodos
+    if args.procesos:
+        kwargs['procesos'] = tuple(args.procesos)
+    if args.consultas:
+        kwargs['consultas'] = args.consultas
+    if args.aristas:
+        kwargs['n_aristas'] = args.aristas
+    BENCHMARKS[args.benchmark](**kwargs)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 Interfaz Gráfica GENERALIZADA para Resolver Problemas de Grafos e Investigación Operativa
 
 Esta herramienta te permite resolver CUALQUIER problema de:
-- Árboles de expansión mínima (Kruskal/Prim)
+- Árboles de expansión mínima (Kruskal/Prim/Borůvka), también euclidianos desde puntos
 - Rutas más cortas (Dijkstra/Floyd-Warshall)
 - Flujo máximo (Ford-Fulkerson)
 - Juegos de suma cero
@@ -12,14 +12,31 @@ Solo necesitas ingresar tus propios datos.
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import networkx as nx
-from algoritmos_grafos import AlgoritmosGrafos
+from algoritmos_grafos import AlgoritmosGrafos, AlmacenAPSP, CACHE_RUTAS, MAX_NODOS_RESUMEN_FLOYD
 import numpy as np
-import sys
-from io import StringIO
+import csv
 from scipy.optimize import linprog
 
+# Máxima cantidad de arcos modificados para actualizar Floyd-Warshall de forma
+# incremental en lugar de recalcular todo
+MAX_ARCOS_FLOYD_INCREMENTAL = 5
+
+# Máxima cantidad de nodos para mostrar Dijkstra paso a paso; en grafos más
+# grandes se usa el núcleo CSR sin registrar iteraciones
+MAX_NODOS_PASOS_DIJKSTRA = 50
+
+# Máxima cantidad de nodos para mostrar las matrices D y S de cada iteración
+# de Floyd-Warshall (n³ celdas en total); por encima solo se listan los
+# cambios de cada paso k
+MAX_NODOS_PASOS_FLOYD = 30
+
+# Máxima cantidad de aristas del MST euclidiano que se listan en el resultado;
+# el resto se resume (el gráfico las dibuja todas)
+MAX_ARISTAS_LISTADAS_MST = 200
+
 class AplicacionGrafos:
     def __init__(self, root):
         self.root = root
@@ -90,6 +107,8 @@ class AplicacionGrafos:
         self.floyd_next = None
         self.floyd_nodos = None
         self.floyd_nodo_a_idx = None
+        self.floyd_grafo = None
+        self.floyd_almacen = None  # AlmacenAPSP en disco, si el resultado se abrió desde archivos
         
         # Configurar root background
         self.root.configure(bg=self.colors['light'])
@@ -220,7 +239,7 @@ class AplicacionGrafos:
         return (u, v, peso, es_bidireccional)
         
     def crear_pestaña_arbol_minimo(self):
-        """Pestaña para Kruskal y Prim"""
+        """Pestaña para Kruskal, Prim y Borůvka"""
         frame = ttk.Frame(self.notebook)
         self.notebook.add(frame, text="🌳 Árbol Mínimo")
         
@@ -251,12 +270,19 @@ class AplicacionGrafos:
                   self.txt_aristas.insert('1.0', "A B 4\nA C 3\nB C 1\nB D 2\nC D 4")).pack(side='left', padx=2)
         ttk.Button(frame_ejemplos, text="Mediano", 
                   command=lambda: self.cargar_ejemplo_mediano_mst()).pack(side='left', padx=2)
+        ttk.Button(frame_ejemplos, text="Puntos", 
+                  command=lambda: self.cargar_ejemplo_puntos_mst()).pack(side='left', padx=2)
         ttk.Button(frame_ejemplos, text="Limpiar", 
                   command=lambda: self.txt_aristas.delete('1.0', 'end')).pack(side='left', padx=2)
         
         self.txt_aristas = scrolledtext.ScrolledText(frame_izq, height=15, width=40, font=('Consolas', 11))
         self.txt_aristas.pack(fill='both', expand=True, pady=5)
         
+        # Checkbox para entrada por coordenadas (MST euclidiano)
+        self.var_puntos_mst = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frame_izq, text="Entrada por puntos (x y  o  nombre x y): MST euclidiano con Delaunay", 
+                       variable=self.var_puntos_mst).pack(anchor='w')
+        
         # Botones
         frame_botones = ttk.Frame(frame_izq)
         frame_botones.pack(pady=10)
@@ -267,6 +293,9 @@ class AplicacionGrafos:
         ttk.Button(frame_botones, text="🔍 Prim", 
                   command=lambda: self.ejecutar_arbol_minimo('prim'),
                   width=15).pack(side='left', padx=5)
+        ttk.Button(frame_botones, text="🔍 Borůvka", 
+                  command=lambda: self.ejecutar_arbol_minimo('boruvka'),
+                  width=15).pack(side='left', padx=5)
         
         frame_botones2 = ttk.Frame(frame_izq)
         frame_botones2.pack(pady=5)
@@ -356,15 +385,24 @@ class AplicacionGrafos:
         self.entry_origen.grid(row=0, column=1, sticky='w', padx=5, pady=2)
         self.entry_origen.insert(0, "A")
         
+        ttk.Label(frame_config, text="Nodo destino (opcional):", font=('Arial', 10, 'bold')).grid(row=1, column=0, sticky='w', padx=5)
+        self.entry_destino_dijkstra = ttk.Entry(frame_config, width=10)
+        self.entry_destino_dijkstra.grid(row=1, column=1, sticky='w', padx=5, pady=2)
+        
+        ttk.Label(frame_config, text="Rutas alternativas (k):", font=('Arial', 10, 'bold')).grid(row=2, column=0, sticky='w', padx=5)
+        self.entry_k_rutas = ttk.Entry(frame_config, width=10)
+        self.entry_k_rutas.grid(row=2, column=1, sticky='w', padx=5, pady=2)
+        self.entry_k_rutas.insert(0, "5")
+        
         # Checkbox para grafo dirigido
         self.var_dirigido_dijkstra = tk.BooleanVar(value=False)
         ttk.Checkbutton(frame_config, text="Grafo dirigido (las aristas tienen dirección única)", 
                        variable=self.var_dirigido_dijkstra,
-                       command=lambda: self.actualizar_info_dijkstra()).grid(row=1, column=0, columnspan=2, sticky='w', padx=5, pady=5)
+                       command=lambda: self.actualizar_info_dijkstra()).grid(row=3, column=0, columnspan=2, sticky='w', padx=5, pady=5)
         
         # Etiqueta de ayuda dinámica
         self.lbl_ayuda_dijkstra = ttk.Label(frame_config, text="", font=('Arial', 8, 'italic'), foreground='blue')
-        self.lbl_ayuda_dijkstra.grid(row=2, column=0, columnspan=2, sticky='w', padx=5)
+        self.lbl_ayuda_dijkstra.grid(row=4, column=0, columnspan=2, sticky='w', padx=5)
         self.actualizar_info_dijkstra()
         
         # Botones
@@ -373,6 +411,8 @@ class AplicacionGrafos:
         
         ttk.Button(frame_botones, text="🚀 Ejecutar Dijkstra", 
                   command=self.ejecutar_dijkstra).pack(side='left', padx=5)
+        ttk.Button(frame_botones, text="🔀 K rutas más cortas", 
+                  command=self.ejecutar_k_rutas).pack(side='left', padx=5)
         ttk.Button(frame_botones, text="🗑️ Limpiar", 
                   command=lambda: self.txt_resultado_dijkstra.delete('1.0', 'end')).pack(side='left', padx=5)
         
@@ -487,6 +527,15 @@ class AplicacionGrafos:
         ttk.Button(frame_consulta, text="📍 Consultar Ruta", 
                   command=self.consultar_ruta_floyd).pack(pady=5)
         
+        frame_almacen_fw = ttk.Frame(frame_consulta)
+        frame_almacen_fw.pack(pady=5)
+        ttk.Button(frame_almacen_fw, text="💾 Guardar matrices", 
+                  command=self.guardar_matrices_floyd).pack(side='left', padx=2)
+        ttk.Button(frame_almacen_fw, text="📂 Abrir matrices", 
+                  command=self.abrir_matrices_floyd).pack(side='left', padx=2)
+        ttk.Button(frame_almacen_fw, text="📤 Exportar caminos (CSV)", 
+                  command=self.exportar_caminos_floyd).pack(side='left', padx=2)
+        
         # Panel derecho
         frame_der = ttk.LabelFrame(frame, text="Resultados", padding=10)
         frame_der.pack(side='right', fill='both', expand=True, padx=5, pady=5)
@@ -692,6 +741,20 @@ F G 11"""
         self.txt_aristas.delete('1.0', 'end')
         self.txt_aristas.insert('1.0', ejemplo)
     
+    def cargar_ejemplo_puntos_mst(self):
+        """Carga un ejemplo de puntos para el MST euclidiano"""
+        ejemplo = """A 0 0
+B 2 1
+C 1 3
+D 4 0
+E 5 3
+F 3 4
+G 6 1
+H 7 4"""
+        self.txt_aristas.delete('1.0', 'end')
+        self.txt_aristas.insert('1.0', ejemplo)
+        self.var_puntos_mst.set(True)
+    
     def actualizar_info_dijkstra(self):
         """Actualiza el mensaje de ayuda según si el grafo es dirigido o no"""
         if self.var_dirigido_dijkstra.get():
@@ -863,44 +926,33 @@ D E 2"""
             grafo_idx = {nodo_a_idx[n]: {nodo_a_idx[v]: p for v, p in vecinos.items()} 
                         for n, vecinos in grafo.items()}
             
-            # Redirigir stdout
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-            
             # Ejecutar Kruskal
             self.txt_resultado_mst.insert('end', "🌳 ALGORITMO DE KRUSKAL\n")
             self.txt_resultado_mst.insert('end', "=" * 70 + "\n\n")
-            mst_k, peso_k, iteraciones_k = AlgoritmosGrafos.kruskal(aristas_idx, len(nodos))
-            output_k = sys.stdout.getvalue()
-            sys.stdout = StringIO()
             
-            # Mostrar iteraciones de Kruskal
+            # Mostrar iteraciones de Kruskal a medida que se generan
             self.txt_resultado_mst.insert('end', "📊 PROCESO PASO A PASO:\n")
             self.txt_resultado_mst.insert('end', "-" * 70 + "\n\n")
             
-            for iter_data in iteraciones_k:
-                u_orig, v_orig, peso = iter_data['arista']
+            def mostrar_paso_kruskal(paso):
+                u_orig, v_orig, peso = paso.arista
                 u, v = nodos_lista[u_orig], nodos_lista[v_orig]
                 
-                if iter_data['aceptada']:
+                if paso.aceptada:
                     self.txt_resultado_mst.insert('end', 
-                        f"✅ Iteración {iter_data['num']}: ACEPTAR {u}-{v} (peso: {peso})\n")
+                        f"✅ Iteración {paso.num}: ACEPTAR {u}-{v} (peso: {peso})\n")
                     self.txt_resultado_mst.insert('end', 
-                        f"   Peso acumulado: {iter_data['peso_acumulado']}\n")
+                        f"   Peso acumulado: {paso.peso_acumulado}\n")
                     self.txt_resultado_mst.insert('end', 
-                        f"   Aristas en MST: {len(iter_data['mst_actual'])}\n\n")
+                        f"   Aristas en MST: {paso.n_aristas_mst}\n\n")
                 else:
                     self.txt_resultado_mst.insert('end', 
-                        f"❌ Iteración {iter_data['num']}: RECHAZAR {u}-{v} (peso: {peso})\n")
+                        f"❌ Iteración {paso.num}: RECHAZAR {u}-{v} (peso: {peso})\n")
                     self.txt_resultado_mst.insert('end', 
                         f"   Razón: Formaría un ciclo (ambos nodos ya conectados)\n\n")
             
-            # Ejecutar Prim
-            mst_p, peso_p, iteraciones_p = AlgoritmosGrafos.prim(grafo_idx, 0)
-            output_p = sys.stdout.getvalue()
-            
-            # Restaurar stdout
-            sys.stdout = old_stdout
+            mst_k, peso_k = AlgoritmosGrafos.resultado(
+                AlgoritmosGrafos.pasos_kruskal(aristas_idx, len(nodos)), mostrar_paso_kruskal)
             
             # Mostrar resultados finales de Kruskal
             self.txt_resultado_mst.insert('end', "=" * 70 + "\n")
@@ -916,38 +968,44 @@ D E 2"""
             self.txt_resultado_mst.insert('end', "🌲 ALGORITMO DE PRIM\n")
             self.txt_resultado_mst.insert('end', "=" * 70 + "\n\n")
             
-            # Mostrar iteraciones de Prim
+            # Ejecutar Prim mostrando las iteraciones a medida que se generan
             self.txt_resultado_mst.insert('end', "📊 PROCESO PASO A PASO:\n")
             self.txt_resultado_mst.insert('end', "-" * 70 + "\n\n")
             
-            for iter_data in iteraciones_p:
-                if iter_data['tipo'] == 'inicial':
-                    nodo_inicio = nodos_lista[iter_data['nodo_inicio']]
+            n_visitados = 0
+            
+            def mostrar_paso_prim(paso):
+                nonlocal n_visitados
+                if paso.tipo == 'inicial':
+                    n_visitados = 1
                     self.txt_resultado_mst.insert('end', 
-                        f"🔵 INICIO: Desde nodo {nodo_inicio}\n")
+                        f"🔵 INICIO: Desde nodo {nodos_lista[paso.nodo]}\n")
                     self.txt_resultado_mst.insert('end', 
-                        f"   Candidatos iniciales: {len(iter_data['candidatos'])}\n\n")
-                elif iter_data['tipo'] == 'aceptada':
-                    u_orig, v_orig, peso = iter_data['arista']
+                        f"   Candidatos iniciales: {len(paso.nuevas_aristas)}\n\n")
+                elif paso.tipo == 'aceptada':
+                    n_visitados += 1
+                    u_orig, v_orig, peso = paso.arista
                     u, v = nodos_lista[u_orig], nodos_lista[v_orig]
                     self.txt_resultado_mst.insert('end', 
-                        f"✅ Iteración {iter_data['num']}: AGREGAR {u}-{v} (peso: {peso})\n")
+                        f"✅ Iteración {paso.num}: AGREGAR {u}-{v} (peso: {peso})\n")
                     self.txt_resultado_mst.insert('end', 
-                        f"   Nodos visitados: {len(iter_data['visitados'])}\n")
+                        f"   Nodos visitados: {n_visitados}\n")
                     self.txt_resultado_mst.insert('end', 
-                        f"   Peso acumulado: {iter_data['peso_total']}\n")
-                    if iter_data['nuevas_aristas']:
+                        f"   Peso acumulado: {paso.peso_total}\n")
+                    if paso.nuevas_aristas:
                         self.txt_resultado_mst.insert('end', 
-                            f"   Nuevas aristas candidatas: {len(iter_data['nuevas_aristas'])}\n\n")
+                            f"   Nuevas aristas candidatas: {len(paso.nuevas_aristas)}\n\n")
                     else:
                         self.txt_resultado_mst.insert('end', "\n")
-                elif iter_data['tipo'] == 'rechazada':
-                    u_orig, v_orig, peso = iter_data['arista']
+                elif paso.tipo == 'rechazada':
+                    u_orig, v_orig, peso = paso.arista
                     u, v = nodos_lista[u_orig], nodos_lista[v_orig]
                     self.txt_resultado_mst.insert('end', 
-                        f"⏭️  Iteración {iter_data['num']}: OMITIR {u}-{v} (peso: {peso})\n")
+                        f"⏭️  Iteración {paso.num}: OMITIR {u}-{v} (peso: {peso})\n")
                     self.txt_resultado_mst.insert('end', 
-                        f"   Razón: {iter_data['razon']}\n\n")
+                        f"   Razón: nodo ya visitado\n\n")
+            
+            mst_p, peso_p = AlgoritmosGrafos.resultado(AlgoritmosGrafos.pasos_prim(grafo_idx, 0), mostrar_paso_prim)
             
             # Mostrar resultados finales de Prim
             self.txt_resultado_mst.insert('end', "=" * 70 + "\n")
@@ -976,7 +1034,11 @@ D E 2"""
             self.status_bar.config(text="❌ Error en la comparación")
     
     def ejecutar_arbol_minimo(self, algoritmo):
-        """Ejecuta Kruskal o Prim"""
+        """Ejecuta Kruskal, Prim o Borůvka"""
+        if self.var_puntos_mst.get():
+            self.ejecutar_mst_puntos()
+            return
+        
         try:
             # Limpiar resultado
             self.txt_resultado_mst.delete('1.0', 'end')
@@ -1022,49 +1084,75 @@ D E 2"""
                 self.txt_resultado_mst.insert('end', "=" * 60 + "\n")
                 self.txt_resultado_mst.insert('end', "ALGORITMO DE KRUSKAL\n")
                 self.txt_resultado_mst.insert('end', "=" * 60 + "\n\n")
-                mst, peso_total, iteraciones = AlgoritmosGrafos.kruskal(aristas_idx, len(nodos))
                 
-                # Mostrar iteraciones
+                # Mostrar iteraciones a medida que se generan
                 self.txt_resultado_mst.insert('end', "📊 PROCESO PASO A PASO:\n")
                 self.txt_resultado_mst.insert('end', "-" * 60 + "\n\n")
                 
-                for iter_data in iteraciones:
-                    u_orig, v_orig, peso = iter_data['arista']
+                def mostrar_paso(paso):
+                    u_orig, v_orig, peso = paso.arista
                     u, v = nodos_lista[u_orig], nodos_lista[v_orig]
                     
-                    if iter_data['aceptada']:
+                    if paso.aceptada:
                         self.txt_resultado_mst.insert('end', 
-                            f"✅ {iter_data['num']}. ACEPTAR {u}-{v} (peso: {peso})\n")
+                            f"✅ {paso.num}. ACEPTAR {u}-{v} (peso: {peso})\n")
                         self.txt_resultado_mst.insert('end', 
-                            f"   Peso acumulado: {iter_data['peso_acumulado']}\n\n")
+                            f"   Peso acumulado: {paso.peso_acumulado}\n\n")
                     else:
                         self.txt_resultado_mst.insert('end', 
-                            f"❌ {iter_data['num']}. RECHAZAR {u}-{v} (peso: {peso}) - Formaría ciclo\n\n")
+                            f"❌ {paso.num}. RECHAZAR {u}-{v} (peso: {peso}) - Formaría ciclo\n\n")
+                
+                mst, peso_total = AlgoritmosGrafos.resultado(
+                    AlgoritmosGrafos.pasos_kruskal(aristas_idx, len(nodos)), mostrar_paso)
                 
                 # Convertir índices de vuelta a nombres
                 mst = [(nodos_lista[u], nodos_lista[v], peso) for u, v, peso in mst]
+            elif algoritmo == 'boruvka':
+                self.txt_resultado_mst.insert('end', "=" * 60 + "\n")
+                self.txt_resultado_mst.insert('end', "ALGORITMO DE BORŮVKA\n")
+                self.txt_resultado_mst.insert('end', "=" * 60 + "\n\n")
+                
+                # Mostrar las rondas a medida que se completan
+                self.txt_resultado_mst.insert('end', "📊 PROCESO POR RONDAS:\n")
+                self.txt_resultado_mst.insert('end', "-" * 60 + "\n\n")
+                
+                u_arr = np.array([u for u, _, _ in aristas_idx], dtype=np.int32)
+                v_arr = np.array([v for _, v, _ in aristas_idx], dtype=np.int32)
+                w_arr = np.array([peso for _, _, peso in aristas_idx])
+                
+                def mostrar_ronda(ronda):
+                    self.txt_resultado_mst.insert('end', f"🔄 Ronda {ronda.num}:\n")
+                    for e in ronda.aristas.tolist():
+                        u, v, peso = aristas[e]
+                        self.txt_resultado_mst.insert('end', f"   ✅ AGREGAR {u}-{v} (peso: {peso})\n")
+                    self.txt_resultado_mst.insert('end', 
+                        f"   Quedan {ronda.componentes} componentes\n\n")
+                
+                elegidas, peso_total = AlgoritmosGrafos.boruvka_vectorizado(
+                    u_arr, v_arr, w_arr, len(nodos_lista), al_ronda=mostrar_ronda)
+                mst = [aristas[e] for e in elegidas.tolist()]
             else:
                 self.txt_resultado_mst.insert('end', "=" * 60 + "\n")
                 self.txt_resultado_mst.insert('end', "ALGORITMO DE PRIM\n")
                 self.txt_resultado_mst.insert('end', "=" * 60 + "\n\n")
-                mst, peso_total, iteraciones = AlgoritmosGrafos.prim(grafo_idx, 0)
                 
-                # Mostrar iteraciones
+                # Mostrar iteraciones a medida que se generan
                 self.txt_resultado_mst.insert('end', "📊 PROCESO PASO A PASO:\n")
                 self.txt_resultado_mst.insert('end', "-" * 60 + "\n\n")
                 
-                for iter_data in iteraciones:
-                    if iter_data['tipo'] == 'inicial':
-                        nodo_inicio = nodos_lista[iter_data['nodo_inicio']]
+                def mostrar_paso(paso):
+                    if paso.tipo == 'inicial':
                         self.txt_resultado_mst.insert('end', 
-                            f"🔵 INICIO desde nodo {nodo_inicio}\n\n")
-                    elif iter_data['tipo'] == 'aceptada':
-                        u_orig, v_orig, peso = iter_data['arista']
+                            f"🔵 INICIO desde nodo {nodos_lista[paso.nodo]}\n\n")
+                    elif paso.tipo == 'aceptada':
+                        u_orig, v_orig, peso = paso.arista
                         u, v = nodos_lista[u_orig], nodos_lista[v_orig]
                         self.txt_resultado_mst.insert('end', 
-                            f"✅ {iter_data['num']}. AGREGAR {u}-{v} (peso: {peso})\n")
+                            f"✅ {paso.num}. AGREGAR {u}-{v} (peso: {peso})\n")
                         self.txt_resultado_mst.insert('end', 
-                            f"   Peso acumulado: {iter_data['peso_total']}\n\n")
+                            f"   Peso acumulado: {paso.peso_total}\n\n")
+                
+                mst, peso_total = AlgoritmosGrafos.resultado(AlgoritmosGrafos.pasos_prim(grafo_idx, 0), mostrar_paso)
                 
                 # Convertir índices de vuelta a nombres
                 mst = [(nodos_lista[u], nodos_lista[v], peso) for u, v, peso in mst]
@@ -1087,6 +1175,78 @@ D E 2"""
         except Exception as e:
             messagebox.showerror("Error", f"Error al ejecutar {algoritmo}: {str(e)}")
     
+    def ejecutar_mst_puntos(self):
+        """Ejecuta el MST euclidiano: Kruskal sobre las aristas de Delaunay de los puntos"""
+        try:
+            self.txt_resultado_mst.delete('1.0', 'end')
+            
+            # Parsear puntos: "x y" (nombre = índice del punto) o "nombre x y"
+            nombres, puntos = AlgoritmosGrafos.parsear_puntos(self.txt_aristas.get('1.0', 'end'))
+            
+            if len(nombres) < 2:
+                messagebox.showerror("Error", "Se necesitan al menos 2 puntos válidos")
+                return
+            
+            u, v, w = AlgoritmosGrafos.aristas_delaunay(puntos)
+            n_candidatas = len(w)
+            elegidas, peso_total = AlgoritmosGrafos.kruskal_vectorizado(u, v, w, len(nombres))
+            u, v, w = u[elegidas], v[elegidas], w[elegidas]
+            
+            self.txt_resultado_mst.insert('end', "=" * 60 + "\n")
+            self.txt_resultado_mst.insert('end', "MST EUCLIDIANO (DELAUNAY + KRUSKAL)\n")
+            self.txt_resultado_mst.insert('end', "=" * 60 + "\n\n")
+            self.txt_resultado_mst.insert('end', f"Puntos: {len(nombres)} (dimensión {puntos.shape[1]})\n")
+            self.txt_resultado_mst.insert('end', 
+                f"Aristas candidatas (Delaunay): {n_candidatas} de {len(nombres) * (len(nombres) - 1) // 2} posibles\n\n")
+            
+            self.txt_resultado_mst.insert('end', f"Árbol de Expansión Mínima:\n")
+            for a, b, peso in zip(u[:MAX_ARISTAS_LISTADAS_MST].tolist(), v[:MAX_ARISTAS_LISTADAS_MST].tolist(),
+                                  w[:MAX_ARISTAS_LISTADAS_MST].tolist()):
+                self.txt_resultado_mst.insert('end', f"  {nombres[a]} - {nombres[b]}: {peso:.4f}\n")
+            if len(w) > MAX_ARISTAS_LISTADAS_MST:
+                self.txt_resultado_mst.insert('end', f"  ... ({len(w) - MAX_ARISTAS_LISTADAS_MST} aristas más)\n")
+            
+            self.txt_resultado_mst.insert('end', f"\n{'='*60}\n")
+            self.txt_resultado_mst.insert('end', f"PESO TOTAL: {peso_total:.4f}\n")
+            self.txt_resultado_mst.insert('end', f"{'='*60}\n")
+            
+            self.visualizar_mst_puntos(puntos, nombres, u, v, "Árbol de Expansión Mínima Euclidiano")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al calcular el MST euclidiano: {str(e)}")
+    
+    def visualizar_mst_puntos(self, puntos, nombres, u, v, titulo):
+        """Visualiza el MST euclidiano sobre las coordenadas (las dos primeras)"""
+        if puntos.shape[1] == 1:
+            puntos = np.column_stack([puntos[:, 0], np.zeros(len(puntos))])
+        xy = puntos[:, :2]
+        
+        fig = plt.Figure(figsize=(10, 6))
+        ax = fig.add_subplot(111)
+        
+        # Un solo LineCollection dibuja miles de aristas sin crear un objeto por arista
+        ax.add_collection(LineCollection(np.stack([xy[u], xy[v]], axis=1), 
+                                         colors='red', linewidths=2 if len(xy) <= 100 else 0.5))
+        ax.scatter(xy[:, 0], xy[:, 1], s=80 if len(xy) <= 100 else 2, c='lightblue', 
+                   edgecolors='black' if len(xy) <= 100 else 'none', zorder=2)
+        if len(xy) <= 100:
+            for nombre, (x, y) in zip(nombres, xy.tolist()):
+                ax.annotate(str(nombre), (x, y), textcoords='offset points', xytext=(6, 6), 
+                            fontsize=10, fontweight='bold')
+        
+        ax.set_title(titulo, fontsize=14, fontweight='bold')
+        ax.set_aspect('equal', adjustable='datalim')
+        ax.autoscale_view()
+        
+        # Mostrar en ventana nueva
+        ventana = tk.Toplevel(self.root)
+        ventana.title(titulo)
+        ventana.geometry("1000x700")
+        
+        canvas = FigureCanvasTkAgg(fig, master=ventana)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill='both', expand=True)
+    
     def visualizar_mst(self, grafo, mst, titulo):
         """Visualiza el árbol de expansión mínima"""
         G = nx.Graph()
@@ -1153,30 +1313,20 @@ D E 2"""
                 return
             
             es_dirigido = self.var_dirigido_dijkstra.get()
-            
-            grafo = {}
-            for linea in texto.split('\n'):
-                if linea.strip():
-                    resultado = self._parsear_arista(linea, es_dirigido)
-                    if resultado:
-                        u, v, peso, es_bidireccional = resultado
-                        
-                        if u not in grafo:
-                            grafo[u] = {}
-                        if v not in grafo:
-                            grafo[v] = {}
-                        
-                        # Agregar arista u → v siempre
-                        grafo[u][v] = peso
-                        
-                        # Si es bidireccional, agregar también v → u
-                        if es_bidireccional:
-                            grafo[v][u] = peso
+            grafo = self._parsear_grafo_dijkstra(texto, es_dirigido)
             
             if origen not in grafo:
                 messagebox.showerror("Error", f"El nodo origen '{origen}' no existe en el grafo")
                 return
             
+            destino = self.entry_destino_dijkstra.get().strip()
+            if destino:
+                if destino not in grafo:
+                    messagebox.showerror("Error", f"El nodo destino '{destino}' no existe en el grafo")
+                    return
+                self._mostrar_ruta_dijkstra(grafo, origen, destino)
+                return
+            
             # Ejecutar Dijkstra
             tipo_grafo = "DIRIGIDO" if es_dirigido else "NO DIRIGIDO"
             self.txt_resultado_dijkstra.insert('end', "=" * 60 + "\n")
@@ -1185,46 +1335,76 @@ D E 2"""
             self.txt_resultado_dijkstra.insert('end', f"Tipo de grafo: {tipo_grafo}\n")
             self.txt_resultado_dijkstra.insert('end', f"Nodo origen: {origen}\n\n")
             
-            distancias, predecesores, iteraciones = AlgoritmosGrafos.dijkstra(grafo, origen)
-            
-            # Mostrar iteraciones paso a paso
+            # Mostrar iteraciones paso a paso a medida que se generan
             self.txt_resultado_dijkstra.insert('end', "📊 PROCESO DE EXPLORACIÓN PASO A PASO:\n")
             self.txt_resultado_dijkstra.insert('end', "=" * 60 + "\n\n")
-            
-            for iter_data in iteraciones:
-                self.txt_resultado_dijkstra.insert('end', 
-                    f"🔵 ITERACIÓN {iter_data['num']}: Visitando nodo {iter_data['nodo_actual']} ")
+            # Si el mismo grafo y origen ya se resolvieron, se reutiliza el
+            # resultado (y los pasos, que se vuelven a mostrar sin recalcular)
+            clave = CACHE_RUTAS.clave(grafo, origen)
+            con_pasos = len(grafo) <= MAX_NODOS_PASOS_DIJKSTRA
+            entrada = CACHE_RUTAS.obtener(clave, con_pasos)
+            if not con_pasos:
                 self.txt_resultado_dijkstra.insert('end', 
-                    f"(distancia: {iter_data['dist_actual']:.1f})\n")
+                    f"   (omitido: el grafo tiene {len(grafo)} nodos, más de {MAX_NODOS_PASOS_DIJKSTRA})\n\n")
+                if entrada is None:
+                    distancias, predecesores, _ = AlgoritmosGrafos.dijkstra(grafo, origen)
+                    entrada = CACHE_RUTAS.guardar(clave, distancias, predecesores)
+            else:
+                distancias_actuales = {nodo: float('inf') for nodo in grafo}
+                distancias_actuales[origen] = 0
+                visitados = set()
+                nodos_ordenados = sorted(grafo.keys())
                 
-                if iter_data['actualizaciones']:
-                    self.txt_resultado_dijkstra.insert('end', "   Actualizaciones:\n")
-                    for act in iter_data['actualizaciones']:
-                        self.txt_resultado_dijkstra.insert('end', 
-                            f"   • {act['vecino']}: ")
-                        if act['dist_anterior'] == float('inf'):
-                            self.txt_resultado_dijkstra.insert('end', "∞")
+                def mostrar_paso(paso):
+                    visitados.add(paso.nodo_actual)
+                    self.txt_resultado_dijkstra.insert('end', 
+                        f"🔵 ITERACIÓN {paso.num}: Visitando nodo {paso.nodo_actual} ")
+                    self.txt_resultado_dijkstra.insert('end', 
+                        f"(distancia: {paso.dist_actual:.1f})\n")
+                    
+                    if paso.actualizaciones:
+                        self.txt_resultado_dijkstra.insert('end', "   Actualizaciones:\n")
+                        for act in paso.actualizaciones:
+                            distancias_actuales[act.vecino] = act.dist_nueva
+                            self.txt_resultado_dijkstra.insert('end', 
+                                f"   • {act.vecino}: ")
+                            if act.dist_anterior == float('inf'):
+                                self.txt_resultado_dijkstra.insert('end', "∞")
+                            else:
+                                self.txt_resultado_dijkstra.insert('end', f"{act.dist_anterior:.1f}")
+                            self.txt_resultado_dijkstra.insert('end', 
+                                f" → {act.dist_nueva:.1f} (peso arista: {act.peso_arista})\n")
+                    else:
+                        self.txt_resultado_dijkstra.insert('end', "   ✓ Sin actualizaciones (nodo sin vecinos no visitados)\n")
+                    
+                    # Mostrar estado actual de distancias
+                    self.txt_resultado_dijkstra.insert('end', "\n   Estado actual de distancias:\n")
+                    self.txt_resultado_dijkstra.insert('end', "   ")
+                    for nodo in nodos_ordenados:
+                        dist = distancias_actuales[nodo]
+                        if dist == float('inf'):
+                            dist_str = "∞"
                         else:
-                            self.txt_resultado_dijkstra.insert('end', f"{act['dist_anterior']:.1f}")
-                        self.txt_resultado_dijkstra.insert('end', 
-                            f" → {act['dist_nueva']:.1f} (peso arista: {act['peso_arista']})\n")
-                else:
-                    self.txt_resultado_dijkstra.insert('end', "   ✓ Sin actualizaciones (nodo sin vecinos no visitados)\n")
+                            dist_str = f"{dist:.1f}"
+                        
+                        visitado = "✓" if nodo in visitados else "○"
+                        self.txt_resultado_dijkstra.insert('end', f"{nodo}:{dist_str}{visitado} ")
+                    self.txt_resultado_dijkstra.insert('end', "\n\n")
                 
-                # Mostrar estado actual de distancias
-                self.txt_resultado_dijkstra.insert('end', "\n   Estado actual de distancias:\n")
-                self.txt_resultado_dijkstra.insert('end', "   ")
-                nodos_ordenados = sorted(iter_data['distancias'].keys())
-                for nodo in nodos_ordenados:
-                    dist = iter_data['distancias'][nodo]
-                    if dist == float('inf'):
-                        dist_str = "∞"
-                    else:
-                        dist_str = f"{dist:.1f}"
+                if entrada is None:
+                    pasos = []
                     
-                    visitado = "✓" if nodo in iter_data['visitados'] else "○"
-                    self.txt_resultado_dijkstra.insert('end', f"{nodo}:{dist_str}{visitado} ")
-                self.txt_resultado_dijkstra.insert('end', "\n\n")
+                    def registrar_paso(paso):
+                        pasos.append(paso)
+                        mostrar_paso(paso)
+                    
+                    distancias, predecesores = AlgoritmosGrafos.resultado(
+                        AlgoritmosGrafos.pasos_dijkstra(grafo, origen), registrar_paso)
+                    entrada = CACHE_RUTAS.guardar(clave, distancias, predecesores, tuple(pasos))
+                else:
+                    for paso in entrada.pasos:
+                        mostrar_paso(paso)
+            distancias, predecesores = entrada.distancias, entrada.predecesores
             
             self.txt_resultado_dijkstra.insert('end', "=" * 60 + "\n")
             self.txt_resultado_dijkstra.insert('end', "✅ RESULTADO FINAL - DISTANCIAS MÍNIMAS\n")
@@ -1271,9 +1451,122 @@ D E 2"""
             # Visualizar el grafo con las rutas más cortas y el SPT
             self._visualizar_dijkstra(grafo, origen, distancias, predecesores)
             
+            # Después de la visualización, que deja su propio mensaje en la barra de estado
+            self._actualizar_status(f"Dijkstra desde {origen} - {CACHE_RUTAS.resumen()}", 'success')
+            
         except Exception as e:
             messagebox.showerror("Error", f"Error al ejecutar Dijkstra: {str(e)}")
     
+    def _parsear_grafo_dijkstra(self, texto, es_dirigido):
+        """Construye el grafo {nodo: {vecino: peso}} de la pestaña de Dijkstra"""
+        grafo = {}
+        for linea in texto.split('\n'):
+            if linea.strip():
+                resultado = self._parsear_arista(linea, es_dirigido)
+                if resultado:
+                    u, v, peso, es_bidireccional = resultado
+                    
+                    if u not in grafo:
+                        grafo[u] = {}
+                    if v not in grafo:
+                        grafo[v] = {}
+                    
+                    # Agregar arista u → v siempre
+                    grafo[u][v] = peso
+                    
+                    # Si es bidireccional, agregar también v → u
+                    if es_bidireccional:
+                        grafo[v][u] = peso
+        return grafo
+    
+    def ejecutar_k_rutas(self):
+        """Muestra las k rutas más cortas sin ciclos entre origen y destino (Yen)"""
+        try:
+            self.txt_resultado_dijkstra.delete('1.0', 'end')
+            
+            texto = self.txt_aristas_dijkstra.get('1.0', 'end').strip()
+            origen = self.entry_origen.get().strip()
+            destino = self.entry_destino_dijkstra.get().strip()
+            
+            if not origen or not destino:
+                messagebox.showerror("Error", "Debe especificar el nodo origen y el nodo destino")
+                return
+            
+            try:
+                k = int(self.entry_k_rutas.get().strip())
+                if k < 1:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("Error", "La cantidad de rutas (k) debe ser un entero positivo")
+                return
+            
+            es_dirigido = self.var_dirigido_dijkstra.get()
+            grafo = self._parsear_grafo_dijkstra(texto, es_dirigido)
+            
+            for nodo, rol in ((origen, 'origen'), (destino, 'destino')):
+                if nodo not in grafo:
+                    messagebox.showerror("Error", f"El nodo {rol} '{nodo}' no existe en el grafo")
+                    return
+            
+            rutas, completa = AlgoritmosGrafos.k_rutas_mas_cortas(grafo, origen, destino, k)
+            
+            tipo_grafo = "DIRIGIDO" if es_dirigido else "NO DIRIGIDO"
+            self.txt_resultado_dijkstra.insert('end', "=" * 60 + "\n")
+            self.txt_resultado_dijkstra.insert('end', f"K RUTAS MÁS CORTAS (YEN, k = {k})\n")
+            self.txt_resultado_dijkstra.insert('end', "=" * 60 + "\n\n")
+            self.txt_resultado_dijkstra.insert('end', f"Tipo de grafo: {tipo_grafo}\n")
+            self.txt_resultado_dijkstra.insert('end', f"Nodo origen: {origen}\n")
+            self.txt_resultado_dijkstra.insert('end', f"Nodo destino: {destino}\n\n")
+            
+            if not rutas:
+                self.txt_resultado_dijkstra.insert('end', f"{origen} → {destino}: ∞ (no alcanzable)\n")
+            for num, (distancia, camino) in enumerate(rutas, 1):
+                self.txt_resultado_dijkstra.insert('end', f"{num}. Distancia: {distancia}\n")
+                self.txt_resultado_dijkstra.insert('end', f"   Camino: {' → '.join(map(str, camino))}\n\n")
+            
+            if len(rutas) < k and completa:
+                self.txt_resultado_dijkstra.insert('end', 
+                    f"ℹ️  Solo existen {len(rutas)} rutas sin ciclos entre {origen} y {destino}\n")
+            if not completa:
+                self.txt_resultado_dijkstra.insert('end', 
+                    "⚠️  Se alcanzó el presupuesto de búsqueda: se muestran las rutas halladas hasta ese momento\n")
+            
+            self._actualizar_status(f"{len(rutas)} rutas de {origen} a {destino}", 'success' if completa else 'warning')
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al calcular las k rutas: {str(e)}")
+    
+    def _mostrar_ruta_dijkstra(self, grafo, origen, destino):
+        """Muestra solo la ruta origen → destino calculada con Dijkstra bidireccional"""
+        distancia, camino, asentados = AlgoritmosGrafos.ruta_mas_corta(grafo, origen, destino)
+        
+        tipo_grafo = "DIRIGIDO" if self.var_dirigido_dijkstra.get() else "NO DIRIGIDO"
+        self.txt_resultado_dijkstra.insert('end', "=" * 60 + "\n")
+        self.txt_resultado_dijkstra.insert('end', "DIJKSTRA BIDIRECCIONAL (RUTA PUNTO A PUNTO)\n")
+        self.txt_resultado_dijkstra.insert('end', "=" * 60 + "\n\n")
+        self.txt_resultado_dijkstra.insert('end', f"Tipo de grafo: {tipo_grafo}\n")
+        self.txt_resultado_dijkstra.insert('end', f"Nodo origen: {origen}\n")
+        self.txt_resultado_dijkstra.insert('end', f"Nodo destino: {destino}\n\n")
+        
+        if distancia == float('inf'):
+            self.txt_resultado_dijkstra.insert('end', f"{origen} → {destino}: ∞ (no alcanzable)\n")
+        else:
+            self.txt_resultado_dijkstra.insert('end', f"{origen} → {destino}: {distancia}\n")
+            self.txt_resultado_dijkstra.insert('end', f"  Camino: {' → '.join(map(str, camino))}\n")
+        self.txt_resultado_dijkstra.insert('end', 
+            f"\n🔎 Nodos asentados: {asentados} de {len(grafo)}\n")
+        
+        # Visualizar solo los nodos de la ruta
+        distancias = {}
+        predecesores = {}
+        acumulada = 0
+        for idx, nodo in enumerate(camino):
+            if idx > 0:
+                acumulada += grafo[camino[idx - 1]][nodo]
+                predecesores[nodo] = camino[idx - 1]
+            distancias[nodo] = acumulada
+        self._visualizar_dijkstra(grafo, origen, distancias, predecesores)
+    
     def _reconstruir_camino(self, predecesores, origen, destino):
         """Reconstruye un camino desde origen hasta destino"""
         if predecesores[destino] is None and destino != origen:
@@ -1333,102 +1626,58 @@ D E 2"""
             self.txt_resultado_fw.insert('end', f"ALGORITMO DE FLOYD-WARSHALL ({tipo_grafo})\n")
             self.txt_resultado_fw.insert('end', "=" * 60 + "\n\n")
             
-            dist, next_node, nodos_lista, nodo_a_idx, iteraciones = AlgoritmosGrafos.floyd_warshall(grafo)
+            # Si solo cambiaron unos pocos arcos, actualizar el resultado anterior
+            cambios = self._cambios_floyd_incrementales(grafo)
+            actualizado = False
+            if cambios:
+                try:
+                    dist, next_node, filas = AlgoritmosGrafos.actualizar_floyd_warshall(
+                        self.floyd_dist, self.floyd_next, self.floyd_nodos,
+                        self.floyd_nodo_a_idx, grafo, cambios)
+                    nodos_lista, nodo_a_idx = self.floyd_nodos, self.floyd_nodo_a_idx
+                    actualizado = True
+                except ValueError:
+                    pass  # Ciclo negativo: se recalcula desde cero
+            
+            if actualizado:
+                self._mostrar_actualizacion_floyd(cambios, filas)
+            else:
+                dist, next_node, nodos_lista, nodo_a_idx, iteraciones = AlgoritmosGrafos.floyd_warshall(grafo)
+                self._mostrar_iteraciones_floyd(iteraciones, nodos_lista)
             
-            # Mostrar iteraciones paso a paso con AMBAS MATRICES (D y S)
-            self.txt_resultado_fw.insert('end', "📊 ITERACIONES PASO A PASO:\n")
-            self.txt_resultado_fw.insert('end', "=" * 60 + "\n\n")
+            self.txt_resultado_fw.insert('end', "=" * 60 + "\n")
+            self.txt_resultado_fw.insert('end', "✅ RESULTADO FINAL\n")
+            self.txt_resultado_fw.insert('end', "=" * 60 + "\n")
+            self.txt_resultado_fw.insert('end', "\nMATRIZ DE DISTANCIAS FINAL:\n\n")
             
-            for iter_data in iteraciones:
-                if iter_data['k'] == 0:
-                    self.txt_resultado_fw.insert('end', "🔵 ESTADO INICIAL (K=0):\n\n")
-                else:
-                    self.txt_resultado_fw.insert('end', f"\n{'='*60}\n")
-                    self.txt_resultado_fw.insert('end', f"🔵 ITERACIÓN K={iter_data['k']} (nodo intermedio: {iter_data['nodo_intermedio']})\n")
-                    self.txt_resultado_fw.insert('end', f"{'='*60}\n\n")
-                
-                if iter_data['cambios']:
-                    self.txt_resultado_fw.insert('end', f"   📝 Cambios realizados: {len(iter_data['cambios'])}\n")
-                    for cambio in iter_data['cambios'][:5]:  # Mostrar máximo 5 cambios
-                        self.txt_resultado_fw.insert('end', 
-                            f"      • {cambio['origen']}→{cambio['destino']}: ")
-                        if cambio['dist_anterior'] == float('inf'):
-                            self.txt_resultado_fw.insert('end', "∞")
-                        else:
-                            self.txt_resultado_fw.insert('end', f"{cambio['dist_anterior']:.1f}")
-                        self.txt_resultado_fw.insert('end', 
-                            f" → {cambio['dist_nueva']:.1f} (vía {cambio['via']})\n")
-                    if len(iter_data['cambios']) > 5:
-                        self.txt_resultado_fw.insert('end', 
-                            f"      ... y {len(iter_data['cambios']) - 5} cambios más\n")
-                    self.txt_resultado_fw.insert('end', "\n")
-                else:
-                    if iter_data['k'] > 0:
-                        self.txt_resultado_fw.insert('end', "   ✓ No se realizaron cambios en esta iteración\n\n")
-                
-                # Mostrar MATRIZ D (Distancias)
-                n = len(nodos_lista)
-                self.txt_resultado_fw.insert('end', "   📐 MATRIZ D (Distancias):\n")
+            # Imprimir matriz (en grafos grandes se consulta ruta por ruta)
+            n = len(nodos_lista)
+            if n > MAX_NODOS_RESUMEN_FLOYD:
+                self.txt_resultado_fw.insert('end', 
+                    f"   Matriz de {n}×{n} omitida (más de {MAX_NODOS_RESUMEN_FLOYD} nodos)\n")
+            else:
                 self.txt_resultado_fw.insert('end', "      ")
                 for nodo in nodos_lista:
                     self.txt_resultado_fw.insert('end', f"{str(nodo):>6}")
                 self.txt_resultado_fw.insert('end', "\n")
                 
                 for i, nodo in enumerate(nodos_lista):
-                    self.txt_resultado_fw.insert('end', f"   {str(nodo):>4}: ")
+                    self.txt_resultado_fw.insert('end', f"{str(nodo):>4}: ")
                     for j in range(n):
-                        val = iter_data['matriz_d'][i][j]
+                        val = dist[i][j]
                         if val == float('inf'):
                             self.txt_resultado_fw.insert('end', "   ∞  ")
                         else:
                             self.txt_resultado_fw.insert('end', f"{val:>6.1f}")
                     self.txt_resultado_fw.insert('end', "\n")
-                
-                # Mostrar MATRIZ S (Predecesores)
-                self.txt_resultado_fw.insert('end', "\n   🧭 MATRIZ S (Predecesores):\n")
-                self.txt_resultado_fw.insert('end', "      ")
-                for nodo in nodos_lista:
-                    self.txt_resultado_fw.insert('end', f"{str(nodo):>6}")
-                self.txt_resultado_fw.insert('end', "\n")
-                
-                for i, nodo in enumerate(nodos_lista):
-                    self.txt_resultado_fw.insert('end', f"   {str(nodo):>4}: ")
-                    for j in range(n):
-                        val = iter_data['matriz_s'][i][j]
-                        if val is None:
-                            self.txt_resultado_fw.insert('end', "   -  ")
-                        else:
-                            self.txt_resultado_fw.insert('end', f"{str(val):>6}")
-                    self.txt_resultado_fw.insert('end', "\n")
-                self.txt_resultado_fw.insert('end', "\n")
-            
-            self.txt_resultado_fw.insert('end', "=" * 60 + "\n")
-            self.txt_resultado_fw.insert('end', "✅ RESULTADO FINAL\n")
-            self.txt_resultado_fw.insert('end', "=" * 60 + "\n")
-            self.txt_resultado_fw.insert('end', "\nMATRIZ DE DISTANCIAS FINAL:\n\n")
-            
-            # Imprimir matriz
-            n = len(nodos_lista)
-            self.txt_resultado_fw.insert('end', "      ")
-            for nodo in nodos_lista:
-                self.txt_resultado_fw.insert('end', f"{str(nodo):>6}")
-            self.txt_resultado_fw.insert('end', "\n")
-            
-            for i, nodo in enumerate(nodos_lista):
-                self.txt_resultado_fw.insert('end', f"{str(nodo):>4}: ")
-                for j in range(n):
-                    val = dist[i][j]
-                    if val == float('inf'):
-                        self.txt_resultado_fw.insert('end', "   ∞  ")
-                    else:
-                        self.txt_resultado_fw.insert('end', f"{val:>6.1f}")
-                self.txt_resultado_fw.insert('end', "\n")
             
             # Guardar resultados para consultas posteriores
             self.floyd_dist = dist
             self.floyd_next = next_node
             self.floyd_nodos = nodos_lista
             self.floyd_nodo_a_idx = nodo_a_idx
+            self.floyd_grafo = grafo
+            self.floyd_almacen = None
             
             # Visualizar el grafo
             self._visualizar_floyd_warshall(grafo, dist, nodos_lista)
@@ -1441,6 +1690,118 @@ D E 2"""
         except Exception as e:
             messagebox.showerror("Error", f"Error al ejecutar Floyd-Warshall: {str(e)}")
     
+    def _cambios_floyd_incrementales(self, grafo):
+        """
+        Retorna los arcos que cambiaron respecto de la última ejecución de
+        Floyd-Warshall, o None si conviene recalcular todo (primera ejecución,
+        nodos distintos, sin cambios o demasiados cambios)
+        """
+        if self.floyd_grafo is None or set(grafo) != set(self.floyd_grafo):
+            return None
+        cambios = AlgoritmosGrafos.diferencias_arcos(self.floyd_grafo, grafo)
+        if 0 < len(cambios) <= MAX_ARCOS_FLOYD_INCREMENTAL:
+            return cambios
+        return None
+    
+    def _mostrar_actualizacion_floyd(self, cambios, filas_recalculadas):
+        """Muestra los arcos modificados en una actualización incremental de Floyd-Warshall"""
+        self.txt_resultado_fw.insert('end', "♻️ ACTUALIZACIÓN INCREMENTAL (se reutiliza el resultado anterior):\n")
+        self.txt_resultado_fw.insert('end', "=" * 60 + "\n\n")
+        for u, v, peso_anterior, peso_nuevo in cambios:
+            anterior = "∅" if peso_anterior is None else peso_anterior
+            nuevo = "∅" if peso_nuevo is None else peso_nuevo
+            self.txt_resultado_fw.insert('end', f"   • {u}→{v}: {anterior} → {nuevo}\n")
+        self.txt_resultado_fw.insert('end', f"\n   Filas recalculadas: {len(filas_recalculadas)}\n")
+        if filas_recalculadas:
+            self.txt_resultado_fw.insert('end', f"   Orígenes: {', '.join(map(str, filas_recalculadas))}\n")
+        self.txt_resultado_fw.insert('end', "\n")
+    
+    def _mostrar_iteraciones_floyd(self, iteraciones, nodos_lista):
+        """Muestra las iteraciones de Floyd-Warshall con las matrices D y S de cada paso"""
+        # Mostrar iteraciones paso a paso con AMBAS MATRICES (D y S)
+        self.txt_resultado_fw.insert('end', "📊 ITERACIONES PASO A PASO:\n")
+        self.txt_resultado_fw.insert('end', "=" * 60 + "\n\n")
+        
+        if iteraciones is None:
+            # Motores sin iteraciones ('bloques', 'johnson') en grafos grandes
+            self.txt_resultado_fw.insert('end', 
+                "   El motor elegido no registra iteraciones para este tamaño de grafo\n\n")
+            return
+        
+        if len(nodos_lista) > MAX_NODOS_PASOS_FLOYD:
+            # Sin reconstruir matrices: solo la cantidad de celdas mejoradas por paso
+            self.txt_resultado_fw.insert('end', 
+                f"   Matrices D y S por iteración omitidas ({len(nodos_lista)} nodos > {MAX_NODOS_PASOS_FLOYD})\n\n")
+            for k, cambios in enumerate(iteraciones.cambios_por_paso(), 1):
+                self.txt_resultado_fw.insert('end', 
+                    f"   K={k} (nodo intermedio: {nodos_lista[k - 1]}): {cambios} cambios\n")
+            self.txt_resultado_fw.insert('end', "\n")
+            return
+        
+        # La traza reconstruye las matrices de cada paso a medida que se recorre
+        for iter_data in iteraciones:
+            if iter_data['k'] == 0:
+                self.txt_resultado_fw.insert('end', "🔵 ESTADO INICIAL (K=0):\n\n")
+            else:
+                self.txt_resultado_fw.insert('end', f"\n{'='*60}\n")
+                self.txt_resultado_fw.insert('end', f"🔵 ITERACIÓN K={iter_data['k']} (nodo intermedio: {iter_data['nodo_intermedio']})\n")
+                self.txt_resultado_fw.insert('end', f"{'='*60}\n\n")
+            
+            if iter_data['cambios']:
+                self.txt_resultado_fw.insert('end', f"   📝 Cambios realizados: {len(iter_data['cambios'])}\n")
+                for cambio in iter_data['cambios'][:5]:  # Mostrar máximo 5 cambios
+                    self.txt_resultado_fw.insert('end', 
+                        f"      • {cambio['origen']}→{cambio['destino']}: ")
+                    if cambio['dist_anterior'] == float('inf'):
+                        self.txt_resultado_fw.insert('end', "∞")
+                    else:
+                        self.txt_resultado_fw.insert('end', f"{cambio['dist_anterior']:.1f}")
+                    self.txt_resultado_fw.insert('end', 
+                        f" → {cambio['dist_nueva']:.1f} (vía {cambio['via']})\n")
+                if len(iter_data['cambios']) > 5:
+                    self.txt_resultado_fw.insert('end', 
+                        f"      ... y {len(iter_data['cambios']) - 5} cambios más\n")
+                self.txt_resultado_fw.insert('end', "\n")
+            else:
+                if iter_data['k'] > 0:
+                    self.txt_resultado_fw.insert('end', "   ✓ No se realizaron cambios en esta iteración\n\n")
+            
+            # Mostrar MATRIZ D (Distancias)
+            n = len(nodos_lista)
+            self.txt_resultado_fw.insert('end', "   📐 MATRIZ D (Distancias):\n")
+            self.txt_resultado_fw.insert('end', "      ")
+            for nodo in nodos_lista:
+                self.txt_resultado_fw.insert('end', f"{str(nodo):>6}")
+            self.txt_resultado_fw.insert('end', "\n")
+            
+            for i, nodo in enumerate(nodos_lista):
+                self.txt_resultado_fw.insert('end', f"   {str(nodo):>4}: ")
+                for j in range(n):
+                    val = iter_data['matriz_d'][i][j]
+                    if val == float('inf'):
+                        self.txt_resultado_fw.insert('end', "   ∞  ")
+                    else:
+                        self.txt_resultado_fw.insert('end', f"{val:>6.1f}")
+                self.txt_resultado_fw.insert('end', "\n")
+            
+            # Mostrar MATRIZ S (Predecesores)
+            self.txt_resultado_fw.insert('end', "\n   🧭 MATRIZ S (Predecesores):\n")
+            self.txt_resultado_fw.insert('end', "      ")
+            for nodo in nodos_lista:
+                self.txt_resultado_fw.insert('end', f"{str(nodo):>6}")
+            self.txt_resultado_fw.insert('end', "\n")
+            
+            for i, nodo in enumerate(nodos_lista):
+                self.txt_resultado_fw.insert('end', f"   {str(nodo):>4}: ")
+                for j in range(n):
+                    val = iter_data['matriz_s'][i][j]
+                    if val is None:
+                        self.txt_resultado_fw.insert('end', "   -  ")
+                    else:
+                        self.txt_resultado_fw.insert('end', f"{str(val):>6}")
+                self.txt_resultado_fw.insert('end', "\n")
+            self.txt_resultado_fw.insert('end', "\n")
+    
     def consultar_ruta_floyd(self):
         """Consulta la ruta y distancia específica entre dos nodos después de Floyd-Warshall"""
         try:
@@ -1558,36 +1919,134 @@ D E 2"""
         except Exception as e:
             messagebox.showerror("Error", f"Error al consultar ruta: {str(e)}")
     
+    def guardar_matrices_floyd(self):
+        """Guarda las matrices de Floyd-Warshall en disco para reabrirlas sin recalcular"""
+        if self.floyd_dist is None:
+            messagebox.showwarning("Advertencia", 
+                "Debes ejecutar Floyd-Warshall primero antes de guardar las matrices.")
+            return
+        if self.floyd_almacen is not None:
+            messagebox.showinfo("Información", 
+                f"Las matrices ya están guardadas en:\n{self.floyd_almacen.directorio}")
+            return
+        
+        try:
+            directorio = filedialog.askdirectory(title="Carpeta donde guardar las matrices")
+            if not directorio:
+                return
+            AlmacenAPSP.guardar(directorio, self.floyd_dist, self.floyd_next, self.floyd_nodos)
+            self._actualizar_status(f"Matrices de Floyd-Warshall guardadas en: {directorio}", 'success')
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudieron guardar las matrices: {str(e)}")
+    
+    def abrir_matrices_floyd(self):
+        """Abre matrices de Floyd-Warshall guardadas; las consultas leen del disco solo las filas necesarias"""
+        try:
+            directorio = filedialog.askdirectory(title="Carpeta con las matrices guardadas")
+            if not directorio:
+                return
+            almacen = AlmacenAPSP.abrir(directorio)
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudieron abrir las matrices: {str(e)}")
+            return
+        
+        self.floyd_almacen = almacen
+        self.floyd_dist = almacen.distancias
+        self.floyd_next = None
+        self.floyd_nodos = almacen.nodos
+        self.floyd_nodo_a_idx = almacen.nodo_a_idx
+        self.floyd_grafo = None  # Sin grafo de origen no hay actualización incremental
+        
+        self.txt_resultado_fw.delete('1.0', 'end')
+        self.txt_resultado_fw.insert('end', "="*60 + "\n")
+        self.txt_resultado_fw.insert('end', "MATRICES DE FLOYD-WARSHALL ABIERTAS DESDE DISCO\n")
+        self.txt_resultado_fw.insert('end', "="*60 + "\n\n")
+        self.txt_resultado_fw.insert('end', f"📂 Carpeta: {directorio}\n")
+        self.txt_resultado_fw.insert('end', f"🔢 Nodos: {len(almacen)}\n")
+        self.txt_resultado_fw.insert('end', f"📐 Tipo de distancias: {almacen.distancias.dtype}\n\n")
+        self.txt_resultado_fw.insert('end', "💡 TIP: Usa la sección 'Consultar Ruta Específica' arriba\n")
+        self.txt_resultado_fw.insert('end', "    para ver el camino y distancia entre dos nodos.\n")
+        self._actualizar_status(f"Matrices abiertas: {len(almacen)} nodos", 'success')
+    
+    def exportar_caminos_floyd(self, filas_por_bloque=256):
+        """Exporta a CSV la distancia y el camino más corto de todos los pares de Floyd-Warshall"""
+        if self.floyd_dist is None:
+            messagebox.showwarning("Advertencia", 
+                "Debes ejecutar Floyd-Warshall primero antes de exportar los caminos.")
+            return
+        
+        try:
+            archivo = filedialog.asksaveasfilename(
+                defaultextension=".csv",
+                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+                title="Exportar caminos"
+            )
+            if not archivo:
+                return
+            
+            if self.floyd_almacen is not None:
+                predecesores = self.floyd_almacen.predecesores
+            else:
+                predecesores = AlgoritmosGrafos._indices_predecesores(self.floyd_next, self.floyd_nodo_a_idx)
+            
+            nodos = self.floyd_nodos
+            n = len(nodos)
+            nombres = [str(nodo) for nodo in nodos]
+            with open(archivo, 'w', newline='', encoding='utf-8') as f:
+                escritor = csv.writer(f)
+                escritor.writerow(['origen', 'destino', 'distancia', 'camino'])
+                # Por bloques de orígenes, para no cargar todas las filas de un almacén en disco
+                for inicio in range(0, n, filas_por_bloque):
+                    filas = range(inicio, min(inicio + filas_por_bloque, n))
+                    desplazamientos, nodos_caminos = AlgoritmosGrafos.extraer_caminos(
+                        self.floyd_dist, predecesores, filas)
+                    desplazamientos = desplazamientos.tolist()
+                    nombres_caminos = [nombres[k] for k in nodos_caminos.tolist()]
+                    for r, i in enumerate(filas):
+                        distancias = np.asarray(self.floyd_dist[i], dtype=float).tolist()
+                        for j in range(n):
+                            ini, fin = desplazamientos[r * n + j], desplazamientos[r * n + j + 1]
+                            if i != j and fin > ini:
+                                escritor.writerow([nombres[i], nombres[j], distancias[j],
+                                                   ' → '.join(nombres_caminos[ini:fin])])
+            
+            self._actualizar_status(f"Caminos exportados a: {archivo}", 'success')
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudieron exportar los caminos: {str(e)}")
+    
     def _reconstruir_camino_floyd(self, origen, destino):
         """Reconstruye el camino entre origen y destino usando la matriz de predecesores"""
         if origen == destino:
             return [origen]
         
+        if self.floyd_almacen is not None:
+            return self.floyd_almacen.camino(origen, destino)
+        
         i = self.floyd_nodo_a_idx[origen]
         j = self.floyd_nodo_a_idx[destino]
         
         if self.floyd_next[i][j] is None:
             return []
         
-        # Reconstruir desde el destino hacia el origen usando predecesores
+        # Reconstruir desde el destino hacia el origen usando la fila de predecesores del origen
+        fila = self.floyd_next[i]
         camino = [destino]
         actual = destino
         
         while actual != origen:
-            idx_actual = self.floyd_nodo_a_idx[actual]
-            idx_origen = self.floyd_nodo_a_idx[origen]
-            predecesor = self.floyd_next[idx_origen][idx_actual]
+            predecesor = fila[self.floyd_nodo_a_idx[actual]]
             
             if predecesor is None or predecesor == actual:
                 return []
             
-            camino.insert(0, predecesor)
+            camino.append(predecesor)
             actual = predecesor
             
             # Protección contra bucles infinitos
             if len(camino) > len(self.floyd_nodos):
                 return []
         
+        camino.reverse()
         return camino
     
     def ejecutar_flujo_maximo(self):
@@ -4,7 +4,7 @@ SOLVER GENERAL DE TEORÍA DE GRAFOS
 ===================================
 
 Herramienta interactiva para resolver CUALQUIER problema de:
-- Árbol de expansión mínima (Kruskal/Prim)
+- Árbol de expansión mínima (Kruskal/Prim), también euclidiano desde puntos
 - Rutas más cortas (Dijkstra/Floyd-Warshall)
 - Flujo máximo (Ford-Fulkerson)
 - Juegos de suma cero
@@ -13,11 +13,15 @@ Modo de uso: Ingresa tus datos, elige el algoritmo, obtén la solución.
 """
 
 import sys
-from algoritmos_grafos import AlgoritmosGrafos
+from algoritmos_grafos import (AlgoritmosGrafos, JerarquiaContraccion, CACHE_RUTAS, ARISTAS_POR_CORRIDA,
+                               PATRON_ARISTA)
 from ejercicio3_ford_fulkerson import FordFulkerson
 import numpy as np
 from scipy.optimize import linprog
 
+# Listas de nodos o aristas más largas que esto se resumen al imprimir
+MAX_ELEMENTOS_IMPRESOS = 50
+
 class SolverGrafos:
     """Solver general para problemas de teoría de grafos"""
     
@@ -75,64 +79,251 @@ class SolverGrafos:
         return aristas, grafo, sorted(list(nodos))
     
     @staticmethod
-    def resolver_mst(texto, algoritmo='kruskal'):
+    def parsear_aristas_arreglos(texto):
+        """
+        Parsea aristas desde texto (mismo formato que parsear_aristas) a
+        arreglos paralelos de NumPy, sin construir el diccionario del grafo
+        
+        Las líneas se separan con una sola expresión regular y los pesos y
+        etiquetas se convierten en bloque.
+        
+        Retorna: u, v (índices de nodo, int32), w (pesos, float64) y la
+                 lista ordenada de nodos a la que apuntan los índices
+        """
+        filas = PATRON_ARISTA.findall(texto)
+        origenes = [fila[0] for fila in filas]
+        destinos = [fila[1] for fila in filas]
+        pesos = [fila[2] for fila in filas]
+        
+        try:
+            w = np.array(pesos, dtype=np.float64)
+        except ValueError:
+            # Hay líneas con peso inválido: se descartan una por una
+            validas = []
+            for i, peso in enumerate(pesos):
+                try:
+                    float(peso)
+                    validas.append(i)
+                except ValueError:
+                    print(f"⚠️ Línea ignorada (formato incorrecto): {' '.join(filas[i])}")
+            origenes = [origenes[i] for i in validas]
+            destinos = [destinos[i] for i in validas]
+            w = np.array([pesos[i] for i in validas], dtype=np.float64)
+        
+        # Como en parsear_aristas, las etiquetas numéricas se ordenan como números
+        etiquetas = origenes + destinos
+        try:
+            extremos = np.fromiter(map(int, etiquetas), dtype=np.int64, count=len(etiquetas))
+        except ValueError:
+            extremos = np.array(etiquetas, dtype=str)
+        nodos, indices = np.unique(extremos, return_inverse=True)
+        indices = indices.astype(np.int32)
+        
+        return indices[:len(w)], indices[len(w):], w, nodos.tolist()
+    
+    @staticmethod
+    def resolver_mst(texto, algoritmo='kruskal', traza=False, n_procesos=1, puntos=False):
         """
         Resuelve árbol de expansión mínima
         
         Args:
-            texto: string con aristas (una por línea: nodo1 nodo2 peso)
-            algoritmo: 'kruskal' o 'prim'
+            texto: string con aristas (una por línea: nodo1 nodo2 peso), o
+                   con puntos si puntos=True (ver AlgoritmosGrafos.parsear_puntos)
+            algoritmo: 'kruskal', 'prim' o 'boruvka'
+            traza: si es True se imprime el proceso paso a paso; si es False
+                   Kruskal usa el parser y el motor vectorizados (NumPy).
+                   Borůvka siempre es vectorizado; con traza se imprime un
+                   resumen por ronda
+            n_procesos: procesos con los que Borůvka reparte las aristas y
+                        Prim (sin traza) las componentes
+            puntos: si es True el texto trae coordenadas y se resuelve el MST
+                    euclidiano con Kruskal sobre las aristas de Delaunay
+                    (se ignoran algoritmo, traza y n_procesos)
         """
+        if puntos:
+            return SolverGrafos.resolver_mst_puntos(texto)
+        
         print("=" * 70)
         print(f"RESOLVIENDO: ÁRBOL DE EXPANSIÓN MÍNIMA ({algoritmo.upper()})")
         print("=" * 70)
         
-        aristas, grafo, nodos = SolverGrafos.parsear_aristas(texto)
+        vectorizado = algoritmo.lower() == 'boruvka' or (algoritmo.lower() == 'kruskal' and not traza)
+        if vectorizado:
+            u, v, w, nodos = SolverGrafos.parsear_aristas_arreglos(texto)
+            n_aristas = len(w)
+        else:
+            aristas, grafo, nodos = SolverGrafos.parsear_aristas(texto)
+            n_aristas = len(aristas)
         
-        if not aristas:
+        if not n_aristas:
             print("❌ Error: No se encontraron aristas válidas")
             return None
         
         print(f"\n📊 Datos de entrada:")
-        print(f"   Nodos: {len(nodos)} → {nodos}")
-        print(f"   Aristas: {len(aristas)}")
-        
-        # Mapear nodos a índices
-        nodo_a_idx = {nodo: i for i, nodo in enumerate(nodos)}
-        aristas_idx = [(nodo_a_idx[u], nodo_a_idx[v], peso) for u, v, peso in aristas]
-        grafo_idx = {nodo_a_idx[n]: {nodo_a_idx[v]: p for v, p in vecinos.items()} 
-                    for n, vecinos in grafo.items()}
+        if len(nodos) <= MAX_ELEMENTOS_IMPRESOS:
+            print(f"   Nodos: {len(nodos)} → {nodos}")
+        else:
+            print(f"   Nodos: {len(nodos)}")
+        print(f"   Aristas: {n_aristas}")
         
         # Resolver
-        if algoritmo.lower() == 'kruskal':
-            mst, peso_total = AlgoritmosGrafos.kruskal(aristas_idx, len(nodos))
+        if vectorizado:
+            if algoritmo.lower() == 'kruskal':
+                elegidas, peso_total = AlgoritmosGrafos.kruskal_vectorizado(u, v, w, len(nodos))
+            else:
+                def mostrar_ronda(ronda):
+                    print(f"   Ronda {ronda.num}: {len(ronda.aristas)} aristas agregadas, "
+                          f"quedan {ronda.componentes} componentes")
+                
+                if traza:
+                    print("\n🔄 Rondas de Borůvka:")
+                elegidas, peso_total = AlgoritmosGrafos.boruvka_vectorizado(
+                    u, v, w, len(nodos), n_procesos, mostrar_ronda if traza else None)
+            mst = [(nodos[a], nodos[b], peso) for a, b, peso in
+                   zip(u[elegidas].tolist(), v[elegidas].tolist(), w[elegidas].tolist())]
         else:
-            mst, peso_total = AlgoritmosGrafos.prim(grafo_idx, 0)
-        
-        # Convertir índices de vuelta a nombres
-        mst = [(nodos[u], nodos[v], peso) for u, v, peso in mst]
+            # Mapear nodos a índices
+            nodo_a_idx = {nodo: i for i, nodo in enumerate(nodos)}
+            aristas_idx = [(nodo_a_idx[u], nodo_a_idx[v], peso) for u, v, peso in aristas]
+            grafo_idx = {nodo_a_idx[n]: {nodo_a_idx[v]: p for v, p in vecinos.items()} 
+                        for n, vecinos in grafo.items()}
+            
+            if algoritmo.lower() == 'kruskal':
+                mst, peso_total, _ = AlgoritmosGrafos.kruskal(aristas_idx, len(nodos))
+            elif traza:
+                mst, peso_total, _ = AlgoritmosGrafos.prim(grafo_idx, 0)
+            else:
+                # Prim por componente: si el grafo no es conexo se obtiene el bosque mínimo
+                mst, peso_total, _ = AlgoritmosGrafos.bosque_minimo(grafo_idx, n_procesos)
+            
+            # Convertir índices de vuelta a nombres
+            mst = [(nodos[u], nodos[v], peso) for u, v, peso in mst]
         
         print("\n" + "=" * 70)
         print("✅ SOLUCIÓN")
         print("=" * 70)
         print(f"\nAristas del MST:")
-        for u, v, peso in mst:
+        for u, v, peso in mst[:MAX_ELEMENTOS_IMPRESOS]:
             print(f"   {u} - {v}: {peso}")
+        if len(mst) > MAX_ELEMENTOS_IMPRESOS:
+            print(f"   ... ({len(mst) - MAX_ELEMENTOS_IMPRESOS} aristas más)")
         print(f"\n🎯 PESO TOTAL DEL MST: {peso_total}")
         print(f"   Aristas en el MST: {len(mst)}")
-        print(f"   Verificación: {len(mst)} = {len(nodos)}-1 ✓")
+        if len(mst) == len(nodos) - 1:
+            print(f"   Verificación: {len(mst)} = {len(nodos)}-1 ✓")
+        else:
+            print(f"   Grafo no conexo: bosque mínimo de {len(nodos) - len(mst)} componentes")
         print("=" * 70)
         
         return {'mst': mst, 'peso': peso_total, 'nodos': nodos}
     
     @staticmethod
-    def resolver_dijkstra(texto, origen):
+    def resolver_mst_puntos(texto):
+        """
+        Resuelve el árbol de expansión mínima euclidiano de un conjunto de puntos
+        
+        El grafo completo tiene n·(n-1)/2 aristas; en su lugar se usan como
+        candidatas las aristas de la triangulación de Delaunay, que contienen
+        al MST, y sobre ellas se corre Kruskal.
+        
+        Args:
+            texto: string con puntos (ver AlgoritmosGrafos.parsear_puntos)
+        """
+        print("=" * 70)
+        print("RESOLVIENDO: ÁRBOL DE EXPANSIÓN MÍNIMA EUCLIDIANO (DELAUNAY + KRUSKAL)")
+        print("=" * 70)
+        
+        nombres, coordenadas = AlgoritmosGrafos.parsear_puntos(texto)
+        
+        if len(nombres) < 2:
+            print("❌ Error: Se necesitan al menos 2 puntos válidos")
+            return None
+        
+        u, v, w = AlgoritmosGrafos.aristas_delaunay(coordenadas)
+        
+        print(f"\n📊 Datos de entrada:")
+        print(f"   Puntos: {len(nombres)} (dimensión {coordenadas.shape[1]})")
+        print(f"   Aristas candidatas (Delaunay): {len(w)} de {len(nombres) * (len(nombres) - 1) // 2} posibles")
+        
+        elegidas, peso_total = AlgoritmosGrafos.kruskal_vectorizado(u, v, w, len(nombres))
+        mst = [(nombres[a], nombres[b], peso) for a, b, peso in
+               zip(u[elegidas].tolist(), v[elegidas].tolist(), w[elegidas].tolist())]
+        
+        print("\n" + "=" * 70)
+        print("✅ SOLUCIÓN")
+        print("=" * 70)
+        print(f"\nAristas del MST:")
+        for a, b, peso in mst[:MAX_ELEMENTOS_IMPRESOS]:
+            print(f"   {a} - {b}: {peso:.4f}")
+        if len(mst) > MAX_ELEMENTOS_IMPRESOS:
+            print(f"   ... ({len(mst) - MAX_ELEMENTOS_IMPRESOS} aristas más)")
+        print(f"\n🎯 PESO TOTAL DEL MST: {peso_total:.4f}")
+        print(f"   Aristas en el MST: {len(mst)}")
+        print(f"   Verificación: {len(mst)} = {len(nombres)}-1 ✓")
+        print("=" * 70)
+        
+        return {'mst': mst, 'peso': peso_total, 'nodos': nombres, 'coordenadas': coordenadas}
+    
+    @staticmethod
+    def resolver_mst_archivo(ruta_archivo, aristas_por_corrida=ARISTAS_POR_CORRIDA):
+        """
+        Resuelve árbol de expansión mínima leyendo las aristas desde un archivo
+        que no necesita entrar en memoria (Kruskal semi-externo)
+        
+        Args:
+            ruta_archivo: archivo con una arista por línea (nodo1 nodo2 peso)
+            aristas_por_corrida: aristas que se ordenan en memoria por vez
+        """
+        print("=" * 70)
+        print("RESOLVIENDO: ÁRBOL DE EXPANSIÓN MÍNIMA (KRUSKAL SEMI-EXTERNO)")
+        print("=" * 70)
+        
+        mst, peso_total, estadisticas = AlgoritmosGrafos.kruskal_externo(ruta_archivo, aristas_por_corrida)
+        
+        if not estadisticas['aristas']:
+            print("❌ Error: No se encontraron aristas válidas")
+            return None
+        
+        print(f"\n📊 Datos de entrada:")
+        print(f"   Archivo: {ruta_archivo}")
+        print(f"   Nodos: {estadisticas['nodos']}")
+        print(f"   Aristas: {estadisticas['aristas']}")
+        if estadisticas['descartadas']:
+            print(f"   ⚠️ Líneas ignoradas (peso inválido): {estadisticas['descartadas']}")
+        print(f"   Corridas ordenadas en disco: {estadisticas['corridas']}")
+        print(f"   Aristas descartadas por el filtro (ya dentro de una componente): {estadisticas['filtradas']}")
+        
+        print("\n" + "=" * 70)
+        print("✅ SOLUCIÓN")
+        print("=" * 70)
+        print(f"\nAristas del MST:")
+        for u, v, peso in mst[:MAX_ELEMENTOS_IMPRESOS]:
+            print(f"   {u} - {v}: {peso}")
+        if len(mst) > MAX_ELEMENTOS_IMPRESOS:
+            print(f"   ... ({len(mst) - MAX_ELEMENTOS_IMPRESOS} aristas más)")
+        print(f"\n🎯 PESO TOTAL DEL MST: {peso_total}")
+        print(f"   Aristas en el MST: {len(mst)}")
+        if len(mst) == estadisticas['nodos'] - 1:
+            print(f"   Verificación: {len(mst)} = {estadisticas['nodos']}-1 ✓")
+        else:
+            print(f"   Grafo no conexo: bosque mínimo de {estadisticas['nodos'] - len(mst)} componentes")
+        print("=" * 70)
+        
+        return {'mst': mst, 'peso': peso_total, 'nodos': estadisticas['nodos']}
+    
+    @staticmethod
+    def resolver_dijkstra(texto, origen, destino=None, cache=CACHE_RUTAS):
         """
         Resuelve rutas más cortas desde un origen (Dijkstra)
         
         Args:
             texto: string con aristas
             origen: nodo origen
+            destino: nodo destino opcional; si se indica, solo se busca esa
+                     ruta con Dijkstra bidireccional en lugar de resolver
+                     todo el grafo
+            cache: CacheRutas donde buscar y guardar el árbol de caminos
+                   (por defecto la compartida con la interfaz; None la desactiva)
         """
         print("=" * 70)
         print("RESOLVIENDO: RUTAS MÁS CORTAS (DIJKSTRA)")
@@ -155,16 +346,51 @@ class SolverGrafos:
             print(f"   Nodos disponibles: {nodos}")
             return None
         
+        if destino is not None:
+            try:
+                destino = int(destino)
+            except ValueError:
+                pass
+            
+            if destino not in grafo:
+                print(f"❌ Error: El nodo destino '{destino}' no existe en el grafo")
+                print(f"   Nodos disponibles: {nodos}")
+                return None
+        
         print(f"\n📊 Datos de entrada:")
         print(f"   Nodos: {len(nodos)} → {nodos}")
         print(f"   Origen: {origen}")
         
+        if destino is not None:
+            print(f"   Destino: {destino}")
+            distancia, camino, asentados = AlgoritmosGrafos.ruta_mas_corta(grafo, origen, destino)
+            
+            print("\n" + "=" * 70)
+            print("✅ SOLUCIÓN")
+            print("=" * 70)
+            if distancia == float('inf'):
+                print(f"\n{origen} → {destino}: ∞ (no alcanzable)")
+            else:
+                print(f"\n{origen} → {destino}: {distancia}")
+                print(f"   Camino: {' → '.join(map(str, camino))}")
+            print(f"   Nodos asentados: {asentados} de {len(nodos)}")
+            print("\n" + "=" * 70)
+            
+            return {'distancia': distancia, 'camino': camino, 'asentados': asentados}
+        
         # Resolver
-        distancias, predecesores = AlgoritmosGrafos.dijkstra(grafo, origen)
+        if cache is None:
+            distancias, predecesores, _ = AlgoritmosGrafos.dijkstra(grafo, origen)
+        else:
+            distancias, predecesores, acierto = cache.dijkstra(grafo, origen)
+            if acierto:
+                print("\n♻️  Árbol de caminos tomado de la caché")
         
         print("\n" + "=" * 70)
         print("✅ SOLUCIÓN")
         print("=" * 70)
+        if cache is not None:
+            print(f"   ({cache.resumen()})")
         
         for nodo in sorted(distancias.keys()):
             if distancias[nodo] == float('inf'):
@@ -179,9 +405,132 @@ class SolverGrafos:
         return {'distancias': distancias, 'predecesores': predecesores}
     
     @staticmethod
-    def resolver_floyd_warshall(texto):
+    def resolver_k_rutas(texto, origen, destino, k=5, dirigido=False):
+        """
+        Resuelve las k rutas más cortas sin ciclos entre dos nodos (Yen)
+        
+        Args:
+            texto: string con aristas
+            origen: nodo origen
+            destino: nodo destino
+            k: cantidad de rutas alternativas
+            dirigido: si es True cada línea es un arco en un solo sentido
+        """
+        print("=" * 70)
+        print(f"RESOLVIENDO: {k} RUTAS MÁS CORTAS (YEN)")
+        print("=" * 70)
+        
+        aristas, grafo, nodos = SolverGrafos.parsear_aristas(texto, dirigido)
+        
+        if not aristas:
+            print("❌ Error: No se encontraron aristas válidas")
+            return None
+        
+        extremos = []
+        for nodo, rol in ((origen, 'origen'), (destino, 'destino')):
+            try:
+                nodo = int(nodo)
+            except ValueError:
+                pass
+            if nodo not in grafo:
+                print(f"❌ Error: El nodo {rol} '{nodo}' no existe en el grafo")
+                print(f"   Nodos disponibles: {nodos}")
+                return None
+            extremos.append(nodo)
+        origen, destino = extremos
+        
+        print(f"\n📊 Datos de entrada:")
+        print(f"   Nodos: {len(nodos)} | Aristas: {len(aristas)}")
+        print(f"   Origen: {origen} | Destino: {destino}")
+        
+        rutas, completa = AlgoritmosGrafos.k_rutas_mas_cortas(grafo, origen, destino, k)
+        
+        print("\n" + "=" * 70)
+        print("✅ SOLUCIÓN")
+        print("=" * 70)
+        if not rutas:
+            print(f"\n{origen} → {destino}: ∞ (no alcanzable)")
+        for num, (distancia, camino) in enumerate(rutas, 1):
+            print(f"\n{num}. Distancia: {distancia}")
+            print(f"   Camino: {' → '.join(map(str, camino))}")
+        if not completa:
+            print("\n⚠️  Se alcanzó el presupuesto de búsqueda: faltan rutas por explorar")
+        print("\n" + "=" * 70)
+        
+        return {'rutas': rutas, 'completa': completa}
+    
+    @staticmethod
+    def resolver_dijkstra_multiorigen(texto, origenes, n_procesos=None):
+        """
+        Resuelve rutas más cortas desde muchos orígenes a la vez (Dijkstra)
+        
+        El grafo se parsea y compacta una sola vez y los orígenes se reparten
+        en un pool de procesos (ver AlgoritmosGrafos.dijkstra_multiorigen).
+        
+        Args:
+            texto: string con aristas
+            origenes: lista de nodos origen
+            n_procesos: procesos del pool (por defecto, todos los núcleos)
+        """
+        print("=" * 70)
+        print("RESOLVIENDO: RUTAS MÁS CORTAS DESDE VARIOS ORÍGENES (DIJKSTRA)")
+        print("=" * 70)
+        
+        aristas, grafo, nodos = SolverGrafos.parsear_aristas(texto)
+        
+        if not aristas:
+            print("❌ Error: No se encontraron aristas válidas")
+            return None
+        
+        # Convertir orígenes si es necesario
+        convertidos = []
+        for origen in origenes:
+            try:
+                origen = int(origen)
+            except ValueError:
+                pass
+            if origen not in grafo:
+                print(f"❌ Error: El nodo origen '{origen}' no existe en el grafo")
+                print(f"   Nodos disponibles: {nodos}")
+                return None
+            convertidos.append(origen)
+        origenes = convertidos
+        
+        print(f"\n📊 Datos de entrada:")
+        print(f"   Nodos: {len(nodos)}")
+        print(f"   Orígenes: {len(origenes)}")
+        
+        # Resolver
+        distancias, predecesores, nodos_lista = AlgoritmosGrafos.dijkstra_multiorigen(
+            grafo, origenes, n_procesos)
+        
+        print("\n" + "=" * 70)
+        print("✅ SOLUCIÓN")
+        print("=" * 70)
+        
+        for origen, fila in zip(origenes, distancias):
+            finitas = fila[np.isfinite(fila)]
+            alcanzables = len(finitas) - 1  # Sin contar el propio origen
+            media = finitas.sum() / alcanzables if alcanzables else 0.0
+            print(f"\n{origen}: {alcanzables} nodos alcanzables | "
+                  f"distancia máxima: {finitas.max()} | distancia media: {media:.2f}")
+        
+        print("\n" + "=" * 70)
+        
+        return {'distancias': distancias, 'predecesores': predecesores,
+                'nodos': nodos_lista, 'origenes': origenes}
+    
+    @staticmethod
+    def resolver_floyd_warshall(texto, motor='auto', n_procesos=None):
         """
         Resuelve rutas más cortas entre todos los pares (Floyd-Warshall)
+        
+        Args:
+            texto: string con aristas
+            motor: 'python', 'numpy', 'bloques', 'johnson' o 'auto'
+                   (ver AlgoritmosGrafos.floyd_warshall)
+            n_procesos: procesos para los motores 'bloques' y 'johnson'
+                        (por defecto, todos los núcleos)
         """
         print("=" * 70)
         print("RESOLVIENDO: TODAS LAS RUTAS MÁS CORTAS (FLOYD-WARSHALL)")
@@ -208,7 +557,8 @@ class SolverGrafos:
         print(f"   Aristas: {len(aristas)}")
         
         # Resolver
-        dist, next_node, nodos_lista, nodo_a_idx = AlgoritmosGrafos.floyd_warshall(grafo)
+        dist, next_node, nodos_lista, nodo_a_idx, _ = AlgoritmosGrafos.floyd_warshall(
+            grafo, motor=motor, n_procesos=n_procesos)
         
         print("\n" + "=" * 70)
         print("✅ MATRIZ DE DISTANCIAS FINALES")
@@ -216,6 +566,105 @@ class SolverGrafos:
         
         return {'distancias': dist, 'nodos': nodos_lista, 'indices': nodo_a_idx}
     
+    @staticmethod
+    def resolver_componentes(texto, dirigido=False, n_procesos=None):
+        """
+        Descompone el grafo en componentes y resuelve cada una por separado
+        
+        Las rutas más cortas entre todos los pares se calculan por componente
+        débilmente conexa, sin armar los bloques ∞ entre componentes. Si el
+        grafo no es dirigido también se obtiene el bosque de expansión mínima.
+        
+        Args:
+            texto: string con aristas
+            dirigido: si es True se informan además las componentes
+                      fuertemente conexas (y no se calcula el bosque mínimo)
+            n_procesos: procesos del pool (por defecto, todos los núcleos)
+        """
+        print("=" * 70)
+        print("RESOLVIENDO: DESCOMPOSICIÓN EN COMPONENTES")
+        print("=" * 70)
+        
+        aristas, grafo, nodos = SolverGrafos.parsear_aristas(texto, dirigido=dirigido)
+        
+        if not aristas:
+            print("❌ Error: No se encontraron aristas válidas")
+            return None
+        
+        for vecinos in list(grafo.values()):
+            for nodo in vecinos:
+                grafo.setdefault(nodo, {})
+        
+        componentes = AlgoritmosGrafos.componentes(grafo)
+        
+        print(f"\n📊 Datos de entrada:")
+        print(f"   Nodos: {len(grafo)}")
+        print(f"   Aristas: {len(aristas)}")
+        print(f"   Componentes {'débilmente ' if dirigido else ''}conexas: {len(componentes)}")
+        for i, componente in enumerate(componentes[:MAX_ELEMENTOS_IMPRESOS], 1):
+            muestra = componente[:MAX_ELEMENTOS_IMPRESOS]
+            resto = f" ... (+{len(componente) - len(muestra)})" if len(componente) > len(muestra) else ""
+            print(f"   {i}. {len(componente)} nodos → {muestra}{resto}")
+        if len(componentes) > MAX_ELEMENTOS_IMPRESOS:
+            print(f"   ... ({len(componentes) - MAX_ELEMENTOS_IMPRESOS} componentes más)")
+        
+        resultado = {'componentes': componentes}
+        if dirigido:
+            fuertes = AlgoritmosGrafos.componentes(grafo, fuertes=True)
+            print(f"   Componentes fuertemente conexas: {len(fuertes)}")
+            resultado['fuertes'] = fuertes
+        else:
+            mst, peso_total, _ = AlgoritmosGrafos.bosque_minimo(grafo, n_procesos)
+            print(f"\n🌳 Bosque de expansión mínima: {len(mst)} aristas, peso total {peso_total}")
+            resultado['mst'], resultado['peso'] = mst, peso_total
+        
+        resultado['apsp'] = AlgoritmosGrafos.apsp_por_componentes(grafo, n_procesos)
+        
+        print("\n" + "=" * 70)
+        print("✅ Consultas: resultado['apsp'].distancia(origen, destino) y .camino(origen, destino)")
+        print("=" * 70)
+        
+        return resultado
+    
+    @staticmethod
+    def construir_jerarquia(texto, dirigido=False, archivo=None):
+        """
+        Preprocesa una red fija como jerarquía de contracción
+        
+        Args:
+            texto: string con aristas (mismo formato que parsear_aristas)
+            dirigido: si es False cada arista vale en ambos sentidos
+            archivo: ruta .npz opcional donde guardar la jerarquía
+                     (se recupera con JerarquiaContraccion.cargar)
+        
+        Retorna la JerarquiaContraccion, lista para ruta(), distancia() y
+        tabla_distancias().
+        """
+        print("=" * 70)
+        print("PREPROCESANDO: JERARQUÍA DE CONTRACCIÓN")
+        print("=" * 70)
+        
+        aristas, _, nodos = SolverGrafos.parsear_aristas(texto, dirigido)
+        
+        if not aristas:
+            print("❌ Error: No se encontraron aristas válidas")
+            return None
+        
+        jerarquia = JerarquiaContraccion.construir(aristas, dirigido)
+        
+        print(f"\n📊 Datos de entrada:")
+        print(f"   Nodos: {len(nodos)}")
+        print(f"   Aristas: {len(aristas)}")
+        print(f"   Atajos agregados: {jerarquia.n_atajos}")
+        
+        if archivo:
+            jerarquia.guardar(archivo)
+            print(f"\n💾 Jerarquía guardada en: {archivo}")
+        
+        print("=" * 70)
+        
+        return jerarquia
+    
     @staticmethod
     def resolver_flujo_maximo(texto, origen, destino):
         """
@@ -396,6 +845,12 @@ def mostrar_menu():
     print("  4. Todas las Rutas - Floyd-Warshall")
     print("  5. Flujo Máximo - Ford-Fulkerson")
     print("  6. Juego de Suma Cero")
+    print("  7. Rutas Más Cortas - Dijkstra multiorigen")
+    print("  8. K Rutas Más Cortas - Yen")
+    print("  9. Árbol de Expansión Mínima - Borůvka")
+    print(" 10. Árbol de Expansión Mínima desde archivo - Kruskal semi-externo")
+    print(" 11. Descomposición en Componentes (bosque mínimo y rutas por componente)")
+    print(" 12. Árbol de Expansión Mínima Euclidiano - Puntos (Delaunay + Kruskal)")
     print("\n  0. Salir")
     print("=" * 70)
 
@@ -414,6 +869,21 @@ def solicitar_aristas():
     
     return '\n'.join(lineas)
 
+def solicitar_puntos():
+    """Solicita al usuario que ingrese puntos"""
+    print("\n📝 Ingrese los puntos (formato: x y  o  nombre x y)")
+    print("   Ejemplo: A 0 0  o  1.5 2")
+    print("   Ingrese una línea vacía para terminar\n")
+    
+    lineas = []
+    while True:
+        linea = input("   ").strip()
+        if not linea:
+            break
+        lineas.append(linea)
+    
+    return '\n'.join(lineas)
+
 def solicitar_matriz():
     """Solicita matriz para juego de suma cero"""
     print("\n📝 Ingrese la matriz de pagos (una fila por línea)")
@@ -437,24 +907,26 @@ def main():
     while True:
         try:
             mostrar_menu()
-            opcion = input("\n👉 Selecciona un algoritmo (0-6): ").strip()
+            opcion = input("\n👉 Selecciona un algoritmo (0-12): ").strip()
             
             if opcion == '0':
                 print("\n👋 ¡Hasta luego! Buena suerte en tu examen 🍀\n")
                 break
             
-            elif opcion in ['1', '2']:
+            elif opcion in ['1', '2', '9']:
                 texto = solicitar_aristas()
                 if texto:
-                    algoritmo = 'kruskal' if opcion == '1' else 'prim'
-                    SolverGrafos.resolver_mst(texto, algoritmo)
+                    algoritmo = {'1': 'kruskal', '2': 'prim', '9': 'boruvka'}[opcion]
+                    traza = input("\n📝 ¿Mostrar el proceso paso a paso? (S/n): ").strip().lower() != 'n'
+                    SolverGrafos.resolver_mst(texto, algoritmo, traza)
                 input("\nPresiona ENTER para continuar...")
             
             elif opcion == '3':
                 texto = solicitar_aristas()
                 if texto:
                     origen = input("\n🎯 Nodo origen: ").strip()
-                    SolverGrafos.resolver_dijkstra(texto, origen)
+                    destino = input("🎯 Nodo destino (ENTER para todos): ").strip()
+                    SolverGrafos.resolver_dijkstra(texto, origen, destino or None)
                 input("\nPresiona ENTER para continuar...")
             
             elif opcion == '4':
@@ -477,6 +949,41 @@ def main():
                     SolverGrafos.resolver_juego_suma_cero(matriz)
                 input("\nPresiona ENTER para continuar...")
             
+            elif opcion == '7':
+                texto = solicitar_aristas()
+                if texto:
+                    origenes = input("\n🎯 Nodos origen (separados por espacios o comas): ")
+                    SolverGrafos.resolver_dijkstra_multiorigen(texto, origenes.replace(',', ' ').split())
+                input("\nPresiona ENTER para continuar...")
+            
+            elif opcion == '8':
+                texto = solicitar_aristas()
+                if texto:
+                    origen = input("\n🎯 Nodo origen: ").strip()
+                    destino = input("🎯 Nodo destino: ").strip()
+                    k = input("🔢 Cantidad de rutas k (ENTER = 5): ").strip()
+                    SolverGrafos.resolver_k_rutas(texto, origen, destino, int(k) if k else 5)
+                input("\nPresiona ENTER para continuar...")
+            
+            elif opcion == '10':
+                ruta = input("\n📂 Ruta del archivo de aristas: ").strip()
+                if ruta:
+                    SolverGrafos.resolver_mst_archivo(ruta)
+                input("\nPresiona ENTER para continuar...")
+            
+            elif opcion == '11':
+                texto = solicitar_aristas()
+                if texto:
+                    dirigido = input("\n➡️  ¿Grafo dirigido? (s/N): ").strip().lower() == 's'
+                    SolverGrafos.resolver_componentes(texto, dirigido)
+                input("\nPresiona ENTER para continuar...")
+            
+            elif opcion == '12':
+                texto = solicitar_puntos()
+                if texto:
+                    SolverGrafos.resolver_mst(texto, puntos=True)
+                input("\nPresiona ENTER para continuar...")
+            
             else:
                 print("\n❌ Opción inválida")
                 input("Presiona ENTER para continuar...")